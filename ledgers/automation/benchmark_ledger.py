@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Echo Universe - Governance Ledger Benchmarks
+============================================
+
+Synthetic benchmarks for the governance ledger. Ledgers are generated in a
+temporary directory, so the real coordination log is never touched.
+
+Usage:
+    python3 ledgers/automation/benchmark_ledger.py verify --entries 1000000
+    python3 ledgers/automation/benchmark_ledger.py append --entries 20000 --batch-size 100
+"""
+
+import os
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+from ledger import ImmutableLedger
+
+
+def build_synthetic_ledger(ledger: ImmutableLedger, entries: int, batch_size: int = 10000):
+    """
+    Extend a ledger with `entries` chained entries written in bulk.
+
+    Entries are hashed and chained exactly as `append` would, but written
+    in large blocks so that building a million-entry ledger stays fast.
+    """
+    previous_hash = ledger.get_last_entry()["entry_hash"]
+
+    with open(ledger.ledger_path, 'a') as f:
+        lines = []
+        for n in range(entries):
+            entry = {
+                "timestamp": "2025-12-31T00:00:00.000000Z",
+                "event_type": "benchmark_event",
+                "data": {"sequence": n, "status": "success"},
+                "previous_hash": previous_hash,
+                "entry_hash": None
+            }
+            entry["entry_hash"] = ledger._compute_entry_hash(entry)
+            previous_hash = entry["entry_hash"]
+            lines.append(json.dumps(entry) + '\n')
+
+            if len(lines) >= batch_size:
+                f.write(''.join(lines))
+                lines = []
+        f.write(''.join(lines))
+
+
+def timed(func, *args, **kwargs):
+    """Run func and return (result, elapsed_seconds)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def benchmark_verify(entries: int, new_entries: int):
+    """Compare full and checkpointed incremental verification."""
+    # Checkpoints are only written with a secret key configured
+    os.environ.setdefault(ImmutableLedger.CHECKPOINT_KEY_ENV, os.urandom(32).hex())
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = ImmutableLedger(str(Path(tmp) / "coordination_log.jsonl"))
+
+        _, build_s = timed(build_synthetic_ledger, ledger, entries)
+        print(f"Built {entries:,} entries in {build_s:.2f}s")
+
+        (is_valid, error), full_s = timed(ledger.verify_integrity, full=True)
+        assert is_valid, error
+        print(f"Full verify:        {full_s:8.3f}s  ({entries / full_s:,.0f} entries/s)")
+
+        build_synthetic_ledger(ledger, new_entries)
+
+        (is_valid, error), incremental_s = timed(ledger.verify_integrity)
+        assert is_valid, error
+        print(f"Incremental verify: {incremental_s:8.3f}s  ({new_entries:,} new entries)")
+        print(f"Speedup:            {full_s / incremental_s:8.1f}x")
+
+
+def benchmark_append(entries: int, batch_size: int, fsync: bool):
+    """Compare appends/sec for single appends and group-committed batches."""
+    event = {"action": "benchmark", "status": "success"}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = ImmutableLedger(str(Path(tmp) / "single.jsonl"))
+
+        def single():
+            for _ in range(entries):
+                ledger.append_many([("benchmark_event", event)], fsync=fsync)
+
+        _, single_s = timed(single)
+        print(f"Single appends:     {entries / single_s:10,.0f} appends/s")
+
+        ledger = ImmutableLedger(str(Path(tmp) / "batched.jsonl"))
+
+        def batched():
+            with ledger.batch(fsync=fsync, max_pending=batch_size) as batch:
+                for _ in range(entries):
+                    batch.append("benchmark_event", event)
+
+        _, batched_s = timed(batched)
+        print(f"Batches of {batch_size:<6}  {entries / batched_s:10,.0f} appends/s")
+        print(f"Speedup:            {single_s / batched_s:10.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark governance ledger operations.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    verify_parser = subparsers.add_parser("verify", help="Full vs. incremental verification")
+    verify_parser.add_argument("--entries", type=int, default=1000000, help="Entries in the synthetic ledger")
+    verify_parser.add_argument("--new-entries", type=int, default=1000, help="Entries appended after the checkpoint")
+
+    append_parser = subparsers.add_parser("append", help="Single vs. batched appends/sec")
+    append_parser.add_argument("--entries", type=int, default=20000, help="Entries to append per mode")
+    append_parser.add_argument("--batch-size", type=int, default=100, help="Entries per group commit")
+    append_parser.add_argument("--fsync", action="store_true", help="fsync every append / group")
+
+    args = parser.parse_args()
+
+    if args.benchmark == "verify":
+        benchmark_verify(args.entries, args.new_entries)
+    elif args.benchmark == "append":
+        benchmark_append(args.entries, args.batch_size, args.fsync)
+
+
+if __name__ == "__main__":
+    main()
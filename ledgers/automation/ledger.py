@@ -16,11 +16,20 @@ Design Principles:
 - Human-readable: JSONL format for transparency and auditability
 """
 
+import os
+import gzip
+import hmac
 import json
+import bisect
+import logging
+import shutil
 import hashlib
 import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+
+logger = logging.getLogger(__name__)
 
 
 class ImmutableLedger:
@@ -33,15 +42,97 @@ class ImmutableLedger:
     - data: Event-specific data
     - previous_hash: SHA-256 hash of previous entry
     - entry_hash: SHA-256 hash of current entry
+    
+    The chain tail (last entry_hash plus its byte offset) is kept in a
+    ``<ledger>.tail`` sidecar and cached in-process, so appends never
+    re-read the ledger. The sidecar is only a hint: it is validated against
+    the ledger file before use and rebuilt from the final line if stale.
+    
+    Verification records a signed checkpoint (entry index, byte offset,
+    entry_hash) in a ``<ledger>.checkpoint`` sidecar, so routine verifies
+    only rehash entries appended since the last trusted checkpoint.
+    Checkpoints need a secret key in LEDGER_CHECKPOINT_KEY; without one,
+    every verify rehashes the whole chain.
+    
+    A ``<ledger>.index`` journal maps every entry to its byte offset and
+    event_type, with a timestamp sampled every TIME_INDEX_STRIDE bytes, so
+    type and time-window queries seek straight to matching lines. The
+    journal is extended on append and rebuilt if found stale or missing.
+    
+    Storage is segmented. The ledger path is the active segment; once it
+    reaches SEGMENT_MAX_BYTES (or SEGMENT_MAX_ENTRIES) it is sealed into
+    ``<ledger>.segments/segment-NNNNNN.jsonl`` with a footer line carrying
+    its first and last hash, entry count and Merkle root. A manifest chains
+    the sealed segments together, and segments older than HOT_SEGMENTS are
+    gzip-compressed. Byte offsets exposed to callers (export --since) are
+    global across segments.
     """
     
-    def __init__(self, ledger_path: str = "ledgers/automation/coordination_log.jsonl"):
+    # Environment variable holding the HMAC key for verification checkpoints
+    CHECKPOINT_KEY_ENV = "LEDGER_CHECKPOINT_KEY"
+    
+    # Block size used when seeking backwards for the final line
+    TAIL_READ_BLOCK = 4096
+    
+    # One timestamp is sampled into the index journal per this many ledger bytes
+    TIME_INDEX_STRIDE = 64 * 1024
+    
+    # Active segment rotation limits (entry limit disabled by default)
+    SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+    SEGMENT_MAX_ENTRIES: Optional[int] = None
+    
+    # Most recent sealed segments kept uncompressed
+    HOT_SEGMENTS = 2
+    
+    # Fields of a sealed segment footer (and of its manifest record)
+    FOOTER_FIELDS = (
+        "segment", "first_index", "entries", "base_offset", "data_size",
+        "first_hash", "last_hash", "previous_hash", "first_timestamp",
+        "last_timestamp", "event_types", "merkle_root", "previous_footer_hash"
+    )
+    
+    def __init__(
+        self,
+        ledger_path: str = "ledgers/automation/coordination_log.jsonl",
+        segment_max_bytes: Optional[int] = None,
+        segment_max_entries: Optional[int] = None,
+        hot_segments: Optional[int] = None
+    ):
         self.ledger_path = Path(ledger_path)
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        self.tail_path = self.ledger_path.with_name(self.ledger_path.name + ".tail")
+        self.checkpoint_path = self.ledger_path.with_name(self.ledger_path.name + ".checkpoint")
+        self.index_path = self.ledger_path.with_name(self.ledger_path.name + ".index")
+        self.segments_dir = self.ledger_path.with_name(self.ledger_path.name + ".segments")
+        self.manifest_path = self.segments_dir / "manifest.json"
+        
+        # Rotation policy
+        self.segment_max_bytes = segment_max_bytes or self.SEGMENT_MAX_BYTES
+        self.segment_max_entries = segment_max_entries or self.SEGMENT_MAX_ENTRIES
+        self.hot_segments = self.HOT_SEGMENTS if hot_segments is None else hot_segments
+        
+        # Cached tail: {"entry_hash", "offset", "size", "entries"}
+        self._tail: Optional[Dict[str, Any]] = None
+        
+        # Secondary index, loaded lazily on first query
+        self._index: Optional[Dict[str, Any]] = None
+        
+        # Sealed segments: {"segments": [footer + file, footer_hash]}
+        self._manifest = self._load_manifest()
+        
+        # Why the active segment could not be sealed; rotation is paused
+        self.seal_error: Optional[str] = None
         
         # Initialize ledger if it doesn't exist
         if not self.ledger_path.exists():
-            self._initialize_ledger()
+            if self._manifest["segments"]:
+                self.ledger_path.touch()
+                self._tail = self._load_tail_pointer()
+            else:
+                self._initialize_ledger()
+        else:
+            self._recover_rotation()
+            self._tail = self._load_tail_pointer()
     
     def _initialize_ledger(self):
         """Create genesis entry for new ledger."""
@@ -61,10 +152,14 @@ class ImmutableLedger:
         genesis_entry["entry_hash"] = self._compute_entry_hash(genesis_entry)
         
         # Write genesis entry
-        with open(self.ledger_path, 'w') as f:
-            f.write(json.dumps(genesis_entry) + '\n')
+        line = (json.dumps(genesis_entry) + '\n').encode('utf-8')
+        with open(self.ledger_path, 'wb') as f:
+            f.write(line)
+        
+        self._set_tail(genesis_entry["entry_hash"], 0, len(line), 1)
     
-    def _compute_entry_hash(self, entry: Dict[str, Any]) -> str:
+    @staticmethod
+    def _compute_entry_hash(entry: Dict[str, Any]) -> str:
         """
         Compute SHA-256 hash of entry.
         
@@ -84,16 +179,131 @@ class ImmutableLedger:
         # Compute SHA-256 hash
         return hashlib.sha256(canonical_json.encode('utf-8')).hexdigest()
     
+    def _read_last_line(self, path: Optional[Path] = None) -> Optional[tuple[int, bytes]]:
+        """
+        Read the final line of a file by seeking backwards from EOF.
+        
+        Args:
+            path: File to read (defaults to the ledger itself)
+        
+        Returns:
+            (offset, line) for the last non-empty line, or None if the
+            file holds no lines. Only the trailing blocks are read.
+        """
+        with open(path or self.ledger_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            buf = b""
+            
+            while pos > 0:
+                step = min(self.TAIL_READ_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+                
+                body = buf.rstrip(b"\r\n")
+                newline = body.rfind(b"\n")
+                if newline != -1:
+                    return pos + newline + 1, body[newline + 1:]
+            
+            body = buf.rstrip(b"\r\n")
+            return (0, body) if body else None
+    
+    def _set_tail(self, entry_hash: str, offset: int, size: int, entries: Optional[int]):
+        """Cache the chain tail and persist it to the sidecar atomically."""
+        self._tail = {"entry_hash": entry_hash, "offset": offset, "size": size, "entries": entries}
+        
+        temp_path = self.tail_path.with_name(self.tail_path.name + ".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(self._tail, f)
+        os.replace(temp_path, self.tail_path)
+    
+    def _load_tail_pointer(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the tail sidecar and validate it against the ledger file.
+        
+        The sidecar is trusted only if the ledger size matches and the line
+        at the recorded offset carries the recorded entry_hash. Otherwise the
+        tail is recovered by reverse-seeking to the final line. An empty
+        active segment chains from the last sealed segment.
+        """
+        size = self.ledger_path.stat().st_size
+        if size == 0:
+            return self._sealed_tail()
+        
+        try:
+            with open(self.tail_path, 'r') as f:
+                tail = json.load(f)
+            
+            # A sidecar written without an entry count is no use once count-based rotation is on
+            if tail["size"] == size and (tail["entries"] is not None or self.segment_max_entries is None):
+                with open(self.ledger_path, 'rb') as f:
+                    f.seek(tail["offset"])
+                    entry = json.loads(f.read(size - tail["offset"]))
+                if entry["entry_hash"] == tail["entry_hash"]:
+                    return tail
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        return self._scan_tail()
+    
+    def _scan_tail(self) -> Optional[Dict[str, Any]]:
+        """Recover the tail from the final line and refresh the sidecar."""
+        last_line = self._read_last_line()
+        if last_line is None:
+            return self._sealed_tail()
+        
+        # Entry count is only needed for count-based rotation; without it,
+        # skip reading the whole active segment and leave the count unknown
+        entries = None
+        if self.segment_max_entries is not None:
+            entries = 0
+            with open(self.ledger_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    entries += block.count(b"\n")
+        
+        offset, line = last_line
+        entry = json.loads(line)
+        self._set_tail(entry["entry_hash"], offset, self.ledger_path.stat().st_size, entries)
+        return self._tail
+    
+    def _sealed_tail(self) -> Optional[Dict[str, Any]]:
+        """Tail of an empty active segment: the last sealed entry, if any."""
+        if not self._manifest["segments"]:
+            return None
+        return {"entry_hash": self._manifest["segments"][-1]["last_hash"], "offset": 0, "size": 0, "entries": 0}
+    
+    def _get_tail(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the current chain tail in O(1).
+        
+        The cached tail is reused while the ledger size is unchanged; if
+        another writer has appended in the meantime, it is re-validated.
+        """
+        if not self.ledger_path.exists():
+            return None
+        
+        if self._tail is not None and self._tail["size"] == self.ledger_path.stat().st_size:
+            return self._tail
+        
+        self._tail = self._load_tail_pointer()
+        return self._tail
+    
     def get_last_entry(self) -> Optional[Dict[str, Any]]:
         """Get the most recent entry from the ledger."""
         if not self.ledger_path.exists():
             return None
         
-        with open(self.ledger_path, 'r') as f:
-            lines = f.readlines()
-            if not lines:
-                return None
-            return json.loads(lines[-1])
+        last_line = self._read_last_line()
+        if last_line is not None:
+            return json.loads(last_line[1])
+        
+        # Active segment was just rotated; fall back to the last sealed one
+        last_entry = None
+        if self._manifest["segments"]:
+            for last_entry in self._iter_entries_from(self._segment_path(self._manifest["segments"][-1]), 0):
+                pass
+        return last_entry
     
     def append(self, event_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -109,32 +319,491 @@ class ImmutableLedger:
         Raises:
             ValueError: If chain integrity is broken
         """
-        # Get previous entry to chain from
-        last_entry = self.get_last_entry()
-        if last_entry is None:
+        return self.append_many([(event_type, data)])[0]
+    
+    def append_many(
+        self,
+        events: Iterable[tuple[str, Dict[str, Any]]],
+        fsync: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Append a group of entries with a single buffered write.
+        
+        Hashes are chained in memory from the current tail, then all lines
+        are written at once, with one tail, index and (optional) fsync update
+        for the whole group.
+        
+        Args:
+            events: (event_type, data) pairs, in append order
+            fsync: Force the group to stable storage before returning
+            
+        Returns:
+            The newly created entries
+            
+        Raises:
+            ValueError: If chain integrity is broken
+        """
+        # Get previous hash to chain from
+        tail = self._get_tail()
+        if tail is None:
             raise ValueError("Ledger not initialized. Genesis entry missing.")
         
-        # Create new entry
+        entries = []
+        previous_hash = tail["entry_hash"]
+        for event_type, data in events:
+            entries.append(self._new_entry(event_type, data, previous_hash))
+            previous_hash = entries[-1]["entry_hash"]
+        
+        self._write_entries(entries, fsync)
+        return entries
+    
+    def batch(self, fsync: bool = False, max_pending: Optional[int] = None) -> 'LedgerBatch':
+        """
+        Open a context-managed batch writer (group commit).
+        
+        Args:
+            fsync: fsync once per flushed group
+            max_pending: Flush automatically once this many entries are buffered
+        """
+        return LedgerBatch(self, fsync=fsync, max_pending=max_pending)
+    
+    def _new_entry(self, event_type: str, data: Dict[str, Any], previous_hash: str) -> Dict[str, Any]:
+        """Create and hash an entry chained onto previous_hash."""
         new_entry = {
             "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
             "event_type": event_type,
             "data": data,
-            "previous_hash": last_entry["entry_hash"],
+            "previous_hash": previous_hash,
             "entry_hash": None  # Will be computed
         }
         
         # Compute hash for new entry
         new_entry["entry_hash"] = self._compute_entry_hash(new_entry)
+        return new_entry
+    
+    def _write_entries(self, entries: List[Dict[str, Any]], fsync: bool = False):
+        """
+        Write already-chained entries to the active segment in one write.
+        
+        Raises:
+            ValueError: If the ledger tail moved since the entries were chained
+        """
+        if not entries:
+            return
+        
+        # Rotation runs before the write, so a group that fills the active
+        # segment is reported as written without waiting for the seal
+        self._rotate_if_needed()
+        
+        tail = self._get_tail()
+        if tail is None or entries[0]["previous_hash"] != tail["entry_hash"]:
+            raise ValueError("Ledger tail changed while entries were pending; chain would break")
+        
+        lines = [(json.dumps(entry) + '\n').encode('utf-8') for entry in entries]
         
         # Append to ledger file
-        with open(self.ledger_path, 'a') as f:
-            f.write(json.dumps(new_entry) + '\n')
+        with open(self.ledger_path, 'ab') as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(b"".join(lines))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
         
-        return new_entry
+        placed = []
+        for entry, line in zip(entries, lines):
+            placed.append((offset, offset + len(line), entry))
+            offset += len(line)
+        
+        count = None if tail["entries"] is None else tail["entries"] + len(entries)
+        self._set_tail(entries[-1]["entry_hash"], placed[-1][0], offset, count)
+        self._index_appended(placed)
+    
+    def _rotate_if_needed(self):
+        """
+        Seal the active segment if it has reached its limit.
+        
+        A segment that fails to seal (e.g. it was tampered with) is left in
+        place and appends continue on it; the reason is kept in seal_error
+        and rotation is not retried by this instance. verify_integrity
+        reports the underlying damage.
+        """
+        self._get_tail()
+        if self.seal_error is not None or not self._should_rotate():
+            return
+        try:
+            self._seal_active_segment()
+        except ValueError as e:
+            self.seal_error = str(e)
+            logger.warning("Segment rotation paused: %s", e)
+    
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load the sealed segment manifest (empty if never rotated)."""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"segments": []}
+    
+    def _write_manifest(self):
+        """Persist the manifest atomically."""
+        temp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(self._manifest, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.manifest_path)
+    
+    def _segment_path(self, record: Dict[str, Any]) -> Path:
+        return self.segments_dir / record["file"]
+    
+    @staticmethod
+    def _open_segment(path) -> Any:
+        """Open a segment for binary reading, transparently decompressing."""
+        return gzip.open(path, 'rb') if str(path).endswith(".gz") else open(path, 'rb')
+    
+    def _active_base(self) -> tuple[int, int, Optional[str]]:
+        """(first entry index, global byte offset, previous hash) of the active segment."""
+        if not self._manifest["segments"]:
+            return 0, 0, None
+        last = self._manifest["segments"][-1]
+        return last["first_index"] + last["entries"], last["base_offset"] + last["data_size"], last["last_hash"]
+    
+    def _recover_rotation(self):
+        """
+        Finish a rotation interrupted after the manifest was written.
+        
+        If the active segment still holds the entries of the last sealed
+        segment, it is truncated so that they are not counted twice.
+        """
+        if not self._manifest["segments"] or self.ledger_path.stat().st_size == 0:
+            return
+        
+        with open(self.ledger_path, 'rb') as f:
+            first_line = f.readline()
+        try:
+            first_hash = json.loads(first_line)["entry_hash"]
+        except (ValueError, KeyError, TypeError):
+            return
+        
+        if first_hash == self._manifest["segments"][-1]["first_hash"]:
+            open(self.ledger_path, 'wb').close()
+            self._index = None
+    
+    def _should_rotate(self) -> bool:
+        """Whether the active segment has reached its size or entry limit."""
+        tail = self._tail
+        return tail is not None and (
+            tail["size"] >= self.segment_max_bytes
+            or (self.segment_max_entries is not None and tail["entries"] >= self.segment_max_entries)
+        )
+    
+    @staticmethod
+    def _merkle_root(hashes: Iterable[str]) -> Optional[str]:
+        """
+        Merkle root over entry hashes, computed in O(log n) memory.
+        
+        Perfect subtrees are merged on a stack as leaves arrive; the remaining
+        frontier is folded right to left (RFC 6962 tree shape).
+        """
+        stack: List[tuple[int, bytes]] = []
+        for entry_hash in hashes:
+            level, node = 0, bytes.fromhex(entry_hash)
+            while stack and stack[-1][0] == level:
+                node = hashlib.sha256(stack.pop()[1] + node).digest()
+                level += 1
+            stack.append((level, node))
+        
+        if not stack:
+            return None
+        
+        node = stack.pop()[1]
+        while stack:
+            node = hashlib.sha256(stack.pop()[1] + node).digest()
+        return node.hex()
+    
+    @staticmethod
+    def _canonical_hash(obj: Dict[str, Any]) -> str:
+        return hashlib.sha256(json.dumps(obj, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def _summarize_segment(cls, path: str, first_index: int, previous_hash: Optional[str]) -> Dict[str, Any]:
+        """
+        Verify one segment and recompute the fields of its footer.
+        
+        Used both when sealing the active segment and, in worker processes,
+        when verifying sealed segments.
+        """
+        summary = {
+            "entries": 0, "data_size": 0, "first_hash": None, "last_hash": None,
+            "previous_hash": previous_hash, "first_timestamp": None, "last_timestamp": None,
+            "event_types": {}, "merkle_root": None, "footer": None, "error": None
+        }
+        hashes = []
+        
+        with cls._open_segment(path) as f:
+            for index, _, end, entry, error in cls._verify_stream(f, first_index - 1, previous_hash, summary):
+                if error:
+                    summary["error"] = error
+                    return summary
+                if not summary["entries"]:
+                    summary["first_hash"] = entry["entry_hash"]
+                    summary["previous_hash"] = entry["previous_hash"]
+                    summary["first_timestamp"] = entry["timestamp"]
+                summary["entries"] += 1
+                summary["data_size"] = end
+                summary["last_hash"] = entry["entry_hash"]
+                summary["last_timestamp"] = entry["timestamp"]
+                summary["event_types"][entry["event_type"]] = summary["event_types"].get(entry["event_type"], 0) + 1
+                hashes.append(entry["entry_hash"])
+        
+        summary["merkle_root"] = cls._merkle_root(hashes)
+        return summary
+    
+    def _seal_active_segment(self):
+        """
+        Seal the active segment and start a new, empty one.
+        
+        The segment is verified while its footer is computed, written to the
+        segments directory with the footer appended, and recorded in the
+        manifest before the active file is truncated. A crash in between is
+        repaired by _recover_rotation on the next open.
+        
+        Raises:
+            ValueError: If the active segment fails verification
+        """
+        first_index, base_offset, previous_hash = self._active_base()
+        summary = self._summarize_segment(str(self.ledger_path), first_index, previous_hash)
+        if summary["footer"] is not None and not summary["error"]:
+            summary["error"] = "Active segment contains a segment footer (tampering detected)"
+        if summary["error"]:
+            raise ValueError(f"Refusing to seal segment: {summary['error']}")
+        if not summary["entries"]:
+            return
+        
+        segments = self._manifest["segments"]
+        footer = {field: summary.get(field) for field in self.FOOTER_FIELDS}
+        footer.update({
+            "segment": segments[-1]["segment"] + 1 if segments else 1,
+            "first_index": first_index,
+            "base_offset": base_offset,
+            "previous_footer_hash": segments[-1]["footer_hash"] if segments else None
+        })
+        
+        name = f"segment-{footer['segment']:06d}.jsonl"
+        segment_path = self.segments_dir / name
+        temp_path = segment_path.with_name(name + ".tmp")
+        self.segments_dir.mkdir(exist_ok=True)
+        
+        with open(self.ledger_path, 'rb') as src, open(temp_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+            dst.write((json.dumps({"segment_footer": footer}) + '\n').encode('utf-8'))
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(temp_path, segment_path)
+        
+        # The active index journal stays valid for the sealed copy
+        self._load_index()
+        os.replace(self.index_path, segment_path.with_name(name + ".index"))
+        
+        segments.append(dict(footer, file=name, footer_hash=self._canonical_hash(footer)))
+        self._write_manifest()
+        
+        # Start the next active segment
+        open(self.ledger_path, 'wb').close()
+        open(self.index_path, 'w').close()
+        self._index = self._empty_index()
+        self._set_tail(footer["last_hash"], 0, 0, 0)
+        self._write_checkpoint(first_index + footer["entries"] - 1, 0, 0, footer["last_hash"])
+        
+        self._compress_cold_segments()
+    
+    def _compress_cold_segments(self):
+        """Gzip sealed segments older than the most recent hot_segments."""
+        cold = self._manifest["segments"][:max(len(self._manifest["segments"]) - self.hot_segments, 0)]
+        obsolete = []
+        
+        for record in cold:
+            if record["file"].endswith(".gz"):
+                continue
+            path = self._segment_path(record)
+            temp_path = path.with_name(path.name + ".gz.tmp")
+            with open(path, 'rb') as src, gzip.open(temp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(temp_path, path.with_name(path.name + ".gz"))
+            record["file"] = path.name + ".gz"
+            obsolete += [path, path.with_name(path.name + ".index")]
+        
+        if obsolete:
+            self._write_manifest()
+            for path in obsolete:
+                if path.exists():
+                    path.unlink()
+    
+    def _checkpoint_key(self) -> Optional[bytes]:
+        """
+        Key used to sign verification checkpoints, from LEDGER_CHECKPOINT_KEY.
+        
+        Returns None when unset. Anything derived from the ledger itself is
+        readable by whoever can edit it, so without a secret key no
+        checkpoint is written or trusted.
+        """
+        key = os.environ.get(self.CHECKPOINT_KEY_ENV)
+        return key.encode('utf-8') if key else None
+    
+    def _sign_checkpoint(self, checkpoint: Dict[str, Any], key: bytes) -> str:
+        """HMAC-SHA256 over the canonical checkpoint fields."""
+        payload = json.dumps(
+            {k: checkpoint[k] for k in ("index", "entry_offset", "offset", "entry_hash")},
+            sort_keys=True,
+            separators=(',', ':')
+        )
+        return hmac.new(key, payload.encode('utf-8'), hashlib.sha256).hexdigest()
+    
+    def _write_checkpoint(self, index: int, entry_offset: int, offset: int, entry_hash: str):
+        """Persist a signed checkpoint for the last verified entry (skipped without a key)."""
+        key = self._checkpoint_key()
+        if key is None:
+            return
+        
+        checkpoint = {
+            "index": index,
+            "entry_offset": entry_offset,
+            "offset": offset,
+            "entry_hash": entry_hash
+        }
+        checkpoint["signature"] = self._sign_checkpoint(checkpoint, key)
+        
+        temp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(temp_path, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(temp_path, self.checkpoint_path)
+    
+    def load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the last verification checkpoint if it can still be trusted.
+        
+        A checkpoint is trusted only if its signature is valid and the entry
+        at its recorded offset still hashes to the recorded entry_hash. A
+        checkpoint at offset 0 marks a segment boundary and must match the
+        last sealed segment in the manifest.
+        
+        Returns:
+            The checkpoint dict, or None if missing, unsigned or stale, or
+            if no checkpoint key is configured
+        """
+        key = self._checkpoint_key()
+        if key is None:
+            return None
+        
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                checkpoint = json.load(f)
+            
+            if not hmac.compare_digest(checkpoint["signature"], self._sign_checkpoint(checkpoint, key)):
+                return None
+            
+            if checkpoint["offset"] == 0:
+                first_index, _, previous_hash = self._active_base()
+                if previous_hash != checkpoint["entry_hash"] or first_index - 1 != checkpoint["index"]:
+                    return None
+                return checkpoint
+            
+            with open(self.ledger_path, 'rb') as f:
+                f.seek(checkpoint["entry_offset"])
+                line = f.readline()
+            
+            entry = json.loads(line)
+            if (checkpoint["entry_offset"] + len(line) != checkpoint["offset"]
+                    or entry["entry_hash"] != checkpoint["entry_hash"]
+                    or self._compute_entry_hash(entry) != checkpoint["entry_hash"]):
+                return None
+            
+            return checkpoint
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    @classmethod
+    def _verify_stream(
+        cls,
+        f,
+        index: int,
+        previous_hash: Optional[str],
+        footer_sink: Optional[Dict[str, Any]] = None
+    ) -> Iterator[tuple]:
+        """
+        Verify entries line by line from the current position of `f`.
+        
+        Args:
+            f: Ledger file opened in binary mode, positioned at an entry
+            index: Index of the entry preceding the current position (-1 at start)
+            previous_hash: entry_hash of that preceding entry
+            footer_sink: Given for sealed segments only; their footer, which
+                must be the final line, is stored under "footer"
+        
+        Yields:
+            (index, offset, end, entry, error) per entry, where entry is None
+            if the line is not valid JSON or is a misplaced footer, and error
+            is None if intact
+        """
+        offset = f.tell()
+        footer_seen = False
+        
+        for line in f:
+            line_offset = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+            
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                index += 1
+                yield index, line_offset, offset, None, f"Entry {index} is not valid JSON"
+                continue
+            
+            if footer_seen:
+                # Nothing may follow a sealed segment's footer
+                index += 1
+                yield index, line_offset, offset, None, f"Entry {index} follows the segment footer (tampering detected)"
+                continue
+            
+            if "segment_footer" in entry:
+                if footer_sink is None:
+                    index += 1
+                    yield index, line_offset, offset, None, f"Entry {index} is a misplaced segment footer (tampering detected)"
+                    continue
+                footer_sink["footer"] = entry["segment_footer"]
+                footer_seen = True
+                continue
+            index += 1
+            
+            error = None
+            if index == 0 and entry["previous_hash"] != "0" * 64:
+                # Verify genesis entry
+                error = "Genesis entry has invalid previous_hash"
+            elif cls._compute_entry_hash(entry) != entry["entry_hash"]:
+                # Recompute hash and verify it matches
+                error = f"Entry {index} has invalid hash (tampering detected)"
+            elif index > 0 and entry["previous_hash"] != previous_hash:
+                # Verify chain linkage (except for genesis)
+                error = f"Entry {index} has broken chain linkage"
+            
+            previous_hash = entry["entry_hash"]
+            yield index, line_offset, offset, entry, error
     
-    def verify_integrity(self) -> tuple[bool, Optional[str]]:
+    def verify_integrity(self, full: bool = False, workers: Optional[int] = None) -> tuple[bool, Optional[str]]:
         """
-        Verify the cryptographic integrity of the entire ledger.
+        Verify the cryptographic integrity of the ledger.
+        
+        Entries are streamed line by line, so memory use is constant. By
+        default verification resumes from the last trusted checkpoint and
+        only rehashes entries appended since; on success the checkpoint is
+        advanced to the new tail. Without a checkpoint, sealed segments are
+        verified in parallel worker processes before the active segment.
+        
+        Args:
+            full: Ignore any checkpoint and rehash the entire chain (audits)
+            workers: Processes used for sealed segments (default: CPU count)
         
         Returns:
             (is_valid, error_message)
@@ -144,73 +813,547 @@ class ImmutableLedger:
         if not self.ledger_path.exists():
             return False, "Ledger file does not exist"
         
-        with open(self.ledger_path, 'r') as f:
-            entries = [json.loads(line) for line in f]
+        checkpoint = None if full else self.load_checkpoint()
         
-        if not entries:
-            return False, "Ledger is empty"
+        if checkpoint is not None:
+            index = checkpoint["index"]
+            entry_offset = checkpoint["entry_offset"]
+            entry_end = checkpoint["offset"]
+            previous_hash = checkpoint["entry_hash"]
+        else:
+            error = self._verify_segments(workers)
+            if error:
+                return False, error
+            first_index, _, previous_hash = self._active_base()
+            index = first_index - 1
+            entry_offset = entry_end = 0
         
-        # Verify genesis entry
-        genesis = entries[0]
-        if genesis["previous_hash"] != "0" * 64:
-            return False, "Genesis entry has invalid previous_hash"
-        
-        # Verify each entry's hash and chain linkage
-        for i, entry in enumerate(entries):
-            # Recompute hash and verify it matches
-            computed_hash = self._compute_entry_hash(entry)
-            if computed_hash != entry["entry_hash"]:
-                return False, f"Entry {i} has invalid hash (tampering detected)"
+        with open(self.ledger_path, 'rb') as f:
+            f.seek(entry_end)
             
-            # Verify chain linkage (except for genesis)
-            if i > 0:
-                if entry["previous_hash"] != entries[i-1]["entry_hash"]:
-                    return False, f"Entry {i} has broken chain linkage"
+            for index, entry_offset, entry_end, entry, error in self._verify_stream(f, index, previous_hash):
+                if error:
+                    return False, error
+                previous_hash = entry["entry_hash"]
+        
+        if index < 0:
+            return False, "Ledger is empty"
+        
+        if checkpoint is None or index > checkpoint["index"]:
+            self._write_checkpoint(index, entry_offset, entry_end, previous_hash)
         
         return True, None
     
+    def _verify_segments(self, workers: Optional[int] = None) -> Optional[str]:
+        """
+        Verify every sealed segment against the manifest.
+        
+        The manifest chain is checked first; segment contents are then
+        rehashed, one segment per worker process.
+        
+        Returns:
+            Description of the first violation, or None if all segments are intact
+        """
+        segments = self._manifest["segments"]
+        previous = None
+        
+        for record in segments:
+            footer = {field: record[field] for field in self.FOOTER_FIELDS}
+            if self._canonical_hash(footer) != record["footer_hash"]:
+                return f"Segment {record['segment']} manifest record has been altered"
+            if previous is None:
+                contiguous = record["first_index"] == 0 and record["base_offset"] == 0
+            else:
+                contiguous = (
+                    record["previous_footer_hash"] == previous["footer_hash"]
+                    and record["previous_hash"] == previous["last_hash"]
+                    and record["first_index"] == previous["first_index"] + previous["entries"]
+                    and record["base_offset"] == previous["base_offset"] + previous["data_size"]
+                )
+            if not contiguous:
+                return f"Segment {record['segment']} is not chained to the previous segment"
+            previous = record
+        
+        jobs = [(str(self._segment_path(r)), r["first_index"], r["previous_hash"]) for r in segments]
+        workers = min(workers or os.cpu_count() or 1, len(jobs))
+        
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                summaries = list(pool.map(_summarize_segment_job, jobs))
+        else:
+            summaries = [self._summarize_segment(*job) for job in jobs]
+        
+        for record, summary in zip(segments, summaries):
+            if summary["error"]:
+                return summary["error"]
+            footer = {field: record[field] for field in self.FOOTER_FIELDS}
+            if summary["footer"] != footer or any(
+                summary[field] != record[field]
+                for field in ("entries", "data_size", "first_hash", "last_hash", "merkle_root", "event_types")
+            ):
+                return f"Segment {record['segment']} does not match its footer (tampering detected)"
+        
+        return None
+    
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Stream every entry, across sealed segments and the active one."""
+        for record in self._manifest["segments"]:
+            yield from self._iter_entries_from(self._segment_path(record), 0)
+        
+        if self.ledger_path.exists():
+            yield from self._iter_entries_from(self.ledger_path, 0)
+    
     def get_all_entries(self) -> List[Dict[str, Any]]:
         """Get all entries from the ledger."""
-        if not self.ledger_path.exists():
-            return []
+        return list(self.iter_entries())
+    
+    def _index_record(self, offset: int, end: int, entry: Dict[str, Any]) -> list:
+        """
+        Journal record for one entry: [offset, end, event_type(, timestamp)].
+        
+        The timestamp is included for entries that cross a TIME_INDEX_STRIDE
+        byte boundary, which yields the sparse timestamp -> offset index.
+        """
+        record = [offset, end, entry["event_type"]]
+        if end // self.TIME_INDEX_STRIDE > offset // self.TIME_INDEX_STRIDE:
+            record.append(entry["timestamp"])
+        return record
+    
+    @staticmethod
+    def _empty_index() -> Dict[str, Any]:
+        return {"types": {}, "times": [], "last": None, "end": 0}
+    
+    @staticmethod
+    def _apply_index_record(index: Dict[str, Any], record: list):
+        """Fold one journal record into the in-memory index."""
+        offset, end, event_type = record[:3]
+        index["types"].setdefault(event_type, []).append(offset)
+        if len(record) > 3:
+            index["times"].append((record[3], offset))
+        index["last"] = offset
+        index["end"] = end
+    
+    def _index_appended(self, placed: List[tuple[int, int, Dict[str, Any]]]):
+        """
+        Extend the index journal after an append, if it is in sync.
+        
+        Args:
+            placed: (offset, end, entry) for each newly written entry
+        
+        The journal is only extended when it already covers the ledger up to
+        the first new offset; otherwise it is left stale and caught up on the
+        next query.
+        """
+        offset = placed[0][0]
+        if self._index is not None:
+            in_sync = self._index["end"] == offset
+        elif self.index_path.exists():
+            last_line = self._read_last_line(self.index_path)
+            in_sync = last_line is not None and json.loads(last_line[1])[1] == offset
+        else:
+            in_sync = False
+        
+        if not in_sync:
+            return
+        
+        records = [self._index_record(offset, end, entry) for offset, end, entry in placed]
+        with open(self.index_path, 'a') as f:
+            f.write("".join(json.dumps(record) + '\n' for record in records))
+        
+        if self._index is not None:
+            for record in records:
+                self._apply_index_record(self._index, record)
+    
+    def _load_index(self) -> Dict[str, Any]:
+        """
+        Load the secondary index, repairing it against the ledger.
+        
+        A journal whose last record no longer matches the ledger is rebuilt
+        from scratch; one that is merely behind is caught up by scanning only
+        the unindexed tail of the ledger.
+        """
+        size = self.ledger_path.stat().st_size
+        
+        if self._index is not None and self._index["end"] == size:
+            return self._index
+        
+        index = self._empty_index()
+        
+        try:
+            with open(self.index_path, 'r') as f:
+                for line in f:
+                    self._apply_index_record(index, json.loads(line))
+            
+            if index["last"] is not None:
+                with open(self.ledger_path, 'rb') as f:
+                    f.seek(index["last"])
+                    line = f.readline()
+                if index["end"] > size or index["last"] + len(line) != index["end"]:
+                    raise ValueError("Index journal does not match ledger")
+                json.loads(line)
+        except (OSError, ValueError, IndexError, TypeError):
+            index = self._empty_index()
+            open(self.index_path, 'w').close()
+        
+        # Catch up on entries appended since the journal was last written
+        if index["end"] < size:
+            with open(self.ledger_path, 'rb') as ledger_file, open(self.index_path, 'a') as index_file:
+                offset = index["end"]
+                ledger_file.seek(offset)
+                for line in ledger_file:
+                    end = offset + len(line)
+                    if line.strip():
+                        record = self._index_record(offset, end, json.loads(line))
+                        index_file.write(json.dumps(record) + '\n')
+                        self._apply_index_record(index, record)
+                    offset = end
+        
+        self._index = index
+        return index
+    
+    def _read_index_journal(self, path: Path) -> Dict[str, Any]:
+        """Load a sealed segment's index journal (no repair needed)."""
+        index = self._empty_index()
+        with open(path, 'r') as f:
+            for line in f:
+                self._apply_index_record(index, json.loads(line))
+        return index
+    
+    @staticmethod
+    def _read_entries_at(path: Path, offsets: List[int]) -> Iterator[Dict[str, Any]]:
+        """Stream entries by seeking directly to their byte offsets."""
+        with open(path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                yield json.loads(f.readline())
+    
+    @staticmethod
+    def _is_after(timestamp: str, until: str) -> bool:
+        """Whether timestamp is past `until`, treating until as an inclusive prefix."""
+        return timestamp > until and not timestamp.startswith(until)
+    
+    def query(
+        self,
+        event_type: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entries matching an event type and/or time window.
+        
+        Timestamps are compared as ISO 8601 UTC strings, so prefixes such as
+        "2025-12-31" are accepted. Entries are assumed to be appended in
+        timestamp order.
+        
+        Args:
+            event_type: Only yield entries of this type
+            since: Only yield entries with timestamp >= since
+            until: Only yield entries with timestamp <= until
+        """
+        for record in self._manifest["segments"]:
+            # Skip sealed segments using the time range and types in the manifest
+            if since is not None and record["last_timestamp"] < since:
+                continue
+            if until is not None and self._is_after(record["first_timestamp"], until):
+                return
+            if event_type is not None and event_type not in record["event_types"]:
+                continue
+            
+            path = self._segment_path(record)
+            index_path = path.with_name(path.name + ".index")
+            index = None
+            if not record["file"].endswith(".gz") and index_path.exists():
+                index = self._read_index_journal(index_path)
+            yield from self._query_file(path, index, event_type, since, until)
         
-        with open(self.ledger_path, 'r') as f:
-            return [json.loads(line) for line in f]
+        yield from self._query_file(self.ledger_path, self._load_index(), event_type, since, until)
+    
+    def _query_file(
+        self,
+        path: Path,
+        index: Optional[Dict[str, Any]],
+        event_type: Optional[str],
+        since: Optional[str],
+        until: Optional[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream matching entries of one segment, seeking via its index if available."""
+        # Start from the last sampled entry strictly before `since`
+        start = 0
+        if index is not None and since is not None:
+            position = bisect.bisect_left(index["times"], (since,))
+            if position > 0:
+                start = index["times"][position - 1][1]
+        
+        if index is not None and event_type is not None:
+            offsets = index["types"].get(event_type, [])
+            entries = self._read_entries_at(path, offsets[bisect.bisect_left(offsets, start):])
+        else:
+            entries = self._iter_entries_from(path, start)
+        
+        for entry in entries:
+            timestamp = entry["timestamp"]
+            if event_type is not None and entry["event_type"] != event_type:
+                continue
+            if since is not None and timestamp < since:
+                continue
+            if until is not None and self._is_after(timestamp, until):
+                break
+            yield entry
+    
+    def _iter_entries_from(self, path: Path, offset: int) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entries of one segment from a byte offset, skipping its footer.
+        
+        Raises:
+            ValueError: If a footer appears anywhere but the final line of a
+                        sealed segment
+        """
+        sealed = Path(path) != self.ledger_path
+        footer_seen = False
+        with self._open_segment(path) as f:
+            f.seek(offset)
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    if footer_seen or ("segment_footer" in entry and not sealed):
+                        raise ValueError(f"Misplaced segment footer in {path} (tampering detected)")
+                    if "segment_footer" in entry:
+                        footer_seen = True
+                    else:
+                        yield entry
     
     def get_entries_by_type(self, event_type: str) -> List[Dict[str, Any]]:
         """Get all entries of a specific event type."""
-        return [e for e in self.get_all_entries() if e["event_type"] == event_type]
+        return list(self.query(event_type=event_type))
     
-    def export_audit_report(self, output_path: str):
+    def _locate(self, offset: int) -> tuple[int, Optional[Dict[str, Any]]]:
         """
-        Export a human-readable audit report.
+        Resolve a byte offset to (entry index, preceding entry) via the index.
+        
+        Raises:
+            ValueError: If offset does not fall on an entry boundary
+        """
+        index = self._load_index()
+        
+        position = 0
+        previous_offset = None
+        found = offset == index["end"]
+        for offsets in index["types"].values():
+            i = bisect.bisect_left(offsets, offset)
+            position += i
+            found = found or (i < len(offsets) and offsets[i] == offset)
+            if i and (previous_offset is None or offsets[i - 1] > previous_offset):
+                previous_offset = offsets[i - 1]
+        
+        if not found:
+            raise ValueError(f"Offset {offset} is not an entry boundary")
+        
+        if previous_offset is None:
+            return position, None
+        return position, next(self._read_entries_at(self.ledger_path, [previous_offset]))
+    
+    def _segment_sources(self) -> List[tuple]:
+        """(path, first index, global base offset, data size, previous hash) per segment."""
+        sources = [
+            (self._segment_path(r), r["first_index"], r["base_offset"], r["data_size"], r["previous_hash"])
+            for r in self._manifest["segments"]
+        ]
+        first_index, base_offset, previous_hash = self._active_base()
+        sources.append((self.ledger_path, first_index, base_offset, self.ledger_path.stat().st_size, previous_hash))
+        return sources
+    
+    def _resume_point(self, source: tuple, local: int) -> tuple[int, Optional[str]]:
+        """
+        Entry index preceding a local offset of a segment, and its hash.
+        
+        The active segment is resolved via its index; sealed segments are
+        bounded in size and are scanned up to the offset.
+        
+        Raises:
+            ValueError: If offset does not fall on an entry boundary
+        """
+        path, first_index, _, _, previous_hash = source
+        
+        if path == self.ledger_path:
+            position, previous = self._locate(local)
+            return first_index + position - 1, previous["entry_hash"] if previous else previous_hash
+        
+        index = first_index - 1
+        with self._open_segment(path) as f:
+            offset = 0
+            for line in f:
+                if offset == local:
+                    return index, previous_hash
+                if offset > local:
+                    break
+                offset += len(line)
+                if line.strip():
+                    index += 1
+                    previous_hash = json.loads(line)["entry_hash"]
+        raise ValueError(f"Offset {local} is not an entry boundary")
+    
+    def export_audit_report(self, output_path: str, since: int = 0, compress: bool = False) -> Dict[str, Any]:
+        """
+        Export a human-readable audit report in a single streaming pass.
+        
+        Each entry is verified and written as it is read, so memory use is
+        constant. Totals and chain integrity are only known at the end of the
+        pass and are therefore written as a report footer.
         
         Args:
             output_path: Path to write the audit report
+            since: Global byte offset to start from (the "Next Offset" of a
+                   previous report), so scheduled reports only cover new entries
+            compress: Write the report gzip-compressed
+        
+        Returns:
+            Summary with entries written, integrity status and next offset
         """
-        entries = self.get_all_entries()
-        is_valid, error = self.verify_integrity()
+        sources = self._segment_sources()
+        
+        # Skip whole segments that end before `since`
+        while len(sources) > 1 and sources[0][2] + sources[0][3] <= since:
+            sources.pop(0)
+        
+        local = since - sources[0][2]
+        if local:
+            index, previous_hash = self._resume_point(sources[0], local)
+        else:
+            index, previous_hash = sources[0][1] - 1, sources[0][4]
         
-        with open(output_path, 'w') as f:
+        entries = 0
+        first_error = None
+        next_offset = since
+        opener = gzip.open if compress else open
+        
+        with opener(output_path, 'wt') as f:
             f.write("ECHO UNIVERSE - GOVERNANCE LEDGER AUDIT REPORT\n")
             f.write("=" * 80 + "\n\n")
             f.write(f"Generated: {datetime.datetime.utcnow().isoformat()}Z\n")
-            f.write(f"Total Entries: {len(entries)}\n")
-            f.write(f"Chain Integrity: {'VALID' if is_valid else 'BROKEN'}\n")
+            if since:
+                f.write(f"Starting Offset: {since} (Entry #{index + 1})\n")
+            f.write("\n" + "=" * 80 + "\n\n")
             
-            if not is_valid:
-                f.write(f"Integrity Error: {error}\n")
+            for path, _, base_offset, _, _ in sources:
+                with self._open_segment(path) as ledger_file:
+                    ledger_file.seek(local)
+                    footer_sink = {} if Path(path) != self.ledger_path else None
+                    for index, _, end, entry, error in self._verify_stream(ledger_file, index, previous_hash, footer_sink):
+                        entries += 1
+                        first_error = first_error or error
+                        next_offset = base_offset + end
+                        
+                        f.write(f"Entry #{index}\n")
+                        if entry is None:
+                            f.write(f"Integrity Error: {error}\n")
+                        else:
+                            previous_hash = entry["entry_hash"]
+                            f.write(f"Timestamp: {entry['timestamp']}\n")
+                            f.write(f"Event Type: {entry['event_type']}\n")
+                            f.write(f"Previous Hash: {entry['previous_hash'][:16]}...\n")
+                            f.write(f"Entry Hash: {entry['entry_hash'][:16]}...\n")
+                            f.write(f"Data: {json.dumps(entry['data'], indent=2)}\n")
+                        f.write("\n" + "-" * 80 + "\n\n")
+                local = 0
             
-            f.write("\n" + "=" * 80 + "\n\n")
+            if not since and not entries:
+                first_error = "Ledger is empty"
             
-            for i, entry in enumerate(entries):
-                f.write(f"Entry #{i}\n")
-                f.write(f"Timestamp: {entry['timestamp']}\n")
-                f.write(f"Event Type: {entry['event_type']}\n")
-                f.write(f"Previous Hash: {entry['previous_hash'][:16]}...\n")
-                f.write(f"Entry Hash: {entry['entry_hash'][:16]}...\n")
-                f.write(f"Data: {json.dumps(entry['data'], indent=2)}\n")
-                f.write("\n" + "-" * 80 + "\n\n")
+            f.write("=" * 80 + "\n\n")
+            f.write(f"Total Entries: {entries}\n")
+            f.write(f"Chain Integrity: {'BROKEN' if first_error else 'VALID'}\n")
+            if first_error:
+                f.write(f"Integrity Error: {first_error}\n")
+            f.write(f"Next Offset: {next_offset}\n")
+        
+        return {
+            "entries": entries,
+            "valid": first_error is None,
+            "error": first_error,
+            "next_offset": next_offset
+        }
+
+
+class LedgerBatch:
+    """
+    Group-commit writer for high-frequency governance events.
+    
+    Entries are chained in memory as they are added and written to the
+    ledger as one buffered group on flush (or when the context exits).
+    If the block raises, pending entries are discarded and the ledger is
+    left untouched.
+    
+    Usage:
+        with ledger.batch(fsync=True) as batch:
+            for event in events:
+                batch.append("automation_event", event)
+    """
+    
+    def __init__(self, ledger: ImmutableLedger, fsync: bool = False, max_pending: Optional[int] = None):
+        self.ledger = ledger
+        self.fsync = fsync
+        self.max_pending = max_pending
+        self.pending: List[Dict[str, Any]] = []
+        self.written = 0
+    
+    def append(self, event_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Chain a new entry in memory; it is written on the next flush."""
+        if self.pending:
+            previous_hash = self.pending[-1]["entry_hash"]
+        else:
+            tail = self.ledger._get_tail()
+            if tail is None:
+                raise ValueError("Ledger not initialized. Genesis entry missing.")
+            previous_hash = tail["entry_hash"]
+        
+        entry = self.ledger._new_entry(event_type, data, previous_hash)
+        self.pending.append(entry)
+        
+        if self.max_pending and len(self.pending) >= self.max_pending:
+            self.flush()
+        return entry
+    
+    def flush(self):
+        """Write all pending entries as one group."""
+        entries, self.pending = self.pending, []
+        self.ledger._write_entries(entries, self.fsync)
+        self.written += len(entries)
+    
+    def __enter__(self) -> 'LedgerBatch':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.pending = []
+        return False
+
+
+def _summarize_segment_job(job: tuple) -> Dict[str, Any]:
+    """Process-pool entry point for verifying one sealed segment."""
+    return ImmutableLedger._summarize_segment(*job)
+
+
+def _parse_options(args: List[str], flags: tuple, switches: tuple = ()) -> Dict[str, Any]:
+    """Parse `--flag value` pairs and bare `--switch`es, exiting on bad input."""
+    import sys
+    
+    options = {}
+    it = iter(args)
+    for flag in it:
+        if flag in switches:
+            options[flag[2:]] = True
+            continue
+        if flag not in flags:
+            print(f"Error: unknown option {flag}")
+            sys.exit(1)
+        value = next(it, None)
+        if value is None:
+            print(f"Error: {flag} requires a value")
+            sys.exit(1)
+        options[flag[2:]] = value
+    return options
 
 
 def main():
@@ -221,9 +1364,13 @@ def main():
         print("Usage:")
         print("  ledger.py init                    - Initialize new ledger")
         print("  ledger.py append <type> <data>    - Append entry")
-        print("  ledger.py verify                  - Verify chain integrity")
-        print("  ledger.py export <output>         - Export audit report")
+        print("  ledger.py verify [--full] [--workers N]")
+        print("                                    - Verify chain integrity (incremental unless --full)")
+        print("  ledger.py export <output> [--since OFFSET] [--gzip]")
+        print("                                    - Export audit report")
         print("  ledger.py list                    - List all entries")
+        print("  ledger.py query [--type X] [--since T] [--until T]")
+        print("                                    - Stream matching entries as JSON lines")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -243,7 +1390,11 @@ def main():
         print(f"Entry appended: {entry['entry_hash'][:16]}...")
         
     elif command == "verify":
-        is_valid, error = ledger.verify_integrity()
+        options = _parse_options(sys.argv[2:], ("--workers",), ("--full",))
+        is_valid, error = ledger.verify_integrity(
+            full=options.get("full", False),
+            workers=int(options["workers"]) if "workers" in options else None
+        )
         if is_valid:
             print("✓ Ledger integrity VALID - No tampering detected")
         else:
@@ -255,12 +1406,26 @@ def main():
             print("Error: export requires output path")
             sys.exit(1)
         output_path = sys.argv[2]
-        ledger.export_audit_report(output_path)
+        options = _parse_options(sys.argv[3:], ("--since",), ("--gzip",))
+        summary = ledger.export_audit_report(
+            output_path,
+            since=int(options.get("since", 0)),
+            compress=options.get("gzip", False) or output_path.endswith(".gz")
+        )
         print(f"Audit report exported to: {output_path}")
+        print(f"Next offset: {summary['next_offset']}")
+        
+    elif command == "query":
+        options = _parse_options(sys.argv[2:], ("--type", "--since", "--until"))
+        for entry in ledger.query(
+            event_type=options.get("type"),
+            since=options.get("since"),
+            until=options.get("until")
+        ):
+            print(json.dumps(entry))
         
     elif command == "list":
-        entries = ledger.get_all_entries()
-        for i, entry in enumerate(entries):
+        for i, entry in enumerate(ledger.iter_entries()):
             print(f"{i}: {entry['timestamp']} - {entry['event_type']}")
             
     else:
@@ -0,0 +1,507 @@
+"""
+Test suite for the Echo Universe governance ledger
+"""
+
+import json
+
+import pytest
+from ledger import ImmutableLedger
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    """Fresh ledger in a temporary directory"""
+    return ImmutableLedger(str(tmp_path / "coordination_log.jsonl"))
+
+
+class TestTailPointer:
+    """Test O(1) tail tracking for appends"""
+
+    def test_append_chains_from_cached_tail(self, ledger):
+        """Test appends chain onto the previous entry"""
+        first = ledger.append("test_event", {"n": 1})
+        second = ledger.append("test_event", {"n": 2})
+
+        assert second["previous_hash"] == first["entry_hash"]
+        assert ledger.verify_integrity() == (True, None)
+
+    def test_sidecar_matches_ledger(self, ledger):
+        """Test the tail sidecar records the last hash and offset"""
+        entry = ledger.append("test_event", {"n": 1})
+        tail = json.loads(ledger.tail_path.read_text())
+
+        assert tail["entry_hash"] == entry["entry_hash"]
+        assert tail["size"] == ledger.ledger_path.stat().st_size
+        with open(ledger.ledger_path, "rb") as f:
+            f.seek(tail["offset"])
+            assert json.loads(f.readline())["entry_hash"] == entry["entry_hash"]
+
+    def test_reopen_uses_sidecar(self, ledger):
+        """Test a reopened ledger continues the chain"""
+        entry = ledger.append("test_event", {"n": 1})
+        reopened = ImmutableLedger(str(ledger.ledger_path))
+
+        assert reopened.append("test_event", {"n": 2})["previous_hash"] == entry["entry_hash"]
+        assert reopened.verify_integrity() == (True, None)
+
+    def test_stale_sidecar_is_rebuilt(self, ledger):
+        """Test a stale or missing sidecar falls back to reverse seek"""
+        ledger.append("test_event", {"n": 1})
+        ledger.tail_path.write_text(json.dumps({"entry_hash": "0" * 64, "offset": 0, "size": 1}))
+        reopened = ImmutableLedger(str(ledger.ledger_path))
+        assert reopened.append("test_event", {"n": 2})
+
+        ledger.tail_path.unlink()
+        reopened = ImmutableLedger(str(ledger.ledger_path))
+        assert reopened.append("test_event", {"n": 3})
+        assert reopened.verify_integrity() == (True, None)
+
+    def test_external_append_invalidates_cache(self, ledger):
+        """Test another writer appending is picked up before the next append"""
+        other = ImmutableLedger(str(ledger.ledger_path))
+        ledger.append("test_event", {"n": 1})
+        external = other.append("test_event", {"n": 2})
+
+        assert ledger.append("test_event", {"n": 3})["previous_hash"] == external["entry_hash"]
+        assert ledger.verify_integrity() == (True, None)
+
+    def test_last_line_spanning_blocks(self, ledger):
+        """Test reverse seek across several read blocks"""
+        ledger.TAIL_READ_BLOCK = 16
+        entry = ledger.append("test_event", {"blob": "x" * 100})
+
+        assert ledger.get_last_entry() == entry
+        assert ledger._scan_tail()["entry_hash"] == entry["entry_hash"]
+
+    def test_scan_tail_skips_count_without_entry_rotation(self, ledger, tmp_path):
+        """Test tail recovery only counts lines when count-based rotation is on"""
+        ledger.append("test_event", {"n": 1})
+
+        assert ledger._scan_tail()["entries"] is None
+
+        rotating = ImmutableLedger(str(ledger.ledger_path), segment_max_entries=100)
+        assert rotating._get_tail()["entries"] == 2
+
+
+class TestCheckpointedVerification:
+    """Test incremental verification from signed checkpoints"""
+
+    @pytest.fixture(autouse=True)
+    def checkpoint_key(self, monkeypatch):
+        monkeypatch.setenv(ImmutableLedger.CHECKPOINT_KEY_ENV, "secret")
+
+    def test_no_key_means_full_verify(self, ledger, monkeypatch):
+        """Test checkpoints are neither written nor trusted without a secret key"""
+        ledger.append("test_event", {"n": 1})
+        assert ledger.verify_integrity() == (True, None)
+        assert ledger.load_checkpoint() is not None
+
+        monkeypatch.delenv(ImmutableLedger.CHECKPOINT_KEY_ENV)
+        assert ledger.load_checkpoint() is None
+
+        ledger.checkpoint_path.unlink()
+        assert ledger.verify_integrity() == (True, None)
+        assert not ledger.checkpoint_path.exists()
+
+    def test_verify_writes_checkpoint(self, ledger):
+        """Test a successful verify records the tail as a checkpoint"""
+        entry = ledger.append("test_event", {"n": 1})
+        assert ledger.verify_integrity() == (True, None)
+
+        checkpoint = ledger.load_checkpoint()
+        assert checkpoint["index"] == 1
+        assert checkpoint["entry_hash"] == entry["entry_hash"]
+        assert checkpoint["offset"] == ledger.ledger_path.stat().st_size
+
+    def test_incremental_verify_skips_checkpointed_prefix(self, ledger, monkeypatch):
+        """Test only entries after the checkpoint are rehashed"""
+        for n in range(5):
+            ledger.append("test_event", {"n": n})
+        assert ledger.verify_integrity() == (True, None)
+        ledger.append("test_event", {"n": 5})
+
+        calls = []
+        original = ledger._compute_entry_hash
+        monkeypatch.setattr(ImmutableLedger, "_compute_entry_hash", staticmethod(lambda e: calls.append(e) or original(e)))
+
+        assert ledger.verify_integrity() == (True, None)
+        # One rehash to validate the checkpoint entry, one for the new entry
+        assert len(calls) == 2
+        assert ledger.load_checkpoint()["index"] == 6
+
+    def test_full_verify_detects_tampering_behind_checkpoint(self, ledger):
+        """Test --full rehashes entries the checkpoint already covers"""
+        ledger.append("test_event", {"status": "success"})
+        ledger.append("test_event", {"n": 2})
+        assert ledger.verify_integrity() == (True, None)
+
+        content = ledger.ledger_path.read_text().replace("success", "TAMPERED")
+        ledger.ledger_path.write_text(content)
+
+        assert ledger.verify_integrity(full=True) == (False, "Entry 1 has invalid hash (tampering detected)")
+
+    def test_tampered_checkpoint_entry_forces_full_verify(self, ledger):
+        """Test a checkpoint whose entry changed is not trusted"""
+        ledger.append("test_event", {"status": "success"})
+        assert ledger.verify_integrity() == (True, None)
+
+        content = ledger.ledger_path.read_text().replace("success", "TAMPERED")
+        ledger.ledger_path.write_text(content)
+
+        assert ledger.load_checkpoint() is None
+        assert ledger.verify_integrity() == (False, "Entry 1 has invalid hash (tampering detected)")
+
+    def test_forged_checkpoint_signature_rejected(self, ledger, monkeypatch):
+        """Test checkpoints signed with another key are ignored"""
+        monkeypatch.setenv(ImmutableLedger.CHECKPOINT_KEY_ENV, "secret")
+        ledger.append("test_event", {"n": 1})
+        assert ledger.verify_integrity() == (True, None)
+        assert ledger.load_checkpoint() is not None
+
+        monkeypatch.setenv(ImmutableLedger.CHECKPOINT_KEY_ENV, "other")
+        assert ledger.load_checkpoint() is None
+
+    def test_broken_linkage_reported(self, ledger):
+        """Test a re-hashed entry with the wrong previous_hash is caught"""
+        ledger.append("test_event", {"n": 1})
+        entry = {
+            "timestamp": "2025-01-01T00:00:00Z",
+            "event_type": "test_event",
+            "data": {},
+            "previous_hash": "f" * 64,
+        }
+        entry["entry_hash"] = ledger._compute_entry_hash(entry)
+        with open(ledger.ledger_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        assert ledger.verify_integrity() == (False, "Entry 2 has broken chain linkage")
+
+
+class TestSecondaryIndex:
+    """Test the event_type / timestamp index sidecar"""
+
+    @pytest.fixture
+    def populated(self, ledger):
+        """Ledger with interleaved event types and known timestamps"""
+        ledger.TIME_INDEX_STRIDE = 256
+        for n in range(40):
+            ledger.append("audit" if n % 4 == 0 else "noise", {"n": n})
+        return ledger
+
+    def test_get_entries_by_type_uses_index(self, populated):
+        """Test type queries return the same entries as a full scan"""
+        expected = [e for e in populated.get_all_entries() if e["event_type"] == "audit"]
+
+        assert populated.get_entries_by_type("audit") == expected
+        assert populated.get_entries_by_type("missing") == []
+        assert populated.index_path.exists()
+
+    def test_index_maintained_on_append(self, populated):
+        """Test appends after loading extend the index in place"""
+        populated.get_entries_by_type("audit")
+        entry = populated.append("audit", {"n": "late"})
+
+        assert populated.get_entries_by_type("audit")[-1] == entry
+        reopened = ImmutableLedger(str(populated.ledger_path))
+        assert reopened.get_entries_by_type("audit")[-1] == entry
+
+    def test_time_window_query(self, populated):
+        """Test since/until bounds against sampled timestamps"""
+        entries = populated.get_all_entries()
+        since, until = entries[10]["timestamp"], entries[30]["timestamp"]
+
+        assert list(populated.query(since=since, until=until)) == entries[10:31]
+        assert list(populated.query(event_type="audit", since=since)) == [
+            e for e in entries[10:] if e["event_type"] == "audit"
+        ]
+        assert populated._load_index()["times"]
+
+    def test_missing_index_rebuilt(self, populated):
+        """Test a deleted index is rebuilt on the next query"""
+        populated.get_entries_by_type("audit")
+        populated.index_path.unlink()
+        reopened = ImmutableLedger(str(populated.ledger_path))
+
+        assert len(reopened.get_entries_by_type("audit")) == 10
+
+    def test_stale_index_caught_up(self, populated):
+        """Test entries written by another process are indexed on query"""
+        populated.get_entries_by_type("audit")
+        other = ImmutableLedger(str(populated.ledger_path))
+        other._index_appended = lambda *args: None
+        entry = other.append("audit", {"n": "external"})
+
+        assert populated.get_entries_by_type("audit")[-1] == entry
+
+    def test_mismatched_index_rebuilt(self, populated):
+        """Test an index that disagrees with the ledger is discarded"""
+        populated.get_entries_by_type("audit")
+        populated.index_path.write_text(json.dumps([0, 7, "audit"]) + "\n")
+        reopened = ImmutableLedger(str(populated.ledger_path))
+
+        assert len(reopened.get_entries_by_type("audit")) == 10
+
+
+class TestStreamingExport:
+    """Test single-pass audit report export"""
+
+    def test_export_reports_all_entries(self, ledger, tmp_path):
+        """Test a full export covers every entry and a valid chain"""
+        ledger.append("test_event", {"n": 1})
+        output = tmp_path / "audit_report.txt"
+
+        summary = ledger.export_audit_report(str(output))
+        report = output.read_text()
+
+        assert summary == {"entries": 2, "valid": True, "error": None,
+                           "next_offset": ledger.ledger_path.stat().st_size}
+        assert "Entry #0" in report and "Entry #1" in report
+        assert "Total Entries: 2" in report
+        assert "Chain Integrity: VALID" in report
+
+    def test_export_since_offset(self, ledger, tmp_path):
+        """Test --since only reports entries after the previous report"""
+        ledger.append("test_event", {"n": 1})
+        first = ledger.export_audit_report(str(tmp_path / "first.txt"))
+        ledger.append("test_event", {"n": 2})
+        ledger.append("test_event", {"n": 3})
+
+        output = tmp_path / "second.txt"
+        summary = ledger.export_audit_report(str(output), since=first["next_offset"])
+        report = output.read_text()
+
+        assert summary["entries"] == 2 and summary["valid"]
+        assert "Entry #1\n" not in report
+        assert "Entry #2" in report and "Entry #3" in report
+
+        empty = ledger.export_audit_report(str(tmp_path / "third.txt"), since=summary["next_offset"])
+        assert empty["entries"] == 0 and empty["valid"]
+
+    def test_export_since_rejects_mid_entry_offset(self, ledger, tmp_path):
+        """Test offsets that are not entry boundaries are refused"""
+        ledger.append("test_event", {"n": 1})
+
+        with pytest.raises(ValueError):
+            ledger.export_audit_report(str(tmp_path / "report.txt"), since=5)
+
+    def test_export_gzip(self, ledger, tmp_path):
+        """Test gzip-compressed output"""
+        import gzip
+
+        output = tmp_path / "audit_report.txt.gz"
+        ledger.export_audit_report(str(output), compress=True)
+
+        with gzip.open(output, "rt") as f:
+            assert "Chain Integrity: VALID" in f.read()
+
+    def test_export_reports_tampering(self, ledger, tmp_path):
+        """Test tampered entries are still written and flagged"""
+        ledger.append("test_event", {"status": "success"})
+        ledger.append("test_event", {"n": 2})
+        content = ledger.ledger_path.read_text().replace("success", "TAMPERED")
+        ledger.ledger_path.write_text(content)
+
+        output = tmp_path / "audit_report.txt"
+        summary = ledger.export_audit_report(str(output))
+
+        assert summary["entries"] == 3
+        assert summary["error"] == "Entry 1 has invalid hash (tampering detected)"
+        assert "Chain Integrity: BROKEN" in output.read_text()
+
+
+class TestSegmentedStorage:
+    """Test segment rotation, manifest chaining and cross-segment reads"""
+
+    @pytest.fixture
+    def segmented(self, tmp_path):
+        """Ledger rotating every 5 entries, keeping one hot segment"""
+        ledger = ImmutableLedger(str(tmp_path / "coordination_log.jsonl"),
+                                 segment_max_entries=5, hot_segments=1)
+        for n in range(17):
+            ledger.append("audit" if n % 3 == 0 else "noise", {"n": n})
+        return ledger
+
+    def test_rotation_seals_segments(self, segmented):
+        """Test segments are sealed with chained manifest records"""
+        segments = segmented._manifest["segments"]
+
+        assert [r["entries"] for r in segments] == [5, 5, 5]
+        assert segments[0]["previous_footer_hash"] is None
+        for previous, record in zip(segments, segments[1:]):
+            assert record["previous_hash"] == previous["last_hash"]
+            assert record["previous_footer_hash"] == previous["footer_hash"]
+        # Cold segments are compressed, the most recent one stays hot
+        assert [r["file"].endswith(".gz") for r in segments] == [True, True, False]
+
+    def test_footer_merkle_root(self, segmented):
+        """Test the footer carries the Merkle root of the segment's entries"""
+        record = segmented._manifest["segments"][-1]
+        hashes = [e["entry_hash"] for e in segmented._iter_entries_from(segmented._segment_path(record), 0)]
+
+        assert record["merkle_root"] == ImmutableLedger._merkle_root(hashes)
+        assert ImmutableLedger._merkle_root(["00" * 32]) == "00" * 32
+
+    def test_iteration_spans_segments(self, segmented):
+        """Test get_all_entries and chaining continue across segments"""
+        entries = segmented.get_all_entries()
+
+        assert len(entries) == 18
+        assert [e["data"]["n"] for e in entries[1:]] == list(range(17))
+        for previous, entry in zip(entries, entries[1:]):
+            assert entry["previous_hash"] == previous["entry_hash"]
+        assert segmented.get_last_entry() == entries[-1]
+
+    def test_full_verify_in_worker_processes(self, segmented):
+        """Test sealed segments verify in parallel and chain to the active one"""
+        assert segmented.verify_integrity(full=True, workers=2) == (True, None)
+        assert segmented.verify_integrity(full=True, workers=1) == (True, None)
+        assert segmented.verify_integrity() == (True, None)
+
+    def test_tampered_sealed_segment_detected(self, segmented):
+        """Test modifying a hot sealed segment fails full verification"""
+        path = segmented._segment_path(segmented._manifest["segments"][-1])
+        path.write_text(path.read_text().replace('"n": 12', '"n": 99'))
+
+        is_valid, error = segmented.verify_integrity(full=True, workers=1)
+        assert not is_valid
+        assert "invalid hash" in error
+
+    def test_tampered_active_segment_does_not_fail_appends(self, segmented):
+        """Test a segment that cannot be sealed pauses rotation instead of failing appends"""
+        path = segmented.ledger_path
+        path.write_text(path.read_text().replace('"n": 15', '"n": 98'))
+
+        for n in range(17, 22):
+            entry = segmented.append("noise", {"n": n})
+
+        assert segmented.get_last_entry() == entry
+        assert len(segmented._manifest["segments"]) == 3
+        assert "invalid hash" in segmented.seal_error
+        assert not segmented.verify_integrity(full=True, workers=1)[0]
+
+    def test_injected_footer_detected(self, segmented):
+        """Test a footer line is only accepted as the last line of a sealed segment"""
+        path = segmented._segment_path(segmented._manifest["segments"][-1])
+        lines = path.read_text().splitlines(keepends=True)
+        footer = lines[-1]
+
+        segmented.ledger_path.write_text(segmented.ledger_path.read_text() + footer)
+        is_valid, error = segmented.verify_integrity(full=True, workers=1)
+        assert not is_valid
+        assert "misplaced segment footer" in error
+        with pytest.raises(ValueError):
+            segmented.get_all_entries()
+
+    def test_footer_followed_by_entry_detected(self, segmented):
+        """Test entries smuggled in after a sealed segment's footer are reported"""
+        path = segmented._segment_path(segmented._manifest["segments"][-1])
+        lines = path.read_text().splitlines(keepends=True)
+        path.write_text("".join(lines[:-2] + [lines[-1], lines[-2]]))
+
+        is_valid, error = segmented.verify_integrity(full=True, workers=1)
+        assert not is_valid
+        assert "follows the segment footer" in error
+
+    def test_query_and_types_across_segments(self, segmented):
+        """Test type and time queries span sealed and active segments"""
+        expected = [e for e in segmented.get_all_entries() if e["event_type"] == "audit"]
+
+        assert segmented.get_entries_by_type("audit") == expected
+        since = segmented.get_all_entries()[7]["timestamp"]
+        assert [e["data"]["n"] for e in segmented.query(since=since)] == list(range(6, 17))
+
+    def test_reopen_continues_chain(self, segmented):
+        """Test a reopened ledger appends onto the rotated chain"""
+        last = segmented.get_last_entry()
+        reopened = ImmutableLedger(str(segmented.ledger_path), segment_max_entries=5, hot_segments=1)
+
+        assert reopened.append("audit", {"n": 17})["previous_hash"] == last["entry_hash"]
+        assert reopened.verify_integrity(full=True, workers=1) == (True, None)
+
+    def test_interrupted_rotation_recovered(self, segmented):
+        """Test an active file left un-truncated after sealing is repaired"""
+        for _ in range(3):
+            segmented.append("noise", {})
+        segmented._rotate_if_needed()
+        sealed = segmented._segment_path(segmented._manifest["segments"][-1])
+        content = sealed.read_bytes()
+        segmented.ledger_path.write_bytes(content[:content.rindex(b'{"segment_footer"')])
+
+        reopened = ImmutableLedger(str(segmented.ledger_path), segment_max_entries=5)
+        assert reopened.ledger_path.stat().st_size == 0
+        assert reopened.verify_integrity(full=True, workers=1) == (True, None)
+
+    def test_export_since_global_offset(self, segmented, tmp_path):
+        """Test export offsets stay valid across segment rotations"""
+        first = segmented.export_audit_report(str(tmp_path / "first.txt"))
+        assert first["entries"] == 18 and first["valid"]
+
+        for n in range(7):
+            segmented.append("noise", {"n": 100 + n})
+        output = tmp_path / "second.txt"
+        second = segmented.export_audit_report(str(output), since=first["next_offset"])
+
+        assert second["entries"] == 7 and second["valid"]
+        assert "Entry #18" in output.read_text()
+        assert "Entry #17\n" not in output.read_text()
+
+        # Resuming mid-way through a sealed segment
+        offset = segmented._manifest["segments"][0]["base_offset"] + 1
+        with pytest.raises(ValueError):
+            segmented.export_audit_report(str(tmp_path / "bad.txt"), since=offset)
+
+
+class TestGroupCommit:
+    """Test batched appends"""
+
+    def test_append_many_chains_group(self, ledger):
+        """Test a group is chained in order and written in one go"""
+        entries = ledger.append_many([("audit", {"n": n}) for n in range(5)], fsync=True)
+
+        assert [e["data"]["n"] for e in entries] == list(range(5))
+        assert ledger.get_all_entries()[1:] == entries
+        assert ledger.get_entries_by_type("audit") == entries
+        assert ledger.verify_integrity(full=True) == (True, None)
+
+    def test_batch_writer_flushes_on_exit(self, ledger):
+        """Test the context manager writes pending entries on success"""
+        with ledger.batch(max_pending=3) as batch:
+            for n in range(7):
+                batch.append("audit", {"n": n})
+            assert batch.written == 6
+
+        assert batch.written == 7
+        assert len(ledger.get_all_entries()) == 8
+        assert ledger.verify_integrity() == (True, None)
+
+    def test_batch_discarded_on_error(self, ledger):
+        """Test an exception inside the batch leaves the ledger untouched"""
+        size = ledger.ledger_path.stat().st_size
+
+        with pytest.raises(RuntimeError):
+            with ledger.batch() as batch:
+                batch.append("audit", {"n": 1})
+                raise RuntimeError("automation failed")
+
+        assert ledger.ledger_path.stat().st_size == size
+
+    def test_batch_rejects_moved_tail(self, ledger):
+        """Test a batch refuses to write if another writer appended first"""
+        batch = ledger.batch()
+        batch.append("audit", {"n": 1})
+        ImmutableLedger(str(ledger.ledger_path)).append("audit", {"n": 2})
+
+        with pytest.raises(ValueError):
+            batch.flush()
+        assert ledger.verify_integrity(full=True) == (True, None)
+
+    def test_group_triggers_rotation(self, tmp_path):
+        """Test groups rotate the active segment once past its limit"""
+        ledger = ImmutableLedger(str(tmp_path / "coordination_log.jsonl"), segment_max_entries=4)
+        ledger.append_many([("audit", {"n": n}) for n in range(6)])
+        assert ledger._manifest["segments"] == []
+
+        ledger.append("audit", {"n": 6})
+        assert ledger._manifest["segments"][0]["entries"] == 7
+        assert ledger._get_tail()["entries"] == 1
+        assert ledger.verify_integrity(full=True, workers=1) == (True, None)
@@ -44,19 +44,187 @@ Manual Interventions Required: 6.2/day
 
 **Solution:** Full asynchronous pipeline with intelligent rate limiting.
 
+Outbound requests are paced per host by a token bucket, under an AIMD concurrency limit that backs off when the upstream pushes back:
+
+```python
+# harvesters/rate_limiter.py
+import time
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Tuple
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens/sec, holding at most `burst`
+    
+    Retry-After feeds back through pause(): the bucket is drained and starts
+    refilling only once the upstream's deadline has passed.
+    """
+    
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()  # in the future while paused
+        self._lock = asyncio.Lock()  # waiters are served in arrival order
+    
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+    
+    async def acquire(self) -> float:
+        """Take one token, returning the seconds spent waiting for it"""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1 and now >= self.updated:
+                    self.tokens -= 1
+                    return waited
+                
+                delay = max(0.0, self.updated - now) + max(0.0, 1 - self.tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+    
+    def pause(self, seconds: float):
+        """Hand out no tokens for the next `seconds`"""
+        resume_at = time.monotonic() + seconds
+        if resume_at > self.updated:
+            self.tokens = 0.0
+            self.updated = resume_at
+
+class AIMDLimiter:
+    """Additive-increase/multiplicative-decrease cap on in-flight requests
+    
+    Each success grows the limit by 1/limit (about one slot per window of
+    successes); an overload signal (429, 5xx, timeout) multiplies it by
+    `backoff`, at most once per `cooldown` seconds so a burst of rejections
+    counts as one signal.
+    """
+    
+    def __init__(self, initial: float = 2, min_limit: float = 1, max_limit: float = 6,
+                 backoff: float = 0.5, cooldown: float = 1.0):
+        self.limit = float(min(max(initial, min_limit), max_limit))
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+    
+    @asynccontextmanager
+    async def slot(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+    
+    def on_success(self):
+        self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+    
+    def on_overload(self):
+        now = time.monotonic()
+        if now - self._last_decrease >= self.cooldown:
+            self.limit = max(self.min_limit, self.limit * self.backoff)
+            self._last_decrease = now
+
+class HostRateLimiter:
+    """Per-host token bucket and AIMD concurrency limit, created on first use
+    
+    `limits` maps a host (or 'default') to {'rate': requests/sec, 'burst': n,
+    'max_concurrency': n}; host entries override the default one.
+    """
+    
+    def __init__(self, limits: Dict[str, Dict], max_concurrency: int = 6):
+        self.limits = limits
+        self.max_concurrency = max_concurrency
+        self.hosts: Dict[str, Tuple[TokenBucket, AIMDLimiter]] = {}
+        self.counters: Dict[str, Dict] = {}
+    
+    def _host(self, host: str) -> Tuple[TokenBucket, AIMDLimiter]:
+        if host not in self.hosts:
+            config = {**self.limits.get('default', {}), **self.limits.get(host, {})}
+            self.hosts[host] = (
+                TokenBucket(config.get('rate', 2.0), config.get('burst', 5)),
+                AIMDLimiter(max_limit=min(config.get('max_concurrency', self.max_concurrency), self.max_concurrency))
+            )
+            self.counters[host] = {'requests': 0, 'throttled': 0, 'overloads': 0, 'wait_seconds': 0.0}
+        return self.hosts[host]
+    
+    @asynccontextmanager
+    async def request(self, host: str):
+        """Hold a concurrency slot and one token for the duration of a request"""
+        bucket, limiter = self._host(host)
+        async with limiter.slot():
+            waited = await bucket.acquire()
+            counters = self.counters[host]
+            counters['requests'] += 1
+            counters['wait_seconds'] += waited
+            yield
+    
+    def record(self, host: str, status: Optional[int], retry_after: Optional[float] = None):
+        """Feed a response status (None for timeouts and connection errors) back into the host's limits"""
+        bucket, limiter = self._host(host)
+        if status is None or status == 429 or status >= 500:
+            limiter.on_overload()
+            self.counters[host]['overloads'] += 1
+            if status == 429:
+                self.counters[host]['throttled'] += 1
+            if retry_after is not None:
+                bucket.pause(retry_after)
+        else:
+            limiter.on_success()
+    
+    def get_stats(self) -> Dict[str, Dict]:
+        return {
+            host: {
+                **self.counters[host],
+                'rate': bucket.rate,
+                'concurrency_limit': int(limiter.limit),
+                'in_flight': limiter.in_flight
+            }
+            for host, (bucket, limiter) in self.hosts.items()
+        }
+```
+
 ```python
 # harvesters/async_orchestrator.py
 import asyncio
 import aiohttp
-from datetime import datetime
-from typing import Dict, List
+import time
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from contextvars import ContextVar
+from typing import Dict, List, Optional
 import backoff
 from contextlib import asynccontextmanager
 import signal
 
+from harvesters.rate_limiter import HostRateLimiter
+
+# Harvester a request is made on behalf of (inherited by the tasks it spawns)
+_current_harvester: ContextVar[Optional[str]] = ContextVar('current_harvester', default=None)
+
 class AsyncHarvestOrchestrator:
     """Advanced orchestrator with async/await, exponential backoff, and graceful shutdown"""
     
+    # Published quotas; config['rate_limits'] entries override these per host
+    DEFAULT_RATE_LIMITS = {
+        'default': {'rate': 2.0, 'burst': 5},
+        'oauth.reddit.com': {'rate': 100 / 60, 'burst': 10},
+        'www.reddit.com': {'rate': 10 / 60, 'burst': 2},
+        'api.github.com': {'rate': 5000 / 3600, 'burst': 20}
+    }
+    
     def __init__(self, config: Dict):
         self.config = config
         self.session = None
@@ -65,6 +233,13 @@ class AsyncHarvestOrchestrator:
         self.failures: Dict[str, int] = {}
         self.shutdown_event = asyncio.Event()
         
+        # Per-host pacing replaces fixed sleeps; concurrency adapts below the connector's cap
+        self.rate_limiter = HostRateLimiter(
+            {**self.DEFAULT_RATE_LIMITS, **config.get('rate_limits', {})},
+            max_concurrency=config.get('max_connections_per_host', 6)
+        )
+        self.throughput: Dict[str, Dict] = {}
+        
         # Register graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -78,7 +253,7 @@ class AsyncHarvestOrchestrator:
     async def session_manager(self):
         """Managed HTTP session with connection pooling"""
         connector = aiohttp.TCPConnector(
-            limit_per_host=6,
+            limit_per_host=self.rate_limiter.max_concurrency,
             ttl_dns_cache=300,
             enable_cleanup_closed=True
         )
@@ -107,25 +282,67 @@ class AsyncHarvestOrchestrator:
         max_time=60
     )
     async def _rate_limited_request(self, url: str, headers: Dict) -> Dict:
-        """Rate-limited request with jittered exponential backoff"""
+        """Request paced by the host's token bucket and concurrency limit, with exponential backoff"""
         if self.shutdown_event.is_set():
             raise asyncio.CancelledError("Shutdown initiated")
         
-        await asyncio.sleep(self.config.get('request_jitter', 0.5))
-        
-        async with self.session.get(url, headers=headers) as response:
-            if response.status == 429:  # Rate limited
-                retry_after = int(response.headers.get('Retry-After', 30))
-                await asyncio.sleep(retry_after)
-                raise aiohttp.ClientResponseError(
-                    request_info=response.request_info,
-                    history=response.history,
-                    status=429,
-                    message='Rate limited'
-                )
-            
-            response.raise_for_status()
-            return await response.json()
+        # Optional random spread, so harvesters starting together don't fire in lockstep
+        jitter = self.config.get('request_jitter', 0)
+        if jitter:
+            await asyncio.sleep(random.uniform(0, jitter))
+        
+        host = urlparse(url).netloc
+        counters = self.throughput.get(_current_harvester.get())
+        
+        async with self.rate_limiter.request(host):
+            try:
+                async with self.session.get(url, headers=headers) as response:
+                    if response.status == 429:  # Rate limited: the bucket waits out Retry-After
+                        self.rate_limiter.record(host, 429, self._parse_retry_after(response.headers.get('Retry-After')))
+                        if counters is not None:
+                            counters['throttled'] += 1
+                        raise aiohttp.ClientResponseError(
+                            request_info=response.request_info,
+                            history=response.history,
+                            status=429,
+                            message='Rate limited'
+                        )
+                    
+                    self.rate_limiter.record(host, response.status)
+                    response.raise_for_status()
+                    # Conditional (ETag) requests answer 304 with no body
+                    data = None if response.status == 304 else await response.json()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self.rate_limiter.record(host, None)
+                raise
+        
+        if counters is not None:
+            counters['requests'] += 1
+        return data
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str], default: float = 30.0) -> float:
+        """Retry-After is either delay-seconds or an HTTP-date"""
+        if not value:
+            return default
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return default
+    
+    async def _run_harvester(self, name: str, coro_func) -> Dict:
+        """Run one harvester, attributing its requests for the throughput report"""
+        _current_harvester.set(name)
+        counters = self.throughput[name] = {'requests': 0, 'throttled': 0, 'duration_seconds': 0.0}
+        started = time.monotonic()
+        try:
+            return await coro_func()
+        finally:
+            counters['duration_seconds'] = time.monotonic() - started
     
     async def harvest_reddit(self, subreddits: List[str]) -> Dict:
         """Advanced Reddit harvester with pagination and comment threading"""
@@ -154,7 +371,8 @@ class AsyncHarvestOrchestrator:
         harvester = GitHubHarvesterV2(
             session=self.session,
             repos=repos,
-            event_types=['PushEvent', 'IssuesEvent', 'WatchEvent', 'ForkEvent']
+            event_types=['PushEvent', 'IssuesEvent', 'WatchEvent', 'ForkEvent'],
+            rate_limiter=self._rate_limited_request
         )
         
         # Use GitHub's conditional requests for efficiency
@@ -192,7 +410,7 @@ class AsyncHarvestOrchestrator:
         tasks = {}
         for name, coro_func in harvesters.items():
             task = asyncio.create_task(
-                coro_func(),
+                self._run_harvester(name, coro_func),
                 name=f"harvester_{name}"
             )
             tasks[name] = task
@@ -228,7 +446,16 @@ class AsyncHarvestOrchestrator:
                 'duration_seconds': harvest_duration,
                 'success_rate': len([r for r in results.values() if 'error' not in r]) / len(results),
                 'failures': self.failures,
-                'shutdown_initiated': self.shutdown_event.is_set()
+                'shutdown_initiated': self.shutdown_event.is_set(),
+                'throughput': {
+                    name: {
+                        **counters,
+                        'requests_per_sec': counters['requests'] / counters['duration_seconds']
+                        if counters['duration_seconds'] else 0.0
+                    }
+                    for name, counters in self.throughput.items()
+                },
+                'rate_limits': self.rate_limiter.get_stats()
             }
         }
     
@@ -277,7 +504,7 @@ class AsyncHarvestOrchestrator:
 # vault/immutable_ledger.py
 import hashlib
 import json
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Callable
 from datetime import datetime
 import pickle
 from dataclasses import dataclass, asdict
@@ -285,6 +512,15 @@ from Crypto.Hash import SHA3_256
 from Crypto.Signature import ed25519
 import base64
 import struct
+import zlib
+import os
+import mmap
+import threading
+import logging
+import multiprocessing
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
 
 @dataclass(frozen=True)
 class LedgerEntry:
@@ -395,33 +631,344 @@ class MerkleTree:
             current_hash = self._hash(combined.encode())
         
         return current_hash == root
+class MerkleAccumulator:
+    """Append-only Merkle tree over every ledger entry (RFC 6962 hashing)
+    
+    Node hashes are persisted one file per tree level, 32 bytes per node, so
+    the frontier (the last node of each level) and every completed subtree
+    can be read back with a single seek.
+    """
+    
+    NODE_SIZE = 32
+    
+    def __init__(self, tree_path: str):
+        os.makedirs(tree_path, exist_ok=True)
+        self.tree_path = tree_path
+        self._files = {}
+        self._repair()
+        self.size = self._count(0)
+    
+    @staticmethod
+    def hash_leaf(data: bytes) -> bytes:
+        return hashlib.sha3_256(b'\x00' + data).digest()
+    
+    @staticmethod
+    def hash_children(left: bytes, right: bytes) -> bytes:
+        return hashlib.sha3_256(b'\x01' + left + right).digest()
+    
+    def append(self, leaf_data: bytes) -> int:
+        """Add a leaf in O(log n), returning its index"""
+        index = self.size
+        node = self.hash_leaf(leaf_data)
+        self._write(0, node)
+        
+        # Every completed pair of subtrees produces a parent one level up
+        level, position = 0, index
+        while position & 1:
+            node = self.hash_children(self._node(level, position - 1), node)
+            level += 1
+            position >>= 1
+            self._write(level, node)
+        
+        for level_file in self._files.values():
+            level_file.flush()
+        
+        self.size = index + 1
+        return index
+    
+    def root(self, size: Optional[int] = None) -> str:
+        """Root hash of the tree over the first `size` leaves"""
+        size = self.size if size is None else size
+        if not 0 <= size <= self.size:
+            raise ValueError(f"Tree size {size} out of range (0..{self.size})")
+        if size == 0:
+            return hashlib.sha3_256(b'').hexdigest()
+        return self._subtree(0, size).hex()
+    
+    def inclusion_proof(self, index: int, size: Optional[int] = None) -> List[str]:
+        """Audit path proving leaf `index` is in the tree of `size` leaves"""
+        size = self.size if size is None else size
+        if not 0 <= index < size <= self.size:
+            raise ValueError(f"Leaf {index} not in a tree of size {size}")
+        return [node.hex() for node in self._path(index, 0, size)]
+    
+    def consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> List[str]:
+        """Proof that the tree of old_size leaves is a prefix of the tree of new_size"""
+        new_size = self.size if new_size is None else new_size
+        if not 0 <= old_size <= new_size <= self.size:
+            raise ValueError(f"Cannot prove consistency from {old_size} to {new_size}")
+        if old_size in (0, new_size):
+            return []
+        return [node.hex() for node in self._subproof(old_size, 0, new_size, True)]
+    
+    @classmethod
+    def verify_inclusion(cls, leaf_data: bytes, index: int, size: int,
+                         proof: List[str], root: str) -> bool:
+        """Check an inclusion proof against a root (RFC 9162, 2.1.3.2)"""
+        if not 0 <= index < size:
+            return False
+        
+        fn, sn = index, size - 1
+        node = cls.hash_leaf(leaf_data)
+        for sibling in map(bytes.fromhex, proof):
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                node = cls.hash_children(sibling, node)
+                while not fn & 1 and fn:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                node = cls.hash_children(node, sibling)
+            fn >>= 1
+            sn >>= 1
+        
+        return sn == 0 and node.hex() == root
+    
+    @classmethod
+    def verify_consistency(cls, old_size: int, new_size: int, old_root: str,
+                           new_root: str, proof: List[str]) -> bool:
+        """Check a consistency proof between two roots (RFC 9162, 2.1.4.2)"""
+        if not 0 <= old_size <= new_size:
+            return False
+        if old_size == new_size:
+            return old_root == new_root and not proof
+        if old_size == 0:
+            return not proof
+        
+        nodes = [bytes.fromhex(node) for node in proof]
+        if old_size & (old_size - 1) == 0:
+            nodes.insert(0, bytes.fromhex(old_root))
+        if not nodes:
+            return False
+        
+        fn, sn = old_size - 1, new_size - 1
+        while fn & 1:
+            fn >>= 1
+            sn >>= 1
+        
+        old_node = new_node = nodes[0]
+        for node in nodes[1:]:
+            if sn == 0:
+                return False
+            if fn & 1 or fn == sn:
+                old_node = cls.hash_children(node, old_node)
+                new_node = cls.hash_children(node, new_node)
+                while not fn & 1 and fn:
+                    fn >>= 1
+                    sn >>= 1
+            else:
+                new_node = cls.hash_children(new_node, node)
+            fn >>= 1
+            sn >>= 1
+        
+        return sn == 0 and old_node.hex() == old_root and new_node.hex() == new_root
+    
+    def truncate(self, size: int):
+        """Drop every leaf from `size` onwards, with the nodes above them"""
+        level = 0
+        while os.path.exists(self._level_path(level)):
+            self._file(level).truncate((size >> level) * self.NODE_SIZE)
+            level += 1
+        self.size = size
+    
+    def _subtree(self, start: int, end: int) -> bytes:
+        """Hash of the subtree over leaves [start, end)"""
+        size = end - start
+        if size & (size - 1) == 0:
+            # Perfect subtrees are stored, and always aligned to their size
+            level = size.bit_length() - 1
+            return self._node(level, start >> level)
+        
+        split = 1 << ((size - 1).bit_length() - 1)
+        return self.hash_children(self._subtree(start, start + split),
+                                  self._subtree(start + split, end))
+    
+    def _path(self, index: int, start: int, end: int) -> List[bytes]:
+        """RFC 6962 PATH(m, D[start:end]), with index relative to start"""
+        size = end - start
+        if size == 1:
+            return []
+        
+        split = 1 << ((size - 1).bit_length() - 1)
+        if index < split:
+            return self._path(index, start, start + split) + [self._subtree(start + split, end)]
+        return self._path(index - split, start + split, end) + [self._subtree(start, start + split)]
+    
+    def _subproof(self, old_size: int, start: int, end: int, complete: bool) -> List[bytes]:
+        """RFC 6962 SUBPROOF(m, D[start:end], b)"""
+        size = end - start
+        if old_size == size:
+            return [] if complete else [self._subtree(start, end)]
+        
+        split = 1 << ((size - 1).bit_length() - 1)
+        if old_size <= split:
+            return (self._subproof(old_size, start, start + split, complete)
+                    + [self._subtree(start + split, end)])
+        return (self._subproof(old_size - split, start + split, end, False)
+                + [self._subtree(start, start + split)])
+    
+    def _repair(self):
+        """Drop torn nodes and rebuild parents lost to a crash mid-append"""
+        level = 0
+        while os.path.exists(self._level_path(level)):
+            level_file = self._file(level)
+            count = self._count(level)
+            expected = count if level == 0 else self._count(level - 1) // 2
+            
+            if count > expected or os.fstat(level_file.fileno()).st_size % self.NODE_SIZE:
+                level_file.truncate(min(count, expected) * self.NODE_SIZE)
+            for index in range(self._count(level), expected):
+                self._write(level, self.hash_children(self._node(level - 1, 2 * index),
+                                                      self._node(level - 1, 2 * index + 1)))
+            level_file.flush()
+            
+            level += 1
+            if self._count(level - 1) >= 2 and not os.path.exists(self._level_path(level)):
+                self._file(level)
+    
+    def _level_path(self, level: int) -> str:
+        return os.path.join(self.tree_path, f"level-{level:02d}.bin")
+    
+    def _file(self, level: int):
+        if level not in self._files:
+            self._files[level] = open(self._level_path(level), 'a+b')
+        return self._files[level]
+    
+    def _count(self, level: int) -> int:
+        if level not in self._files and not os.path.exists(self._level_path(level)):
+            return 0
+        return os.fstat(self._file(level).fileno()).st_size // self.NODE_SIZE
+    
+    def _node(self, level: int, index: int) -> bytes:
+        level_file = self._file(level)
+        level_file.seek(index * self.NODE_SIZE)
+        return level_file.read(self.NODE_SIZE)
+    
+    def _write(self, level: int, node: bytes):
+        self._file(level).write(node)
+
+class LazyChain:
+    """Memory-mapped view of chain.dat that decodes entries on access"""
+    
+    def __init__(self, ledger: 'ImmutableLedger', offsets: List[int], cache_size: int = 4096):
+        self.ledger = ledger
+        self.offsets = offsets
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._map = None
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.offsets)
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("ledger position out of range")
+        
+        with self._lock:
+            entry = self._cache.get(position)
+            if entry is not None:
+                self._cache.move_to_end(position)
+                return entry
+            
+            offset = self.offsets[position]
+            entry = self.ledger._decode_record(self._buffer(offset), offset)
+            self._remember(position, entry)
+            return entry
+    
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+    
+    def append(self, entry: LedgerEntry):
+        """Cache an entry that was just persisted (its offset is already recorded)"""
+        with self._lock:
+            self._remember(len(self.offsets) - 1, entry)
+    
+    def _remember(self, position: int, entry: LedgerEntry):
+        """Keep recently decoded entries, evicting the least recently used"""
+        self._cache[position] = entry
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def _buffer(self, offset: int):
+        """Return a mapping covering offset, remapping after appends grew the file"""
+        if self._map is None or offset >= len(self._map):
+            if self._map is not None:
+                self._map.close()
+            self._map = self.ledger._map_chain()
+        return self._map
 
 class ImmutableLedger:
     """Production-grade immutable ledger with rollback protection"""
     
-    def __init__(self, ledger_path: str = "vault/ledger"):
-        import os
+    # chain.dat is an append-only log of framed records:
+    #   magic (4 bytes) | payload length (uint32) | CRC32 of payload (uint32) | payload
+    RECORD_MAGIC = b'ECL1'
+    RECORD_HEADER = struct.Struct('<4sII')
+    
+    # Lazy loads persist verification progress this often
+    CHECKPOINT_INTERVAL = 10000
+    
+    # Entries verified per hold of the verify lock, so on-demand callers interleave
+    VERIFY_CHUNK = 256
+    
+    def __init__(self, ledger_path: str = "vault/ledger", lazy: bool = False,
+                 background_verify: bool = True):
         os.makedirs(ledger_path, exist_ok=True)
         
         self.ledger_path = ledger_path
         self.chain_file = os.path.join(ledger_path, "chain.dat")
-        self.index_file = os.path.join(ledger_path, "index.idx")
+        self.index_file = os.path.join(ledger_path, "index.journal")
+        self.checkpoint_file = os.path.join(ledger_path, "verified.checkpoint")
         self.state_file = os.path.join(ledger_path, "state.pkl")
+        self.lazy = lazy
         
         # Generate or load cryptographic keys
         self.private_key, self.public_key = self._load_or_generate_keys()
         
-        # Load existing ledger or initialize
-        self.chain: List[LedgerEntry] = self._load_chain()
-        self.index: Dict[str, int] = self._load_index()
-        
         # Statistics
         self.stats = {
-            'entries': len(self.chain),
-            'size_bytes': os.path.getsize(self.chain_file) if os.path.exists(self.chain_file) else 0,
+            'entries': 0,
+            'verified_entries': 0,
+            'size_bytes': 0,
             'last_verified': None,
-            'tamper_attempts': 0
+            'tamper_attempts': 0,
+            'verification_error': None
         }
+        
+        # Load existing ledger or initialize
+        self.offsets: List[int] = []
+        self.chain: List[LedgerEntry] = self._load_chain()
+        self.index: Dict[str, int] = self._load_index()
+        
+        # Ledger-wide Merkle tree, one leaf per entry
+        self.merkle = MerkleAccumulator(os.path.join(ledger_path, "merkle"))
+        self._sync_merkle()
+        
+        self.stats['entries'] = len(self.chain)
+        self.stats['size_bytes'] = os.path.getsize(self.chain_file) if os.path.exists(self.chain_file) else 0
+        
+        # Signatures of the first verified_upto entries have been checked
+        self._verify_lock = threading.Lock()
+        self._verify_thread: Optional[threading.Thread] = None
+        self._verify_pool = None  # process pool reused across verify_chain calls
+        self._verify_pool_workers = 0
+        if lazy:
+            self.verified_upto = self._load_verified_checkpoint()
+            if background_verify and self.verified_upto < len(self.chain):
+                self.start_background_verification()
+        else:
+            self.verified_upto = len(self.chain)
+            if self.chain:
+                self._write_verified_checkpoint(self.verified_upto)
+        self.stats['verified_entries'] = self.verified_upto
     
     def _load_or_generate_keys(self):
         """Load existing keys or generate new Ed25519 keypair"""
@@ -444,46 +991,338 @@ class ImmutableLedger:
         return private_key, public_key
     
     def _load_chain(self) -> List[LedgerEntry]:
-        """Load ledger chain from disk with integrity check"""
+        """Load ledger chain from the append log with integrity check"""
         if not os.path.exists(self.chain_file):
             return []
         
-        chain = []
+        self._migrate_legacy_chain()
+        
+        # Lazy loads only walk record headers; payloads are decoded on access
+        buf = self._map_chain()
+        try:
+            offsets, torn_offset = self._scan_records(buf, verify_checksums=not self.lazy)
+            
+            if self.lazy:
+                chain = LazyChain(self, offsets)
+            else:
+                chain = []
+                for offset in offsets:
+                    entry = self._decode_record(buf, offset)
+                    
+                    # Verify signature (except genesis block)
+                    if chain and not entry.verify(self.public_key):
+                        self.stats['tamper_attempts'] += 1
+                        raise SecurityError(f"Ledger tampering detected at entry {len(chain)}")
+                    
+                    chain.append(entry)
+        finally:
+            if buf is not None:
+                buf.close()
+        
+        if torn_offset is not None:
+            # Torn tail from a crash mid-append: the record was never acknowledged
+            logger.warning("Truncating torn ledger record at offset %d", torn_offset)
+            os.truncate(self.chain_file, torn_offset)
+        
+        self.offsets = offsets
+        return chain
+    
+    def _map_chain(self):
+        """Memory-map chain.dat read-only (None while it is empty)"""
+        with open(self.chain_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def _scan_records(self, buf, verify_checksums: bool = True) -> tuple:
+        """Walk record headers, returning (record offsets, torn tail offset or None)"""
+        header_size = self.RECORD_HEADER.size
+        file_size = len(buf) if buf is not None else 0
+        offsets = []
+        offset = 0
+        
+        while offset < file_size:
+            if offset + header_size <= file_size:
+                magic, length, checksum = self.RECORD_HEADER.unpack_from(buf, offset)
+                end = offset + header_size + length
+                
+                if magic == self.RECORD_MAGIC and end <= file_size:
+                    # The final record is always checksummed to catch a torn write
+                    if ((not verify_checksums and end < file_size)
+                            or zlib.crc32(buf[offset + header_size:end]) == checksum):
+                        offsets.append(offset)
+                        offset = end
+                        continue
+                    
+                    # A bad checksum is only a torn write if nothing follows it
+                    if end < file_size:
+                        raise ValueError(f"Ledger file corrupted: checksum mismatch at offset {offset}")
+                
+                # Zero-filled blocks are what a crash leaves behind after a size update
+                elif magic != self.RECORD_MAGIC and buf[offset:].strip(b'\0'):
+                    raise ValueError(f"Ledger file corrupted: invalid record header at offset {offset}")
+            
+            # A crash can only tear the last record; a valid one after it means corruption
+            later = self._find_record(buf, offset + 1)
+            if later is not None:
+                raise ValueError(f"Ledger file corrupted: unreadable record at offset {offset} "
+                                 f"is followed by a valid record at offset {later}")
+            
+            return offsets, offset
+        
+        return offsets, None
+    
+    def _find_record(self, buf, start: int) -> Optional[int]:
+        """Offset of the first complete, checksummed record at or after start"""
+        header_size = self.RECORD_HEADER.size
+        file_size = len(buf)
+        offset = buf.find(self.RECORD_MAGIC, start)
+        
+        while offset != -1 and offset + header_size <= file_size:
+            _, length, checksum = self.RECORD_HEADER.unpack_from(buf, offset)
+            end = offset + header_size + length
+            if end <= file_size and zlib.crc32(buf[offset + header_size:end]) == checksum:
+                return offset
+            offset = buf.find(self.RECORD_MAGIC, offset + 1)
+        
+        return None
+    
+    def _decode_record(self, buf, offset: int) -> LedgerEntry:
+        """Decode the framed record at offset, checking its checksum"""
+        header_size = self.RECORD_HEADER.size
+        magic, length, checksum = self.RECORD_HEADER.unpack_from(buf, offset)
+        payload = buf[offset + header_size:offset + header_size + length]
+        
+        if magic != self.RECORD_MAGIC or zlib.crc32(payload) != checksum:
+            raise ValueError(f"Ledger file corrupted: checksum mismatch at offset {offset}")
+        
+        return LedgerEntry(**pickle.loads(payload))
+    
+    def _frame_record(self, payload: bytes) -> bytes:
+        """Frame a payload with magic, length and CRC32"""
+        return self.RECORD_HEADER.pack(self.RECORD_MAGIC, len(payload), zlib.crc32(payload)) + payload
+    
+    def _migrate_legacy_chain(self):
+        """Convert an unframed size-prefixed chain.dat to the framed log format"""
         with open(self.chain_file, 'rb') as f:
+            magic = f.read(len(self.RECORD_MAGIC))
+            if not magic or magic == self.RECORD_MAGIC:
+                return
+            
+            f.seek(0)
+            records = []
             while True:
-                # Read entry size
                 size_bytes = f.read(4)
                 if not size_bytes:
                     break
                 
                 entry_size = struct.unpack('I', size_bytes)[0]
-                
-                # Read entry data
                 entry_data = f.read(entry_size)
                 if len(entry_data) != entry_size:
                     raise ValueError("Ledger file corrupted: incomplete entry")
+                records.append(self._frame_record(entry_data))
+        
+        # One-off rewrite, replaced atomically like the old per-append persistence
+        temp_chain = self.chain_file + ".migrate"
+        with open(temp_chain, 'wb') as f:
+            f.write(b''.join(records))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_chain, self.chain_file)
+    
+    def _load_verified_checkpoint(self) -> int:
+        """Number of leading entries covered by a valid verification checkpoint"""
+        if not os.path.exists(self.checkpoint_file):
+            return 0
+        
+        try:
+            with open(self.checkpoint_file, 'r') as f:
+                checkpoint = json.load(f)
+            entries, offset, data_hash = checkpoint['entries'], checkpoint['offset'], checkpoint['data_hash']
+            signature = base64.b64decode(checkpoint['signature'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+        
+        # Only checkpoints signed with this ledger's key are trusted
+        message = f"{entries}{offset}{data_hash}".encode()
+        try:
+            ed25519.new(self.public_key).verify(message, signature)
+        except (ValueError, TypeError):
+            return 0
+        
+        # The checkpointed entry must still sit where it was verified
+        if not 0 < entries <= len(self.chain) or self.offsets[entries - 1] != offset:
+            return 0
+        try:
+            if self.chain[entries - 1].data_hash != data_hash:
+                return 0
+        except ValueError:
+            return 0
+        
+        return entries
+    
+    def _write_verified_checkpoint(self, entries: int):
+        """Atomically record that the first `entries` entries have been verified"""
+        offset = self.offsets[entries - 1]
+        data_hash = self.chain[entries - 1].data_hash
+        message = f"{entries}{offset}{data_hash}".encode()
+        signature = ed25519.new(self.private_key).sign(message)
+        
+        temp_checkpoint = self.checkpoint_file + ".tmp"
+        with open(temp_checkpoint, 'w') as f:
+            json.dump({
+                'entries': entries,
+                'offset': offset,
+                'data_hash': data_hash,
+                'signature': base64.b64encode(signature).decode()
+            }, f)
+        os.replace(temp_checkpoint, self.checkpoint_file)
+    
+    def verify_pending(self, upto: Optional[int] = None) -> int:
+        """Verify signatures and linkage past the checkpoint, returning the verified prefix length"""
+        target = len(self.chain) if upto is None else min(upto, len(self.chain))
+        
+        # The lock is taken per chunk, so a caller needing a short prefix
+        # is not held up by a background pass over the whole chain
+        while self.verified_upto < target:
+            with self._verify_lock:
+                start = position = self.verified_upto
+                stop = min(target, start + self.VERIFY_CHUNK)
                 
-                # Deserialize
-                entry_dict = pickle.loads(entry_data)
-                entry = LedgerEntry(**entry_dict)
-                
-                # Verify signature (except genesis block)
-                if chain and not entry.verify(self.public_key):
-                    self.stats['tamper_attempts'] += 1
-                    raise SecurityError(f"Ledger tampering detected at entry {len(chain)}")
+                while position < stop:
+                    try:
+                        entry = self.chain[position]
+                        previous = self.chain[position - 1] if position > 0 else None
+                    except ValueError as e:
+                        self.stats['tamper_attempts'] += 1
+                        raise SecurityError(f"Ledger tampering detected at entry {position}: {e}")
+                    
+                    # Skip genesis block verification
+                    if previous is not None and (entry.previous_hash != previous.data_hash
+                                                 or not entry.verify(self.public_key)):
+                        self.stats['tamper_attempts'] += 1
+                        raise SecurityError(f"Ledger tampering detected at entry {position}")
+                    
+                    position += 1
+                    self.verified_upto = position
+                    self.stats['verified_entries'] = position
                 
-                chain.append(entry)
+                # Persist at each interval boundary and when the pass completes
+                if position > start and (
+                        position == target
+                        or position // self.CHECKPOINT_INTERVAL > start // self.CHECKPOINT_INTERVAL):
+                    self._write_verified_checkpoint(position)
         
-        return chain
+        return self.verified_upto
+    
+    def start_background_verification(self) -> threading.Thread:
+        """Verify entries past the checkpoint on a daemon thread"""
+        def run():
+            try:
+                self.verify_pending()
+            except SecurityError as e:
+                self.stats['verification_error'] = str(e)
+        
+        self._verify_thread = threading.Thread(target=run, name="ledger-verify", daemon=True)
+        self._verify_thread.start()
+        return self._verify_thread
     
     def _load_index(self) -> Dict[str, int]:
-        """Load index for quick lookups"""
-        if not os.path.exists(self.index_file):
-            return {}
+        """Replay the index journal, repairing it from the chain if it lags or is damaged"""
+        index = {}
+        intact = True
+        records = 0  # journal records replayed; data_hash repeats make this exceed len(index)
+        last_hash = None
+        
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r') as f:
+                for line in f:
+                    try:
+                        data_hash, position, offset = json.loads(line)
+                    except (ValueError, TypeError):
+                        intact = False
+                        break
+                    
+                    # Journal records must line up with the chain they index;
+                    # lazy chains only decode the last one (checked below)
+                    if (position != records or position >= len(self.chain)
+                            or self.offsets[position] != offset
+                            or (not self.lazy and self.chain[position].data_hash != data_hash)):
+                        intact = False
+                        break
+                    
+                    # A repeated data_hash resolves to its latest position
+                    index[data_hash] = position
+                    last_hash = data_hash
+                    records += 1
+        
+        if intact and self.lazy and records:
+            intact = self.chain[records - 1].data_hash == last_hash
+        
+        if not intact:
+            # Torn or stale journal: rewrite it from the chain
+            index = {}
+            temp_index = self.index_file + ".rebuild"
+            with open(temp_index, 'w') as f:
+                for position, data_hash in enumerate(self._chain_data_hashes()):
+                    f.write(json.dumps([data_hash, position, self.offsets[position]]) + "\n")
+                    index[data_hash] = position
+            os.replace(temp_index, self.index_file)
+        elif records < len(self.chain):
+            # Crash between the chain fsync and the journal write: catch up
+            for position in range(records, len(self.chain)):
+                entry = self.chain[position]
+                self._journal_index(entry.data_hash, position, self.offsets[position])
+                index[entry.data_hash] = position
+        
+        return index
+    
+    def _chain_data_hashes(self) -> Iterator[str]:
+        """data_hash of every entry in order, read straight from the records of a lazy chain"""
+        if not self.lazy:
+            for entry in self.chain:
+                yield entry.data_hash
+            return
         
-        with open(self.index_file, 'r') as f:
-            import json
-            return json.load(f)
+        # Walk offsets and record headers over one mapping, unpickling only
+        # the payload dict: no LedgerEntry is built and the LazyChain cache is untouched
+        buf = self._map_chain()
+        if buf is None:
+            return
+        try:
+            header_size = self.RECORD_HEADER.size
+            for offset in self.offsets:
+                _, length, _ = self.RECORD_HEADER.unpack_from(buf, offset)
+                yield pickle.loads(buf[offset + header_size:offset + header_size + length])['data_hash']
+        finally:
+            buf.close()
+    
+    def _sync_merkle(self):
+        """Bring the ledger-wide Merkle tree in line with the chain"""
+        tree = self.merkle
+        if tree.size > len(self.chain):
+            tree.truncate(len(self.chain))
+        
+        # Spot-check the last shared leaf; a mismatch means the tree is for another chain
+        if tree.size:
+            last = tree.size - 1
+            if tree._node(0, last) != tree.hash_leaf(self._leaf_data(self.chain[last])):
+                tree.truncate(0)
+        
+        for position in range(tree.size, len(self.chain)):
+            tree.append(self._leaf_data(self.chain[position]))
+    
+    @staticmethod
+    def _leaf_data(entry) -> bytes:
+        """Canonical bytes committed to the Merkle tree for an entry (or its asdict form)"""
+        if isinstance(entry, LedgerEntry):
+            entry = asdict(entry)
+        return json.dumps(entry, sort_keys=True).encode()
+    
+    def _journal_index(self, data_hash: str, position: int, offset: int):
+        """Append one index record to the index journal"""
+        with open(self.index_file, 'a') as f:
+            f.write(json.dumps([data_hash, position, offset]) + "\n")
     
     def append(self, data: Dict, harvester_id: str) -> str:
         """Append new entry to ledger with full cryptographic proofs"""
@@ -520,137 +1359,175 @@ class ImmutableLedger:
         if not signed_entry.verify(self.public_key):
             raise SecurityError("Failed to sign ledger entry")
         
-        # Append to chain
+        # Persist before the entry becomes visible in memory
+        offset, record_size = self._persist_entry(signed_entry, len(self.chain))
+        
+        # Append to chain (a lazy chain reads its length from the offset table)
+        self.offsets.append(offset)
         self.chain.append(signed_entry)
         self.index[data_hash] = len(self.chain) - 1
+        self.merkle.append(self._leaf_data(signed_entry))
         
-        # Persist
-        self._persist_entry(signed_entry)
+        # Entries signed here are trusted if everything before them already is
+        if self.verified_upto == len(self.chain) - 1:
+            self.verified_upto += 1
+            self.stats['verified_entries'] = self.verified_upto
         
         # Update statistics
         self.stats['entries'] += 1
-        self.stats['size_bytes'] += len(pickle.dumps(asdict(signed_entry)))
+        self.stats['size_bytes'] += record_size
         
         return data_hash
     
-    def _persist_entry(self, entry: LedgerEntry):
-        """Atomic persistence of ledger entry"""
-        import tempfile
+    def _persist_entry(self, entry: LedgerEntry, position: int) -> tuple:
+        """Atomic append of a framed ledger record, then its index journal record"""
+        record = self._frame_record(pickle.dumps(asdict(entry)))
         
-        # Serialize entry
-        entry_data = pickle.dumps(asdict(entry))
-        entry_size = len(entry_data)
+        with open(self.chain_file, 'ab') as f:
+            offset = f.tell()
+            try:
+                # One write per record; a crash leaves at most a torn tail,
+                # which _load_chain truncates on the next load
+                f.write(record)
+                f.flush()
+                os.fsync(f.fileno())
+            except OSError:
+                # Keep the log ending on a record boundary
+                f.truncate(offset)
+                raise
         
-        # Write to temporary file first
-        temp_chain = tempfile.NamedTemporaryFile(mode='wb', delete=False, dir=self.ledger_path)
-        temp_index = tempfile.NamedTemporaryFile(mode='w', delete=False, dir=self.ledger_path)
+        # The journal is derived from the chain, so it is written after the
+        # chain is durable and repaired by _load_index if this step is lost
+        self._journal_index(entry.data_hash, position, offset)
         
-        try:
-            # Copy existing chain and append new entry
-            if os.path.exists(self.chain_file):
-                import shutil
-                shutil.copy2(self.chain_file, temp_chain.name)
-            
-            # Append new entry with size prefix
-            with open(temp_chain.name, 'ab') as f:
-                f.write(struct.pack('I', entry_size))
-                f.write(entry_data)
-            
-            # Write index
-            import json
-            with open(temp_index.name, 'w') as f:
-                json.dump(self.index, f, indent=2)
-            
-            # Atomic rename
-            import os
-            os.replace(temp_chain.name, self.chain_file)
-            os.replace(temp_index.name, self.index_file)
-            
-            # Sync to disk
-            os.fsync(os.open(self.chain_file, os.O_RDONLY))
-            
-        finally:
-            # Cleanup
-            for temp_file in [temp_chain.name, temp_index.name]:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-    
-    def verify_chain(self) -> Dict:
-        """Full chain verification with performance optimizations"""
-        if not self.chain:
+        return offset, len(record)
+    
+    def verify_chain(self, workers: Optional[int] = None, backend: str = "process",
+                     chunk_size: int = 2000,
+                     progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """Full chain verification, fanned out over workers by chain.dat byte range"""
+        total = len(self.offsets)
+        if not total:
             return {'status': 'empty', 'verified': True}
         
+        workers = workers or os.cpu_count() or 1
         results = {
             'verified': True,
-            'entries': len(self.chain),
+            'entries': total,
             'errors': [],
-            'performance_ms': 0
+            'performance_ms': 0,
+            'backend': backend,
+            'workers': workers,
+            'entries_per_sec': 0.0
         }
         
         import time
         start_time = time.time()
         
-        # Parallel verification for large chains
-        if len(self.chain) > 1000:
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-                futures = []
-                chunk_size = 250
-                
-                for i in range(0, len(self.chain), chunk_size):
-                    chunk = self.chain[i:i + chunk_size]
-                    futures.append(
-                        executor.submit(self._verify_chunk, chunk, i)
-                    )
-                
-                for future in concurrent.futures.as_completed(futures):
-                    chunk_errors = future.result()
-                    if chunk_errors:
-                        results['errors'].extend(chunk_errors)
-                        results['verified'] = False
+        # Workers read and decode their own byte ranges, so no entries are pickled across
+        public_key = self.public_key.export_key(format='PEM')
+        end_of_chain = self._record_end(self.offsets[-1])
+        jobs = []
+        for start_index in range(0, total, chunk_size):
+            end_index = start_index + chunk_size
+            end = self.offsets[end_index] if end_index < total else end_of_chain
+            jobs.append((self.chain_file, self.offsets[start_index], end, start_index, public_key))
+        
+        import concurrent.futures
+        if backend == "serial" or len(jobs) == 1:
+            executor = None
+            outcomes = map(_verify_record_range, jobs)
+        elif backend == "process":
+            executor = None  # the pool outlives this call
+            outcomes = self._process_pool(workers).map(_verify_record_range, jobs)
+        elif backend == "thread":
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+            outcomes = executor.map(_verify_record_range, jobs)
         else:
-            # Sequential verification for smaller chains
-            errors = self._verify_chunk(self.chain, 0)
-            if errors:
-                results['errors'] = errors
-                results['verified'] = False
-        
-        results['performance_ms'] = (time.time() - start_time) * 1000
-        self.stats['last_verified'] = datetime.utcnow().isoformat()
+            raise ValueError(f"Unknown verification backend: {backend}")
         
-        return results
-    
-    def _verify_chunk(self, chunk: List[LedgerEntry], start_index: int) -> List[Dict]:
-        """Verify a chunk of ledger entries"""
-        errors = []
-        
-        for i, entry in enumerate(chunk):
-            global_index = start_index + i
-            
-            # Skip genesis block verification
-            if global_index == 0:
-                continue
+        try:
+            verified = 0
+            previous_hash = None
             
-            # Verify hash chain
-            if global_index > 0:
-                expected_previous = self.chain[global_index - 1].data_hash
-                if entry.previous_hash != expected_previous:
-                    errors.append({
-                        'index': global_index,
+            # map() yields ranges in chain order, so linkage across ranges is checked here
+            for summary in outcomes:
+                # A range whose first record is corrupt has no linkage to check
+                if (previous_hash is not None and summary['first_previous_hash'] is not None
+                        and summary['first_previous_hash'] != previous_hash):
+                    results['errors'].append({
+                        'index': summary['start_index'],
                         'error': 'Hash chain broken',
-                        'expected': expected_previous,
-                        'actual': entry.previous_hash
+                        'expected': previous_hash,
+                        'actual': summary['first_previous_hash']
                     })
-            
-            # Verify signature
-            if not entry.verify(self.public_key):
-                errors.append({
-                    'index': global_index,
-                    'error': 'Invalid signature',
-                    'timestamp': entry.timestamp
-                })
+                results['errors'].extend(summary['errors'])
+                previous_hash = summary['last_hash']
+                
+                verified += summary['entries']
+                if progress:
+                    elapsed = time.time() - start_time
+                    progress({
+                        'verified': verified,
+                        'total': total,
+                        'entries_per_sec': verified / elapsed if elapsed else 0.0
+                    })
+        except concurrent.futures.BrokenExecutor:
+            if backend == "process":
+                self._verify_pool = None  # start a fresh pool next time
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        if results['errors']:
+            results['errors'].sort(key=lambda error: error['index'])
+            results['verified'] = False
         
-        return errors
+        elapsed = time.time() - start_time
+        results['performance_ms'] = elapsed * 1000
+        results['entries_per_sec'] = total / elapsed if elapsed else 0.0
+        self.stats['last_verified'] = datetime.utcnow().isoformat()
+        
+        # A clean full pass becomes the checkpoint lazy restarts trust
+        if results['verified']:
+            with self._verify_lock:
+                self.verified_upto = max(self.verified_upto, results['entries'])
+                self.stats['verified_entries'] = self.verified_upto
+                self._write_verified_checkpoint(results['entries'])
+        
+        return results
+    
+    def _process_pool(self, workers: int):
+        """Verification process pool, created once and reused while the worker count holds
+        
+        Workers come from a forkserver (spawn where unavailable): this process
+        runs the ledger-verify and dedup writer threads, and forking with live
+        threads is unsafe.
+        """
+        import concurrent.futures
+        if self._verify_pool is not None and self._verify_pool_workers == workers:
+            return self._verify_pool
+        self.close()
+        
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        self._verify_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(method))
+        self._verify_pool_workers = workers
+        return self._verify_pool
+    
+    def close(self):
+        """Shut down the verification process pool"""
+        if self._verify_pool is not None:
+            self._verify_pool.shutdown()
+            self._verify_pool = None
+    
+    def _record_end(self, offset: int) -> int:
+        """Byte offset just past the record starting at offset"""
+        with open(self.chain_file, 'rb') as f:
+            f.seek(offset)
+            _, length, _ = self.RECORD_HEADER.unpack(f.read(self.RECORD_HEADER.size))
+        return offset + self.RECORD_HEADER.size + length
     
     def get_proof(self, data_hash: str) -> Dict:
         """Generate cryptographic proof for specific data"""
@@ -658,31 +1535,47 @@ class ImmutableLedger:
             raise KeyError(f"Data hash {data_hash} not found in ledger")
         
         index = self.index[data_hash]
+        
+        # Lazy ledgers verify on demand before vouching for an entry
+        if index >= self.verified_upto:
+            self.verify_pending(upto=index + 1)
+        
         entry = self.chain[index]
         
+        # Inclusion path from the entry's leaf to the current ledger-wide root
+        tree_size = self.merkle.size
         proof = {
             'entry': asdict(entry),
-            'siblings': [],
-            'root_path': []
+            'leaf_index': index,
+            'tree_size': tree_size,
+            'root': self.merkle.root(tree_size),
+            'inclusion_path': self.merkle.inclusion_proof(index, tree_size)
         }
         
-        # Generate Merkle path if available in metadata
-        if entry.metadata and 'merkle_path' in entry.metadata:
-            proof['merkle_path'] = entry.metadata['merkle_path']
-        
-        # Include surrounding entries for context
-        context_start = max(0, index - 3)
-        context_end = min(len(self.chain), index + 4)
-        
-        proof['context'] = [
-            asdict(self.chain[i]) for i in range(context_start, context_end)
-        ]
-        
         # Generate ZK-SNARK proof for privacy-preserving verification
         proof['zk_proof'] = self._generate_zk_proof(entry)
         
         return proof
     
+    @staticmethod
+    def verify_inclusion(proof: Dict) -> bool:
+        """Check a proof returned by get_proof against its root"""
+        return MerkleAccumulator.verify_inclusion(
+            ImmutableLedger._leaf_data(proof['entry']), proof['leaf_index'],
+            proof['tree_size'], proof['inclusion_path'], proof['root']
+        )
+    
+    def get_consistency_proof(self, old_size: int, new_size: Optional[int] = None) -> Dict:
+        """Prove the ledger at old_size entries is a prefix of the ledger at new_size"""
+        new_size = self.merkle.size if new_size is None else new_size
+        return {
+            'old_size': old_size,
+            'new_size': new_size,
+            'old_root': self.merkle.root(old_size),
+            'new_root': self.merkle.root(new_size),
+            'proof': self.merkle.consistency_proof(old_size, new_size)
+        }
+    
     def _generate_zk_proof(self, entry: LedgerEntry) -> Dict:
         """Generate zero-knowledge proof for entry verification"""
         # This is a simplified version - production would use libsnark or bellman
@@ -721,6 +1614,65 @@ class ImmutableLedger:
 class SecurityError(Exception):
     """Security-related exceptions in ledger"""
     pass
+
+def _verify_record_range(job: tuple) -> Dict:
+    """Verify one byte range of chain.dat (runs inside verify_chain workers)"""
+    chain_file, start, end, start_index, public_key_pem = job
+    
+    from Crypto.PublicKey import ECC
+    public_key = ECC.import_key(public_key_pem)
+    header = ImmutableLedger.RECORD_HEADER
+    
+    with open(chain_file, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+    
+    errors = []
+    first_previous_hash = last_hash = None
+    index = start_index
+    offset = 0
+    
+    while offset < len(data):
+        magic, length, checksum = header.unpack_from(data, offset)
+        payload = data[offset + header.size:offset + header.size + length]
+        if magic != ImmutableLedger.RECORD_MAGIC or zlib.crc32(payload) != checksum:
+            # Record boundaries past this point cannot be trusted
+            errors.append({'index': index, 'error': 'Record corrupted', 'offset': start + offset})
+            last_hash = None
+            break
+        
+        entry = LedgerEntry(**pickle.loads(payload))
+        
+        # Linkage into the first entry is checked by verify_chain across ranges
+        if index == start_index:
+            first_previous_hash = entry.previous_hash
+        elif entry.previous_hash != last_hash:
+            errors.append({
+                'index': index,
+                'error': 'Hash chain broken',
+                'expected': last_hash,
+                'actual': entry.previous_hash
+            })
+        
+        # Skip genesis block verification
+        if index > 0 and not entry.verify(public_key):
+            errors.append({
+                'index': index,
+                'error': 'Invalid signature',
+                'timestamp': entry.timestamp
+            })
+        
+        last_hash = entry.data_hash
+        offset += header.size + length
+        index += 1
+    
+    return {
+        'start_index': start_index,
+        'entries': index - start_index,
+        'first_previous_hash': first_previous_hash,
+        'last_hash': last_hash,
+        'errors': errors
+    }
 ```
 
 ### **3. ADVANCED CIRCUIT BREAKER PATTERN**
@@ -731,13 +1683,12 @@ class SecurityError(Exception):
 
 ```python
 # resilience/circuit_breaker.py
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 import asyncio
+import math
 from enum import Enum, auto
-import statistics
 from dataclasses import dataclass
-from collections import deque
 
 class CircuitState(Enum):
     CLOSED = auto()      # Normal operation
@@ -745,47 +1696,152 @@ class CircuitState(Enum):
     HALF_OPEN = auto()   # Testing recovery
     THROTTLED = auto()   # Rate limited, slow requests
 
+# Log-spaced latency histogram: 8 bins per doubling (~9% relative error) from 0.1 ms up to ~28 min
+LATENCY_BIN_BASE_MS = 0.1
+LATENCY_BINS_PER_DOUBLING = 8
+LATENCY_BIN_COUNT = LATENCY_BINS_PER_DOUBLING * 24 + 2
+
+def _latency_bin(latency_ms: float) -> int:
+    if latency_ms <= LATENCY_BIN_BASE_MS:
+        return 0
+    index = int(math.log2(latency_ms / LATENCY_BIN_BASE_MS) * LATENCY_BINS_PER_DOUBLING) + 1
+    return min(index, LATENCY_BIN_COUNT - 1)
+
+def _latency_bin_value(index: int) -> float:
+    """Geometric midpoint of a histogram bin"""
+    if index == 0:
+        return LATENCY_BIN_BASE_MS
+    return LATENCY_BIN_BASE_MS * 2 ** ((index - 0.5) / LATENCY_BINS_PER_DOUBLING)
+
 @dataclass
 class CircuitMetrics:
+    """Lifetime counters plus a sliding window over the last window_size requests
+    
+    Each request occupies one slot of a ring buffer; overwriting the oldest slot
+    subtracts it from the window totals, so the failure rate, error counts and
+    latency histogram are all kept up to date in O(1) per request. Latency mean
+    and deviation are exponentially weighted (alpha = 2 / (window_size + 1)).
+    """
     request_count: int = 0
     failure_count: int = 0
     success_count: int = 0
-    latency_history: deque = None
     error_types: Dict[str, int] = None
+    window_size: int = 100
     
     def __post_init__(self):
-        if self.latency_history is None:
-            self.latency_history = deque(maxlen=100)
         if self.error_types is None:
             self.error_types = {}
+        
+        # Ring of (error_type or None, latency bin or -1)
+        self._window: List[Optional[Tuple[Optional[str], int]]] = [None] * self.window_size
+        self._next_slot = 0
+        self.window_count = 0
+        self.window_failures = 0
+        self.window_error_types: Dict[str, int] = {}
+        self._latency_bins = [0] * LATENCY_BIN_COUNT
+        self._latency_samples = 0
+        self._percentiles: Optional[Dict[str, float]] = None  # cached until the next latency sample
+        
+        self._alpha = 2.0 / (self.window_size + 1)
+        self._ewma_latency: Optional[float] = None
+        self._ewma_variance = 0.0
     
     def record_success(self, latency_ms: float):
         self.request_count += 1
         self.success_count += 1
-        self.latency_history.append(latency_ms)
+        self._record(None, latency_ms)
     
-    def record_failure(self, error_type: str):
+    def record_failure(self, error_type: str, latency_ms: Optional[float] = None):
         self.request_count += 1
         self.failure_count += 1
         self.error_types[error_type] = self.error_types.get(error_type, 0) + 1
+        self._record(error_type, latency_ms)
+    
+    def _record(self, error_type: Optional[str], latency_ms: Optional[float]):
+        # Evict the request this slot held
+        evicted = self._window[self._next_slot]
+        if evicted is not None:
+            evicted_error, evicted_bin = evicted
+            self.window_count -= 1
+            if evicted_error is not None:
+                self.window_failures -= 1
+                remaining = self.window_error_types[evicted_error] - 1
+                if remaining:
+                    self.window_error_types[evicted_error] = remaining
+                else:
+                    del self.window_error_types[evicted_error]
+            if evicted_bin >= 0:
+                self._latency_bins[evicted_bin] -= 1
+                self._latency_samples -= 1
+                self._percentiles = None
+        
+        latency_bin = -1
+        if latency_ms is not None:
+            latency_bin = _latency_bin(latency_ms)
+            self._latency_bins[latency_bin] += 1
+            self._latency_samples += 1
+            self._percentiles = None
+            self._update_ewma(latency_ms)
+        
+        self._window[self._next_slot] = (error_type, latency_bin)
+        self._next_slot = (self._next_slot + 1) % self.window_size
+        self.window_count += 1
+        if error_type is not None:
+            self.window_failures += 1
+            self.window_error_types[error_type] = self.window_error_types.get(error_type, 0) + 1
+    
+    def _update_ewma(self, latency_ms: float):
+        if self._ewma_latency is None:
+            self._ewma_latency = latency_ms
+            return
+        diff = latency_ms - self._ewma_latency
+        increment = self._alpha * diff
+        self._ewma_latency += increment
+        self._ewma_variance = (1 - self._alpha) * (self._ewma_variance + diff * increment)
     
     @property
     def failure_rate(self) -> float:
+        """Failure rate over the sliding window"""
+        if self.window_count == 0:
+            return 0.0
+        return self.window_failures / self.window_count
+    
+    @property
+    def lifetime_failure_rate(self) -> float:
         if self.request_count == 0:
             return 0.0
         return self.failure_count / self.request_count
     
     @property
     def avg_latency(self) -> float:
-        if not self.latency_history:
-            return 0.0
-        return statistics.mean(self.latency_history)
+        return self._ewma_latency or 0.0
     
     @property
     def latency_stddev(self) -> float:
-        if len(self.latency_history) < 2:
-            return 0.0
-        return statistics.stdev(self.latency_history)
+        return math.sqrt(self._ewma_variance)
+    
+    @property
+    def latency_percentiles(self) -> Dict[str, float]:
+        """p50/p95/p99 latency over the window, read off the histogram"""
+        if self._percentiles is None:
+            self._percentiles = self._compute_percentiles((('p50', 0.5), ('p95', 0.95), ('p99', 0.99)))
+        return self._percentiles
+    
+    def _compute_percentiles(self, quantiles: Tuple[Tuple[str, float], ...]) -> Dict[str, float]:
+        result = {name: 0.0 for name, _ in quantiles}
+        if not self._latency_samples:
+            return result
+        
+        # One pass over the fixed-size histogram
+        targets = [(name, max(1, math.ceil(q * self._latency_samples))) for name, q in quantiles]
+        cumulative = 0
+        for index, count in enumerate(self._latency_bins):
+            cumulative += count
+            while targets and cumulative >= targets[0][1]:
+                result[targets.pop(0)[0]] = _latency_bin_value(index)
+            if not targets:
+                break
+        return result
 
 class AdaptiveCircuitBreaker:
     """Advanced circuit breaker with adaptive thresholds and health checks"""
@@ -802,7 +1858,7 @@ class AdaptiveCircuitBreaker:
     ):
         self.name = name
         self.state = CircuitState.CLOSED
-        self.metrics = CircuitMetrics()
+        self.metrics = CircuitMetrics(window_size=sliding_window_size)
         
         # Configuration
         self.failure_threshold = failure_threshold
@@ -844,8 +1900,19 @@ class AdaptiveCircuitBreaker:
             result = await func(*args, **kwargs)
             latency = (datetime.utcnow() - start_time).total_seconds() * 1000
             
-            # Record success
-            self.metrics.record_success(latency)
+            # High latency might indicate problems: it counts as a failure, once, in the window
+            latency_exceeded = (
+                self.latency_threshold and
+                latency > self.latency_threshold and
+                self.state == CircuitState.CLOSED
+            )
+            
+            if latency_exceeded:
+                self.metrics.record_failure('latency_exceeded', latency)
+                await self._evaluate_circuit()
+            else:
+                # Record success
+                self.metrics.record_success(latency)
             
             # Handle state transitions
             if self.state == CircuitState.HALF_OPEN:
@@ -853,26 +1920,14 @@ class AdaptiveCircuitBreaker:
                 if self.half_open_attempts >= self.half_open_max_requests:
                     await self._close_circuit()
             
-            # Check latency threshold
-            if (self.latency_threshold and 
-                latency > self.latency_threshold and
-                self.state == CircuitState.CLOSED):
-                
-                # High latency might indicate problems
-                self.metrics.record_failure('latency_exceeded')
-                await self._evaluate_circuit()
-            
             return result
             
         except Exception as e:
             latency = (datetime.utcnow() - start_time).total_seconds() * 1000
             
-            # Classify error
+            # Classify error (latency is recorded for failed requests too)
             error_type = self._classify_error(e)
-            self.metrics.record_failure(error_type)
-            
-            # Record latency for failed requests too
-            self.metrics.latency_history.append(latency)
+            self.metrics.record_failure(error_type, latency)
             
             # Evaluate circuit state
             await self._evaluate_circuit()
@@ -911,12 +1966,10 @@ class AdaptiveCircuitBreaker:
     async def _evaluate_circuit(self):
         """Evaluate metrics and transition state if needed"""
         
-        # Calculate failure rate over sliding window
-        window_size = min(self.sliding_window_size, self.metrics.request_count)
-        if window_size < 10:  # Need minimum data
+        # Failure rate over the sliding window, maintained incrementally
+        if self.metrics.window_count < 10:  # Need minimum data
             return
         
-        # Get recent failures (simplified)
         recent_failure_rate = self.metrics.failure_rate
         
         # Adaptive threshold adjustment based on time of day, etc.
@@ -990,11 +2043,11 @@ class AdaptiveCircuitBreaker:
         else:
             self.adaptive_failure_threshold = self.failure_threshold
         
-        # Adjust recovery timeout based on error types
-        if 'rate_limit' in self.metrics.error_types:
+        # Adjust recovery timeout based on recent error types
+        if 'rate_limit' in self.metrics.window_error_types:
             # Longer recovery for rate limiting
             self.adaptive_recovery_timeout = timedelta(minutes=5)
-        elif 'timeout' in self.metrics.error_types:
+        elif 'timeout' in self.metrics.window_error_types:
             # Shorter recovery for timeouts
             self.adaptive_recovery_timeout = timedelta(seconds=15)
         else:
@@ -1059,11 +2112,16 @@ class AdaptiveCircuitBreaker:
             'open_until': self.open_until.isoformat() if self.open_until else None,
             'metrics': {
                 'failure_rate': self.metrics.failure_rate,
+                'lifetime_failure_rate': self.metrics.lifetime_failure_rate,
                 'avg_latency': self.metrics.avg_latency,
+                'latency_stddev': self.metrics.latency_stddev,
+                'latency_percentiles': dict(self.metrics.latency_percentiles),
+                'window_count': self.metrics.window_count,
                 'request_count': self.metrics.request_count,
                 'success_count': self.metrics.success_count,
                 'failure_count': self.metrics.failure_count,
-                'error_types': dict(self.metrics.error_types)
+                'error_types': dict(self.metrics.error_types),
+                'window_error_types': dict(self.metrics.window_error_types)
             },
             'adaptive_settings': {
                 'failure_threshold': self.adaptive_failure_threshold,
@@ -1102,7 +2160,7 @@ class CircuitBreakerRegistry:
         """Reset all circuit breakers (for testing)"""
         for breaker in cls._breakers.values():
             breaker.state = CircuitState.CLOSED
-            breaker.metrics = CircuitMetrics()
+            breaker.metrics = CircuitMetrics(window_size=breaker.sliding_window_size)
         cls._breakers.clear()
 
 class CircuitOpenError(Exception):
@@ -1152,22 +2210,756 @@ async def api_call_with_circuit_breaker():
 
 **Solution:** Multi-stage deduplication with semantic similarity detection.
 
+Semantic lookups go through an in-process ANN index over a memory-mapped float32 matrix, persisted next to `deduplication.db`:
+
+```python
+# intelligence/vector_index.py
+import os
+import json
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+# One-byte format tags for embedding blobs (pickle blobs start with 0x80)
+EMBEDDING_FORMATS = {'float32': b'f', 'float16': b'h', 'int8': b'q'}
+
+def encode_embedding(vector, dtype: str = 'float32') -> bytes:
+    """Compact embedding blob: a format tag followed by raw little-endian values"""
+    vector = np.asarray(vector, dtype=np.float32).ravel()
+    
+    if dtype == 'float32':
+        return b'f' + vector.astype('<f4').tobytes()
+    if dtype == 'float16':
+        return b'h' + vector.astype('<f2').tobytes()
+    if dtype == 'int8':
+        # Symmetric quantization with one float32 scale per vector
+        scale = float(np.abs(vector).max()) / 127 or 1.0
+        return b'q' + np.float32(scale).astype('<f4').tobytes() + np.round(vector / scale).astype(np.int8).tobytes()
+    
+    raise ValueError(f"Unsupported embedding dtype: {dtype}")
+
+def decode_embedding(blob: bytes) -> np.ndarray:
+    """Decode an encode_embedding blob to float32 (zero-copy for float32 blobs)"""
+    tag, body = blob[:1], memoryview(blob)[1:]
+    
+    if tag == b'f':
+        return np.frombuffer(body, dtype='<f4')
+    if tag == b'h':
+        return np.frombuffer(body, dtype='<f2').astype(np.float32)
+    if tag == b'q':
+        scale = np.frombuffer(body[:4], dtype='<f4')[0]
+        return np.frombuffer(body[4:], dtype=np.int8).astype(np.float32) * scale
+    
+    raise ValueError(f"Unknown embedding blob format: {bytes(tag)!r}")
+
+class FlatIndex:
+    """Exact cosine search over a memory-mapped float32 matrix of normalized vectors
+    
+    Vectors are appended to `<path>.f32` and ids to `<path>.ids`, so inserts
+    never rewrite what is already on disk. Row i of the matrix belongs to
+    ids[i]; `rows` maps each id_hash back to its row.
+    """
+    
+    def __init__(self, path: str, dim: Optional[int] = None):
+        self.path = path
+        self.dim = dim
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._count = 0
+        self._map: Optional[np.ndarray] = None
+        self.load()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    @property
+    def vectors(self) -> np.ndarray:
+        """Zero-copy view of the matrix file, remapped after inserts"""
+        if self._map is None or len(self._map) != self._count:
+            if self._count:
+                self._map = np.memmap(self.path + '.f32', dtype=np.float32, mode='r',
+                                      shape=(self._count, self.dim))
+            else:
+                self._map = np.empty((0, self.dim or 0), dtype=np.float32)
+        return self._map
+    
+    def get(self, id_hash: str) -> Optional[np.ndarray]:
+        """Stored (normalized) vector for id_hash"""
+        row = self.rows.get(id_hash)
+        return None if row is None else self.vectors[row]
+    
+    @staticmethod
+    def normalize(vectors) -> np.ndarray:
+        """Unit-normalize rows so cosine similarity is a dot product"""
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+    
+    def add(self, ids: List[str], vectors):
+        """Insert vectors incrementally and append them to disk"""
+        vectors = self.normalize(vectors)
+        if len(ids) != len(vectors):
+            raise ValueError(f"Got {len(ids)} ids for {len(vectors)} vectors")
+        
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            self._save_meta()
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dimensional vectors, got {vectors.shape[1]}")
+        
+        # Vectors first: load() drops rows whose id never made it to disk
+        with open(self.path + '.f32', 'ab') as f:
+            f.write(vectors.tobytes())
+        with open(self.path + '.ids', 'a') as f:
+            f.write(''.join(f"{id_hash}\n" for id_hash in ids))
+        
+        start = self._count
+        self.ids.extend(ids)
+        self.rows.update((id_hash, start + i) for i, id_hash in enumerate(ids))
+        self._count += len(vectors)
+        
+        self._on_add(start)
+    
+    def search(self, vector, k: int = 5, threshold: float = 0.0) -> List[Tuple[str, float]]:
+        """Top-k (id, cosine similarity) pairs scoring at least threshold"""
+        return self.search_many([vector], k=k, threshold=threshold)[0]
+    
+    def search_many(self, vectors, k: int = 5, threshold: float = 0.0) -> List[List[Tuple[str, float]]]:
+        """search() for a batch of queries, scored with one matrix multiply"""
+        queries = self.normalize(vectors)
+        if not self._count:
+            return [[] for _ in range(len(queries))]
+        
+        # Every query is scored against the union of the batch's candidates
+        rows = self._candidates(queries)
+        candidates = self.vectors if rows is None else self.vectors[rows]
+        
+        # Keep the score matrix around 64 MB however large the corpus is
+        block = max(1, (16 * 1024 * 1024) // max(len(candidates), 1))
+        results = []
+        for start in range(0, len(queries), block):
+            for scores in queries[start:start + block] @ candidates.T:
+                results.append(self._top_k(scores, rows, k, threshold))
+        return results
+    
+    def _top_k(self, scores: np.ndarray, rows: Optional[np.ndarray], k: int,
+               threshold: float) -> List[Tuple[str, float]]:
+        """Best k scores at or above threshold, as (id, score) pairs"""
+        if not len(scores):
+            return []
+        
+        top = np.argpartition(-scores, min(k, len(scores)) - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        
+        results = []
+        for i in top:
+            if scores[i] < threshold:
+                break
+            row = i if rows is None else rows[i]
+            results.append((self.ids[row], float(scores[i])))
+        return results
+    
+    def reset(self):
+        """Drop every vector, in memory and on disk"""
+        for suffix in self._files():
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+        self.ids = []
+        self.rows = {}
+        self._map = None
+        self._count = 0
+        if self.dim is not None:
+            self._save_meta()
+    
+    def load(self):
+        """Load the persisted matrix, discarding rows torn by a crash mid-insert"""
+        if not os.path.exists(self.path + '.meta.json'):
+            return
+        
+        with open(self.path + '.meta.json') as f:
+            meta = json.load(f)
+        self.dim = meta['dim']
+        self._load_meta(meta)
+        
+        # The matrix itself is only mapped, never read, at load time
+        row_bytes = self.dim * 4
+        matrix_bytes = os.path.getsize(self.path + '.f32') if os.path.exists(self.path + '.f32') else 0
+        ids = []
+        if os.path.exists(self.path + '.ids'):
+            with open(self.path + '.ids') as f:
+                ids = f.read().split('\n')[:-1]  # an unterminated last line is torn
+        
+        count = min(matrix_bytes // row_bytes, len(ids))
+        if count * row_bytes != matrix_bytes or count != len(ids):
+            with open(self.path + '.f32', 'ab') as f:
+                f.truncate(count * row_bytes)
+            with open(self.path + '.ids', 'w') as f:
+                f.write(''.join(f"{id_hash}\n" for id_hash in ids[:count]))
+        
+        self.ids = ids[:count]
+        self.rows = {id_hash: row for row, id_hash in enumerate(self.ids)}
+        self._count = count
+        self._map = None
+        self._on_load()
+    
+    def _read_array(self, suffix: str, dtype) -> np.ndarray:
+        """Read a raw array file, empty if it does not exist"""
+        if not os.path.exists(self.path + suffix):
+            return np.empty(0, dtype=dtype)
+        return np.fromfile(self.path + suffix, dtype=dtype)
+    
+    def _candidates(self, queries: np.ndarray) -> Optional[np.ndarray]:
+        """Rows worth scoring for a batch of queries (None scans everything)"""
+        return None
+    
+    def _on_add(self, start: int):
+        pass
+    
+    def _on_load(self):
+        pass
+    
+    def _files(self) -> List[str]:
+        return ['.f32', '.ids']
+    
+    def _meta(self) -> dict:
+        return {'dim': self.dim}
+    
+    def _load_meta(self, meta: dict):
+        pass
+    
+    def _save_meta(self):
+        with open(self.path + '.meta.json.tmp', 'w') as f:
+            json.dump(self._meta(), f)
+        os.replace(self.path + '.meta.json.tmp', self.path + '.meta.json')
+
+class IVFIndex(FlatIndex):
+    """Inverted-file ANN index: k-means centroids partition the matrix and
+    queries only score the rows of the nprobe closest partitions.
+    
+    Until enough vectors exist to train the centroids it behaves as a flat
+    index. It retrains once the corpus has grown 4x since the last training,
+    which keeps training cost amortized across inserts.
+    """
+    
+    MIN_POINTS_PER_LIST = 40
+    MAX_TRAINING_POINTS_PER_LIST = 256
+    
+    def __init__(self, path: str, dim: Optional[int] = None, nlist: int = 256, nprobe: int = 8):
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.centroids: Optional[np.ndarray] = None
+        self.trained_size = 0
+        self.lists: List[List[int]] = []
+        super().__init__(path, dim)
+    
+    def train(self, iterations: int = 10, seed: int = 0):
+        """Fit centroids with spherical k-means and reassign every row"""
+        rng = np.random.default_rng(seed)
+        sample = self.vectors
+        max_sample = self.nlist * self.MAX_TRAINING_POINTS_PER_LIST
+        if len(sample) > max_sample:
+            sample = sample[np.sort(rng.choice(len(sample), max_sample, replace=False))]
+        
+        centroids = sample[rng.choice(len(sample), self.nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            
+            # Reseed empty partitions from random samples
+            empty = np.bincount(labels, minlength=self.nlist) == 0
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = self.normalize(sums)
+        
+        self.centroids = centroids
+        self.trained_size = self._count
+        np.save(self.path + '.centroids.npy', centroids)
+        self._save_meta()
+        
+        self.lists = [[] for _ in range(self.nlist)]
+        if os.path.exists(self.path + '.assign'):
+            os.remove(self.path + '.assign')
+        self._assign(0)
+    
+    def _assign(self, start: int):
+        """Route rows [start, count) to their nearest centroid and journal it"""
+        for batch_start in range(start, self._count, 65536):
+            batch = self.vectors[batch_start:batch_start + 65536]
+            labels = np.argmax(batch @ self.centroids.T, axis=1).astype(np.int32)
+            for offset, label in enumerate(labels):
+                self.lists[label].append(batch_start + offset)
+            with open(self.path + '.assign', 'ab') as f:
+                f.write(labels.tobytes())
+    
+    def _candidates(self, queries: np.ndarray) -> Optional[np.ndarray]:
+        if self.centroids is None:
+            return None
+        
+        nprobe = min(self.nprobe, self.nlist)
+        probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        return np.concatenate([np.asarray(self.lists[c], dtype=np.int64) for c in np.unique(probes)])
+    
+    def _on_add(self, start: int):
+        if self.centroids is None or self._count >= 4 * self.trained_size:
+            if self._count >= self.nlist * self.MIN_POINTS_PER_LIST:
+                self.train()
+            return
+        self._assign(start)
+    
+    def _on_load(self):
+        if not os.path.exists(self.path + '.centroids.npy'):
+            return
+        
+        self.centroids = np.load(self.path + '.centroids.npy')
+        self.lists = [[] for _ in range(self.nlist)]
+        labels = self._read_array('.assign', np.int32)[:self._count]
+        for row, label in enumerate(labels):
+            self.lists[label].append(row)
+        
+        # Route rows added after the last journaled assignment
+        if os.path.exists(self.path + '.assign'):
+            os.truncate(self.path + '.assign', len(labels) * 4)
+        self._assign(len(labels))
+    
+    def reset(self):
+        self.centroids = None
+        self.trained_size = 0
+        self.lists = []
+        super().reset()
+    
+    def _files(self) -> List[str]:
+        return super()._files() + ['.centroids.npy', '.assign']
+    
+    def _meta(self) -> dict:
+        return {'dim': self.dim, 'nlist': self.nlist, 'trained_size': self.trained_size}
+    
+    def _load_meta(self, meta: dict):
+        if meta.get('nlist', self.nlist) != self.nlist:
+            # Centroids were trained for a different partition count
+            for suffix in ('.centroids.npy', '.assign'):
+                if os.path.exists(self.path + suffix):
+                    os.remove(self.path + suffix)
+            return
+        self.trained_size = meta.get('trained_size', 0)
+```
+
+Before any embedding is computed, a MinHash-LSH stage catches reworded and reposted near-duplicates from word shingles alone:
+
+```python
+# intelligence/minhash.py
+import re
+import hashlib
+from typing import List, Optional, Set
+import numpy as np
+import mmh3
+
+class MinHasher:
+    """MinHash signatures over word shingles, banded for LSH bucket lookups
+    
+    Two texts share a band bucket with probability 1 - (1 - J^r)^b for Jaccard
+    similarity J, r rows per band and b bands. The defaults (r = 4, b = 32)
+    surface 99% of pairs above J = 0.6, while unrelated text rarely collides.
+    """
+    
+    WORD = re.compile(r'\w+')
+    
+    def __init__(self, num_perm: int = 128, bands: int = 32, shingle_size: int = 2, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError(f"{bands} bands do not divide {num_perm} permutations")
+        
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        
+        # Multiply-shift hash family: h(x) = ((a * x + b) mod 2^64) >> 32, with odd a
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+    
+    def shingles(self, text: str) -> Set[str]:
+        """Word n-grams of the normalized text (the whole text if it is shorter)"""
+        words = self.WORD.findall(text.lower())
+        if len(words) <= self.shingle_size:
+            return {' '.join(words)} if words else set()
+        return {' '.join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+    
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """uint32 MinHash signature, or None for text without words"""
+        shingles = self.shingles(text)
+        if not shingles:
+            return None
+        
+        hashes = np.fromiter((mmh3.hash(s, signed=False) for s in shingles), dtype=np.uint64, count=len(shingles))
+        with np.errstate(over='ignore'):
+            permuted = (hashes[:, None] * self._a + self._b) >> np.uint64(32)
+        return permuted.min(axis=0).astype(np.uint32)
+    
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        """One signed 64-bit bucket key per band (SQLite INTEGER range)"""
+        keys = []
+        for band in range(self.bands):
+            digest = hashlib.blake2b(
+                signature[band * self.rows:(band + 1) * self.rows].tobytes(),
+                digest_size=8,
+                person=band.to_bytes(2, 'little')
+            ).digest()
+            keys.append(int.from_bytes(digest, 'little', signed=True))
+        return keys
+    
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity: the fraction of agreeing minima"""
+        return float(np.mean(a == b))
+```
+
+Embeddings are cached in a byte-bounded segmented LRU, optionally backed by a SQLite tier so they survive restarts:
+
+```python
+# intelligence/embedding_cache.py
+import time
+import sqlite3
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import numpy as np
+
+from intelligence.vector_index import encode_embedding, decode_embedding
+
+class EmbeddingCache:
+    """Byte-bounded embedding cache with segmented-LRU eviction and optional TTL
+    
+    New entries land in a probation segment and move to the protected segment
+    on their second hit, so a burst of one-off texts cannot flush embeddings
+    that are reused across cycles. With policy='lru' everything stays in one
+    segment. Memory misses fall through to the disk tier when disk_path is set.
+    """
+    
+    ENTRY_OVERHEAD = 96  # key, tuple and dict slot, per entry
+    
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None,
+        policy: str = 'slru',
+        protected_ratio: float = 0.8,
+        disk_path: Optional[str] = None,
+        disk_max_entries: int = 1_000_000
+    ):
+        if policy not in ('lru', 'slru'):
+            raise ValueError(f"Unknown cache policy: {policy}")
+        
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.policy = policy
+        self.protected_bytes_limit = int(max_bytes * protected_ratio) if policy == 'slru' else 0
+        self.disk_max_entries = disk_max_entries
+        
+        # key -> (embedding, expires_at, size_bytes)
+        self._probation: OrderedDict = OrderedDict()
+        self._protected: OrderedDict = OrderedDict()
+        self._probation_bytes = 0
+        self._protected_bytes = 0
+        
+        self.counters = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0}
+        
+        self._disk = None
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path, check_same_thread=False)
+            self._disk.execute('PRAGMA journal_mode=WAL')
+            self._disk.execute('PRAGMA synchronous=NORMAL')
+            self._disk.execute('''
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    embedding BLOB NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            ''')
+            self._disk.execute('CREATE INDEX IF NOT EXISTS idx_created_at ON embeddings(created_at)')
+            self._disk.commit()
+            self._disk_entries = self._disk.execute('SELECT COUNT(*) FROM embeddings').fetchone()[0]
+    
+    def __len__(self) -> int:
+        return len(self._probation) + len(self._protected)
+    
+    @property
+    def size_bytes(self) -> int:
+        return self._probation_bytes + self._protected_bytes
+    
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Cached embeddings for keys, checking memory then (in one query) disk"""
+        found = {}
+        now = time.time()
+        
+        for key in keys:
+            embedding = self._get_memory(key, now)
+            if embedding is not None:
+                found[key] = embedding
+        
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing and self._disk is not None:
+            for key, embedding in self._get_disk(missing, now).items():
+                found[key] = embedding
+                self._put_memory(key, embedding, now)
+                self.counters['disk_hits'] += 1
+        
+        self.counters['misses'] += sum(1 for key in keys if key not in found)
+        return found
+    
+    def put_many(self, embeddings: Dict[str, np.ndarray]):
+        """Cache new embeddings in memory and, write-through, on disk"""
+        now = time.time()
+        for key, embedding in embeddings.items():
+            # Copy, so a row view cannot pin the whole batch array it came from
+            self._put_memory(key, np.array(embedding, dtype=np.float32), now)
+        
+        if self._disk is not None and embeddings:
+            with self._disk:
+                self._disk.executemany(
+                    'INSERT OR REPLACE INTO embeddings (key, embedding, created_at) VALUES (?, ?, ?)',
+                    [(key, encode_embedding(embedding), now) for key, embedding in embeddings.items()]
+                )
+            self._disk_entries += len(embeddings)  # an upper bound until the next trim recounts
+            self._trim_disk()
+    
+    def stats(self) -> Dict:
+        lookups = self.counters['hits'] + self.counters['disk_hits'] + self.counters['misses']
+        return {
+            **self.counters,
+            'entries': len(self),
+            'size_bytes': self.size_bytes,
+            'max_bytes': self.max_bytes,
+            'hit_rate': (self.counters['hits'] + self.counters['disk_hits']) / lookups if lookups else 0.0
+        }
+    
+    def clear(self):
+        self._probation.clear()
+        self._protected.clear()
+        self._probation_bytes = self._protected_bytes = 0
+        if self._disk is not None:
+            with self._disk:
+                self._disk.execute('DELETE FROM embeddings')
+            self._disk_entries = 0
+    
+    def close(self):
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+    
+    def _get_memory(self, key: str, now: float) -> Optional[np.ndarray]:
+        if key in self._protected:
+            segment = self._protected
+        elif key in self._probation:
+            segment = self._probation
+        else:
+            return None
+        
+        embedding, expires_at, size = segment[key]
+        if expires_at is not None and expires_at <= now:
+            self._remove(segment, key)
+            self.counters['expirations'] += 1
+            return None
+        
+        self.counters['hits'] += 1
+        if segment is self._probation and self.policy == 'slru':
+            # Second hit: promote, demoting the protected LRU entries that no longer fit
+            self._remove(self._probation, key)
+            self._protected[key] = (embedding, expires_at, size)
+            self._protected_bytes += size
+            while self._protected_bytes > self.protected_bytes_limit and len(self._protected) > 1:
+                demoted_key, demoted = self._protected.popitem(last=False)
+                self._protected_bytes -= demoted[2]
+                self._probation[demoted_key] = demoted
+                self._probation_bytes += demoted[2]
+        else:
+            segment.move_to_end(key)
+        return embedding
+    
+    def _put_memory(self, key: str, embedding: np.ndarray, now: float):
+        for segment in (self._probation, self._protected):
+            if key in segment:
+                self._remove(segment, key)
+        
+        size = embedding.nbytes + len(key) + self.ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        
+        expires_at = now + self.ttl_seconds if self.ttl_seconds is not None else None
+        self._probation[key] = (embedding, expires_at, size)
+        self._probation_bytes += size
+        
+        while self.size_bytes > self.max_bytes:
+            segment = self._probation if self._probation else self._protected
+            evicted_key = next(iter(segment))
+            self._remove(segment, evicted_key)
+            self.counters['evictions'] += 1
+    
+    def _remove(self, segment: OrderedDict, key: str):
+        _, _, size = segment.pop(key)
+        if segment is self._probation:
+            self._probation_bytes -= size
+        else:
+            self._protected_bytes -= size
+    
+    def _get_disk(self, keys: List[str], now: float) -> Dict[str, np.ndarray]:
+        oldest = now - self.ttl_seconds if self.ttl_seconds is not None else 0.0
+        found = {}
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            rows = self._disk.execute(
+                f'SELECT key, embedding FROM embeddings WHERE key IN ({",".join("?" * len(batch))}) AND created_at > ?',
+                (*batch, oldest)
+            ).fetchall()
+            found.update((key, decode_embedding(blob)) for key, blob in rows)
+        return found
+    
+    def _trim_disk(self):
+        """Drop expired rows, then the oldest ones once the tier is 10% over its limit"""
+        with self._disk:
+            if self.ttl_seconds is not None:
+                self._disk.execute('DELETE FROM embeddings WHERE created_at <= ?', (time.time() - self.ttl_seconds,))
+            if self._disk_entries <= self.disk_max_entries * 1.1:
+                return
+            
+            count = self._disk.execute('SELECT COUNT(*) FROM embeddings').fetchone()[0]
+            if count > self.disk_max_entries:
+                self._disk.execute(
+                    'DELETE FROM embeddings WHERE key IN '
+                    '(SELECT key FROM embeddings ORDER BY created_at LIMIT ?)',
+                    (count - self.disk_max_entries,)
+                )
+            self._disk_entries = min(count, self.disk_max_entries)
+```
+
+Exact-match lookups are screened by a rolling, time-sliced Bloom filter, memory-mapped so its bit arrays persist across restarts:
+
+```python
+# intelligence/bloom_filter.py
+import os
+import math
+import time
+import hashlib
+from typing import Iterable, List, Optional
+import numpy as np
+
+class RollingBloomFilter:
+    """Bloom filter over a sliding time window, one bit array per slice in a ring
+    
+    A key is added to the slice covering its timestamp; slices older than the
+    window are cleared when their ring position is reused, and ignored by
+    lookups before then. Bits and slice epochs live in memory-mapped files
+    (`<path>.bits`, `<path>.epochs`), so they survive restarts.
+    """
+    
+    def __init__(self, path: str, window_seconds: float, slices: int,
+                 slice_capacity: int, error_rate: float = 0.001):
+        self.path = path
+        self.window_seconds = window_seconds
+        self.slices = slices
+        self.slice_seconds = window_seconds / slices
+        
+        # Standard sizing: m = -n ln(p) / ln(2)^2 bits, k = (m / n) ln(2) hashes
+        num_bits = -slice_capacity * math.log(error_rate) / math.log(2) ** 2
+        self.num_bits = max(512, int(math.ceil(num_bits / 64)) * 64)
+        self.num_hashes = max(1, round(self.num_bits / slice_capacity * math.log(2)))
+        
+        # Missing files, or files sized for another geometry, start empty
+        row_bytes = self.num_bits // 8
+        self.created = (
+            not os.path.exists(path + '.bits')
+            or os.path.getsize(path + '.bits') != slices * row_bytes
+            or not os.path.exists(path + '.epochs')
+            or os.path.getsize(path + '.epochs') != slices * 8
+        )
+        mode = 'w+' if self.created else 'r+'
+        self.bits = np.memmap(path + '.bits', dtype=np.uint8, mode=mode, shape=(slices, row_bytes))
+        self.epochs = np.memmap(path + '.epochs', dtype=np.int64, mode=mode, shape=(slices,))
+        if self.created:
+            self.epochs[:] = -1
+    
+    def _positions(self, keys: List[str]) -> np.ndarray:
+        """(len(keys), num_hashes) bit positions by double hashing one 128-bit digest"""
+        digests = b''.join(hashlib.blake2b(key.encode(), digest_size=16).digest() for key in keys)
+        h1, h2 = np.frombuffer(digests, dtype='<u8').reshape(-1, 2).T
+        i = np.arange(self.num_hashes, dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            return ((h1[:, None] + i * (h2[:, None] | np.uint64(1))) % np.uint64(self.num_bits)).astype(np.int64)
+    
+    def _epoch(self, timestamp: float) -> int:
+        return int(timestamp // self.slice_seconds)
+    
+    def add_many(self, keys: List[str], timestamps: Iterable[float], now: Optional[float] = None):
+        """Add keys to the slices covering their timestamps (keys outside the window are skipped)"""
+        if not keys:
+            return
+        
+        current = self._epoch(time.time() if now is None else now)
+        epochs = np.minimum([self._epoch(ts) for ts in timestamps], current)
+        positions = self._positions(keys)
+        
+        for epoch in np.unique(epochs):
+            if epoch <= current - self.slices:
+                continue
+            
+            row = int(epoch) % self.slices
+            if self.epochs[row] != epoch:
+                if self.epochs[row] > epoch:
+                    continue  # the ring has already moved past this slice
+                self.bits[row] = 0
+                self.epochs[row] = epoch
+            
+            slice_positions = positions[epochs == epoch].ravel()
+            np.bitwise_or.at(self.bits[row], slice_positions >> 3,
+                             np.left_shift(1, slice_positions & 7).astype(np.uint8))
+    
+    def contains_many(self, keys: List[str], now: Optional[float] = None) -> np.ndarray:
+        """False means definitely not added within the window; True means probably"""
+        if not keys:
+            return np.zeros(0, dtype=bool)
+        
+        current = self._epoch(time.time() if now is None else now)
+        live = np.flatnonzero(self.epochs > current - self.slices)
+        if not len(live):
+            return np.zeros(len(keys), dtype=bool)
+        
+        positions = self._positions(keys)
+        # (live slices, keys, hashes): every hash bit set in at least one slice
+        set_bits = (self.bits[live[:, None, None], positions >> 3] >> (positions & 7).astype(np.uint8)) & 1
+        return set_bits.all(axis=2).any(axis=0)
+    
+    def clear(self):
+        self.bits[:] = 0
+        self.epochs[:] = -1
+    
+    def flush(self):
+        self.bits.flush()
+        self.epochs.flush()
+```
+
 ```python
 # intelligence/deduplicator.py
 import hashlib
 import json
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Any, Callable, Dict, List, Optional, Tuple, Set
 import asyncio
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import sqlite3
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 import pickle
+import os
+import queue
+import threading
 import numpy as np
 from sentence_transformers import SentenceTransformer
 import redis
 import mmh3  # MurmurHash for fast hashing
 
+from intelligence.vector_index import FlatIndex, IVFIndex, encode_embedding, decode_embedding
+from intelligence.minhash import MinHasher
+from intelligence.embedding_cache import EmbeddingCache
+from intelligence.bloom_filter import RollingBloomFilter
+
 @dataclass
 class ContentFingerprint:
     """Multi-dimensional fingerprint for content"""
@@ -1245,16 +3037,195 @@ class ContentFingerprint:
         
         return recursive_structure(content)
 
+class DisjointSet:
+    """Union-find over id hashes: union by size, path compression
+    
+    Member lists are merged small-into-large alongside the parent pointers,
+    so a whole cluster can be listed without scanning every node.
+    """
+    
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+        self.members: Dict[str, List[str]] = {}
+    
+    def find(self, item: str) -> str:
+        root = item
+        while self.parent.get(root, root) != root:
+            root = self.parent[root]
+        
+        while item != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+    
+    def union(self, a: str, b: str) -> Optional[Tuple[str, str]]:
+        """Merge the sets of a and b, returning the new (child root, parent root) link"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return None
+        
+        members_a = self.members.setdefault(root_a, [root_a])
+        members_b = self.members.setdefault(root_b, [root_b])
+        if len(members_a) < len(members_b):
+            root_a, root_b, members_a, members_b = root_b, root_a, members_b, members_a
+        
+        self.parent[root_b] = root_a
+        members_a.extend(members_b)
+        del self.members[root_b]
+        return root_b, root_a
+    
+    def cluster(self, item: str) -> List[str]:
+        return list(self.members.get(self.find(item), [item]))
+    
+    def clusters(self, min_size: int = 2) -> List[List[str]]:
+        """Every set of at least min_size members, largest first"""
+        return sorted(
+            (list(members) for members in self.members.values() if len(members) >= min_size),
+            key=len,
+            reverse=True
+        )
+    
+    def load(self, links: List[Tuple[str, str]]):
+        """Restore persisted (child, parent) links"""
+        self.parent = dict(links)
+        self.members = {}
+        for node in set(self.parent) | set(self.parent.values()):
+            self.members.setdefault(self.find(node), []).append(node)
+
+class SQLitePool:
+    """Persistent SQLite connections: one writer plus a pool of readers
+    
+    Connections are opened, and their PRAGMAs issued, once; sqlite3 keeps a
+    prepared-statement cache per connection, so repeated lookups skip the
+    parse. WAL mode lets readers run while the writer commits. Async writes
+    run on a dedicated thread so commits never block the event loop.
+    """
+    
+    PRAGMAS = (
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA cache_size=-10000'  # 10MB cache
+    )
+    
+    def __init__(self, db_path: str, readers: int = 4, cached_statements: int = 256):
+        self.db_path = db_path
+        self.cached_statements = cached_statements
+        self._idle_readers: queue.LifoQueue = queue.LifoQueue()
+        self._reader_slots = threading.BoundedSemaphore(readers)
+        self._write_lock = threading.Lock()
+        self._writer = self._connect()
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dedup-writer')
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def reader(self):
+        """Borrow a read cursor, opening a connection while the pool has free slots"""
+        with self._reader_slots:
+            try:
+                conn = self._idle_readers.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            
+            cursor = conn.cursor()
+            try:
+                yield cursor
+            finally:
+                # An unfinished statement would pin this connection to a stale snapshot
+                cursor.close()
+                self._idle_readers.put(conn)
+    
+    @contextmanager
+    def writer(self):
+        """Cursor on the writer connection inside one transaction (committed on success)"""
+        with self._write_lock:
+            cursor = self._writer.cursor()
+            try:
+                with self._writer:
+                    yield cursor
+            finally:
+                cursor.close()
+    
+    async def write(self, operation: Callable[[sqlite3.Cursor], Any]) -> Any:
+        """Run operation(cursor) in one transaction on the writer thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._write_executor, self._run_write, operation)
+    
+    def _run_write(self, operation: Callable[[sqlite3.Cursor], Any]) -> Any:
+        with self.writer() as cursor:
+            return operation(cursor)
+    
+    def close(self):
+        """Wait for queued writes, then close every connection"""
+        self._write_executor.shutdown(wait=True)
+        with self._write_lock:
+            self._writer.close()
+        while True:
+            try:
+                self._idle_readers.get_nowait().close()
+            except queue.Empty:
+                break
+
 class SemanticDeduplicator:
     """Advanced deduplication with semantic similarity detection"""
     
-    def __init__(self, db_path: str = "vault/meta/deduplication.db"):
+    # Pluggable vector index backends for semantic lookups
+    VECTOR_INDEXES = {'flat': FlatIndex, 'ivf': IVFIndex}
+    
+    # PRAGMA user_version once embeddings blobs are encode_embedding blobs
+    SCHEMA_VERSION = 1
+
+    # Similarity edges strong enough to join duplicate clusters
+    CLUSTER_THRESHOLD = 0.9
+    
+    EMBEDDING_MODEL = 'all-MiniLM-L6-v2'  # Lightweight model
+
+    # Fingerprints older than this are removed by cleanup_old_fingerprints
+    RETENTION_DAYS = 90
+
+    # Existence filter window: (window seconds, ring slices), one slice per day.
+    # It only screens the exact-match stage while the oldest fingerprint is
+    # newer than the window minus a slice, so it covers the retention plus that
+    # slice and a day of slack for the cleanup cadence.
+    EXISTENCE_WINDOW = ((RETENTION_DAYS + 2) * 86400, RETENTION_DAYS + 2)
+    
+    def __init__(self, db_path: str = "vault/meta/deduplication.db", vector_index: str = 'ivf',
+                 embedding_dtype: str = 'float32', embedding_cache: Optional[EmbeddingCache] = None,
+                 daily_capacity: int = 50000):
         self.db_path = db_path
+        self.embedding_dtype = embedding_dtype  # 'float32', 'float16' or 'int8'
+        self.db = SQLitePool(db_path)
         self._init_database()
+        self.migrate_embedding_blobs()
+
+        # In-process existence filter, so negative exact-match lookups stay off SQLite and Redis
+        self.daily_capacity = daily_capacity  # expected new fingerprints per day
+        self._init_bloom_filter()
+        
+        # ANN index over stored embeddings, persisted next to the database
+        self.vector_index = self.VECTOR_INDEXES[vector_index](
+            os.path.splitext(db_path)[0] + '.vectors'
+        )
+        self._sync_vector_index()
+
+        # Duplicate clusters, maintained incrementally as similarity edges are stored
+        self.clusters = DisjointSet()
+        self._load_duplicate_clusters()
+        
+        # LSH signatures for the near-duplicate stage
+        self.minhasher = MinHasher()
         
         # Initialize embedding model (lazy load)
         self.embedding_model = None
-        self.embedding_cache = {}
+
+        # By default the cache keeps a disk tier next to the database
+        self.embedding_cache = embedding_cache or EmbeddingCache(
+            disk_path=os.path.splitext(db_path)[0] + '.embeddings.db'
+        )
         
         # Initialize Redis for distributed deduplication
         self.redis_client = None
@@ -1266,14 +3237,15 @@ class SemanticDeduplicator:
             'duplicates_found': 0,
             'storage_saved_bytes': 0,
             'semantic_matches': 0,
-            'exact_matches': 0
+            'exact_matches': 0,
+            'near_matches': 0,
+            'embeddings_skipped': 0,
+            'filter_negatives': 0
         }
     
     def _init_database(self):
         """Initialize SQLite database for fingerprint storage"""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            
+        with self.db.writer() as cursor:
             # Create fingerprints table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS fingerprints (
@@ -1303,21 +3275,146 @@ class SemanticDeduplicator:
                 ON fingerprints(timestamp)
             ''')
             
-            # Create similarity index table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS similarity_index (
-                    id_hash1 TEXT,
-                    id_hash2 TEXT,
-                    similarity_score REAL,
-                    detection_method TEXT,
-                    detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    PRIMARY KEY (id_hash1, id_hash2),
-                    FOREIGN KEY (id_hash1) REFERENCES fingerprints(id_hash),
-                    FOREIGN KEY (id_hash2) REFERENCES fingerprints(id_hash)
-                )
-            ''')
+            # Create similarity index table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS similarity_index (
+                    id_hash1 TEXT,
+                    id_hash2 TEXT,
+                    similarity_score REAL,
+                    detection_method TEXT,
+                    detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (id_hash1, id_hash2),
+                    FOREIGN KEY (id_hash1) REFERENCES fingerprints(id_hash),
+                    FOREIGN KEY (id_hash2) REFERENCES fingerprints(id_hash)
+                )
+            ''')
+            
+            # MinHash signatures and their LSH band buckets
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS minhash_signatures (
+                    id_hash TEXT PRIMARY KEY,
+                    signature BLOB NOT NULL,
+                    FOREIGN KEY (id_hash) REFERENCES fingerprints(id_hash)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS lsh_buckets (
+                    bucket INTEGER,
+                    id_hash TEXT,
+                    PRIMARY KEY (bucket, id_hash)
+                ) WITHOUT ROWID
+            ''')
+
+            # Union-find parent links (cluster roots have no row)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS duplicate_clusters (
+                    id_hash TEXT PRIMARY KEY,
+                    parent TEXT NOT NULL
+                )
+            ''')
+    
+    def migrate_embedding_blobs(self, batch_size: int = 10000) -> int:
+        """One-shot conversion of pickled embeddings to compact binary blobs"""
+        with self.db.writer() as cursor:
+            cursor.execute('PRAGMA user_version')
+            if cursor.fetchone()[0] >= self.SCHEMA_VERSION:
+                return 0
+            
+            # Pickle protocol 2+ blobs start with 0x80; binary blobs start with a format tag,
+            # so converted rows drop out of the query and each batch re-selects the rest
+            migrated = 0
+            while True:
+                cursor.execute(
+                    "SELECT id_hash, embeddings FROM fingerprints WHERE substr(embeddings, 1, 1) = X'80' LIMIT ?",
+                    (batch_size,)
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                
+                converted = []
+                for stored_hash, embeddings_blob in rows:
+                    try:
+                        blob = encode_embedding(pickle.loads(embeddings_blob), self.embedding_dtype)
+                    except Exception:
+                        blob = None  # unreadable embeddings are dropped, as in rebuild_vector_index
+                    converted.append((blob, stored_hash))
+                
+                cursor.executemany('UPDATE fingerprints SET embeddings = ? WHERE id_hash = ?', converted)
+                migrated += len(converted)
+            
+            # The version bump commits with the converted rows
+            cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        
+        return migrated
+    
+    def _sync_vector_index(self):
+        """Rebuild the vector index if it disagrees with SQLite"""
+        with self.db.reader() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM fingerprints WHERE embeddings IS NOT NULL')
+            stored = cursor.fetchone()[0]
+        
+        if stored != len(self.vector_index):
+            self.rebuild_vector_index()
+
+    def _load_duplicate_clusters(self):
+        """Load the persisted union-find, building it once for databases that predate it"""
+        with self.db.reader() as cursor:
+            cursor.execute('SELECT id_hash, parent FROM duplicate_clusters')
+            links = cursor.fetchall()
+            cursor.execute(
+                'SELECT EXISTS (SELECT 1 FROM similarity_index WHERE similarity_score > ?)',
+                (self.CLUSTER_THRESHOLD,)
+            )
+            has_edges = cursor.fetchone()[0]
+        
+        if has_edges and not links:
+            self.rebuild_duplicate_clusters()
+        else:
+            self.clusters.load(links)
+    
+    def rebuild_duplicate_clusters(self) -> int:
+        """Recompute every duplicate cluster from similarity_index, returning the cluster count"""
+        clusters = DisjointSet()
+        with self.db.writer() as cursor:
+            cursor.execute(
+                'SELECT id_hash1, id_hash2 FROM similarity_index WHERE similarity_score > ?',
+                (self.CLUSTER_THRESHOLD,)
+            )
+            links = [link for link in (clusters.union(a, b) for a, b in cursor.fetchall()) if link]
+            
+            cursor.execute('DELETE FROM duplicate_clusters')
+            cursor.executemany('INSERT INTO duplicate_clusters (id_hash, parent) VALUES (?, ?)', links)
+        
+        self.clusters = clusters
+        return len(clusters.members)
+    
+    def rebuild_vector_index(self, batch_size: int = 10000) -> int:
+        """Rebuild the vector index from the embeddings stored in SQLite"""
+        self.vector_index.reset()
+        
+        with self.db.reader() as cursor:
+            cursor.execute(
+                'SELECT id_hash, embeddings FROM fingerprints WHERE embeddings IS NOT NULL'
+            )
             
-            conn.commit()
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                
+                ids, embeddings = [], []
+                for stored_hash, embeddings_blob in rows:
+                    try:
+                        embeddings.append(decode_embedding(embeddings_blob))
+                        ids.append(stored_hash)
+                    except Exception:
+                        continue
+                
+                if ids:
+                    self.vector_index.add(ids, np.stack(embeddings))
+        
+        return len(self.vector_index)
     
     def _init_redis(self):
         """Initialize Redis for distributed bloom filters"""
@@ -1329,214 +3426,376 @@ class SemanticDeduplicator:
                 decode_responses=False
             )
             self.redis_client.ping()
-            
-            # Initialize bloom filters
-            self._init_bloom_filters()
-            
+
         except redis.ConnectionError:
             self.redis_client = None
             print("Redis not available, using local deduplication only")
-    
-    def _init_bloom_filters(self):
-        """Initialize Redis bloom filters for fast existence checks"""
-        if not self.redis_client:
-            return
+
+    def _init_bloom_filter(self):
+        """Initialize the rolling bloom filter for fast existence checks"""
+        filter_dir = os.path.splitext(self.db_path)[0] + '.bloom'
+        os.makedirs(filter_dir, exist_ok=True)
+        
+        # Slices get twice their expected share of daily_capacity as headroom
+        window_seconds, slices = self.EXISTENCE_WINDOW
+        self.existence_filter = RollingBloomFilter(
+            os.path.join(filter_dir, 'retention'),
+            window_seconds,
+            slices,
+            slice_capacity=max(1024, int(2 * self.daily_capacity * window_seconds / slices / 86400))
+        )
         
-        # Create bloom filters for different time windows
-        time_windows = ['hour', 'day', 'week', 'month']
-        for window in time_windows:
-            filter_key = f"bloom:content:{window}"
-            # Using RedisBloom module if available
-            # For now, we'll use Redis sets as fallback
+        if self.existence_filter.created:
+            self.rebuild_existence_filter()
+        else:
+            self._refresh_oldest_fingerprint()
     
-    @contextmanager
-    def _get_db_connection(self):
-        """Get database connection with context manager"""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute('PRAGMA journal_mode=WAL')
-        conn.execute('PRAGMA synchronous=NORMAL')
-        conn.execute('PRAGMA cache_size=-10000')  # 10MB cache
+    def rebuild_existence_filter(self, batch_size: int = 10000):
+        """Refill the existence filter from fingerprints.timestamp"""
+        self.existence_filter.clear()
         
-        try:
-            yield conn
-        finally:
-            conn.close()
+        with self.db.reader() as cursor:
+            cursor.execute('SELECT id_hash, timestamp FROM fingerprints')
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                self._add_to_existence_filter([id_hash for id_hash, _ in rows], [ts for _, ts in rows])
+        
+        self.existence_filter.flush()
+        self._refresh_oldest_fingerprint()
+    
+    def _add_to_existence_filter(self, id_hashes: List[str], timestamps: List[str]):
+        # Fingerprint timestamps are naive UTC ISO strings
+        seconds = [datetime.fromisoformat(ts).replace(tzinfo=timezone.utc).timestamp() for ts in timestamps]
+        self.existence_filter.add_many(id_hashes, seconds)
+    
+    def _refresh_oldest_fingerprint(self):
+        """Track the oldest stored fingerprint: the filter only vouches for absence if it is inside its window"""
+        with self.db.reader() as cursor:
+            cursor.execute('SELECT MIN(timestamp) FROM fingerprints')
+            oldest = cursor.fetchone()[0]
+        self._oldest_fingerprint = (
+            datetime.fromisoformat(oldest).replace(tzinfo=timezone.utc).timestamp() if oldest else None
+        )
+    
+    def close(self):
+        """Flush pending writes and release database connections"""
+        self.db.close()
+        self.existence_filter.flush()
+        self.embedding_cache.close()
     
     async def is_duplicate(self, content: Dict, content_type: str) -> Tuple[bool, Optional[str]]:
         """Check if content is duplicate with semantic analysis"""
-        self.stats['total_checked'] += 1
+        return (await self.is_duplicate_many([content], content_type))[0]
+    
+    async def is_duplicate_many(
+        self,
+        contents: List[Dict],
+        content_type: str,
+        threshold: float = 0.85,  # 85% similarity threshold
+        near_threshold: float = 0.7  # estimated Jaccard similarity of word shingles
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """Check a batch of content in order, as if is_duplicate ran on each item
+        
+        Every stage does one lookup for the whole batch. Items are also compared
+        with earlier new items of the same batch, and all new fingerprints are
+        written in one transaction. Only items that get past the exact and
+        near-duplicate stages are sent to the embedding model.
+        """
+        if not contents:
+            return []
         
-        # Generate fingerprint
-        fingerprint = ContentFingerprint.from_content(content, content_type)
+        self.stats['total_checked'] += len(contents)
+        fingerprints = [ContentFingerprint.from_content(content, content_type) for content in contents]
+        texts = [ContentFingerprint._extract_semantic_text(content, content_type) for content in contents]
         
-        # Stage 1: Quick exact match (bloom filter)
-        if await self._quick_exact_match(fingerprint):
-            self.stats['exact_matches'] += 1
-            self.stats['duplicates_found'] += 1
-            return True, 'exact_match'
+        # Stage 1 lookup: exact matches
+        stored_exact = await self._find_exact_matches([fp.id_hash for fp in fingerprints])
         
-        # Stage 2: Semantic similarity check
-        semantic_duplicate, reason = await self._check_semantic_similarity(
-            fingerprint, content, content_type
+        # Stage 2 lookup: MinHash-LSH near-duplicates among stored content...
+        signatures = [self.minhasher.signature(text) for text in texts]
+        band_keys = [self.minhasher.band_keys(sig) if sig is not None else [] for sig in signatures]
+        hashed = [i for i, fp in enumerate(fingerprints) if signatures[i] is not None and fp.id_hash not in stored_exact]
+        near_matches = await self._find_near_duplicates(
+            [signatures[i] for i in hashed], [band_keys[i] for i in hashed], near_threshold
         )
+        stored_near = {item: match for item, match in zip(hashed, near_matches) if match}
+        
+        # ...and among earlier items of the batch
+        batch_near = {}
+        batch_buckets: Dict[int, List[int]] = {}
+        for item in hashed:
+            for earlier in {j for key in band_keys[item] for j in batch_buckets.get(key, ())}:
+                score = MinHasher.similarity(signatures[item], signatures[earlier])
+                if score >= near_threshold and (item not in batch_near or score > batch_near[item][1]):
+                    batch_near[item] = (earlier, score)
+            for key in band_keys[item]:
+                batch_buckets.setdefault(key, []).append(item)
+        
+        # Stage 3 lookup: batch-encode embeddings for what is left and score them against the index
+        seen_hashes = set()
+        to_embed = []
+        for item, fingerprint in enumerate(fingerprints):
+            if not (fingerprint.id_hash in stored_exact or fingerprint.id_hash in seen_hashes
+                    or item in stored_near or item in batch_near):
+                to_embed.append(item)
+            seen_hashes.add(fingerprint.id_hash)
+        self.stats['embeddings_skipped'] += len(contents) - len(to_embed)
+        
+        embeddings: List[Optional[np.ndarray]] = [None] * len(contents)
+        for item, embedding in zip(to_embed, await self._get_embeddings([texts[i] for i in to_embed])):
+            embeddings[item] = embedding
+        embedded = [i for i, embedding in enumerate(embeddings) if embedding is not None]
+        matrix_row = {item: row for row, item in enumerate(embedded)}
+        stored_similar = {}
+        if embedded:
+            matrix = FlatIndex.normalize(np.stack([embeddings[i] for i in embedded]))
+            for item, matches in zip(embedded, self.vector_index.search_many(matrix, k=5, threshold=threshold)):
+                if matches:
+                    stored_similar[item] = matches[0]
+            
+            # Pairwise similarity within the batch
+            batch_similarity = matrix @ matrix.T
         
-        if semantic_duplicate:
-            self.stats['semantic_matches'] += 1
-            self.stats['duplicates_found'] += 1
-            return True, reason
-        
-        # Stage 3: Structural similarity check
-        structural_duplicate = await self._check_structural_similarity(fingerprint)
-        
-        if structural_duplicate:
-            self.stats['duplicates_found'] += 1
-            return True, 'structural_similarity'
+        # Stage 4 lookup: recently seen structures
+        stored_structures = await self._find_recent_structures(
+            [fp.structural_hash for fp in fingerprints], content_type
+        )
         
-        # Not a duplicate - store fingerprint
-        await self._store_fingerprint(fingerprint, content, content_type)
+        results = []
+        new_items = []
+        new_hashes, new_structures, new_rows = set(), set(), []
+        similarities = []
+        
+        for item, fingerprint in enumerate(fingerprints):
+            # Stage 1: Quick exact match
+            if fingerprint.id_hash in stored_exact or fingerprint.id_hash in new_hashes:
+                self.stats['exact_matches'] += 1
+                self.stats['duplicates_found'] += 1
+                results.append((True, 'exact_match'))
+                continue
+            
+            # Stage 2: Near-duplicate text, against stored and earlier batch items
+            near = stored_near.get(item)
+            if item in batch_near and (near is None or batch_near[item][1] > near[1]):
+                earlier, score = batch_near[item]
+                near = (fingerprints[earlier].id_hash, score)
+            
+            if near:
+                # A near-duplicate of an earlier duplicate is a duplicate too,
+                # but similarity links only point at stored fingerprints
+                if near == stored_near.get(item) or near[0] in new_hashes:
+                    similarities.append((fingerprint.id_hash, near[0], near[1], 'minhash'))
+                self.stats['storage_saved_bytes'] += fingerprint.metadata['size_bytes']
+                self.stats['near_matches'] += 1
+                self.stats['duplicates_found'] += 1
+                results.append((True, f"near_duplicate_{near[1]:.2f}"))
+                continue
+            
+            # Stage 3: Semantic similarity, against stored and earlier new items
+            match = stored_similar.get(item)
+            if item in matrix_row and new_rows:
+                scores = batch_similarity[matrix_row[item], new_rows]
+                best = int(np.argmax(scores))
+                if scores[best] >= threshold and (match is None or scores[best] > match[1]):
+                    match = (fingerprints[embedded[new_rows[best]]].id_hash, float(scores[best]))
+            
+            if match:
+                similarities.append((fingerprint.id_hash, match[0], match[1], 'semantic'))
+                self.stats['storage_saved_bytes'] += fingerprint.metadata['size_bytes']
+                self.stats['semantic_matches'] += 1
+                self.stats['duplicates_found'] += 1
+                results.append((True, f"semantic_similarity_{match[1]:.2f}"))
+                continue
+            
+            # Stage 4: Structural similarity check
+            if fingerprint.structural_hash in stored_structures or fingerprint.structural_hash in new_structures:
+                self.stats['duplicates_found'] += 1
+                results.append((True, 'structural_similarity'))
+                continue
+            
+            # Not a duplicate - store fingerprint
+            new_items.append(item)
+            new_hashes.add(fingerprint.id_hash)
+            new_structures.add(fingerprint.structural_hash)
+            if item in matrix_row:
+                new_rows.append(matrix_row[item])
+            results.append((False, None))
+        
+        await self._store_fingerprints(
+            [fingerprints[i] for i in new_items],
+            [embeddings[i] for i in new_items],
+            content_type,
+            similarities,
+            [(signatures[i], band_keys[i]) for i in new_items]
+        )
         
-        return False, None
+        return results
     
-    async def _quick_exact_match(self, fingerprint: ContentFingerprint) -> bool:
-        """Quick exact match using Redis bloom filter or SQLite"""
-        
-        # Try Redis bloom filter first
-        if self.redis_client:
-            # Use Redis set as fallback for bloom filter
-            exists = self.redis_client.sismember(
-                'content:exact:hashes',
-                fingerprint.id_hash
-            )
-            if exists:
-                return True
+    async def _find_exact_matches(self, id_hashes: List[str]) -> Set[str]:
+        """Hashes already stored: the retention filter rules most out, then Redis, then SQLite"""
+        found = set()
+        
+        # Filter negatives are exact while every stored fingerprint falls inside the window
+        retention = self.existence_filter
+        if self._oldest_fingerprint is None or (
+            self._oldest_fingerprint > datetime.utcnow().replace(tzinfo=timezone.utc).timestamp()
+            - retention.window_seconds + retention.slice_seconds
+        ):
+            maybe = retention.contains_many(id_hashes)
+            self.stats['filter_negatives'] += int(len(id_hashes) - maybe.sum())
+            id_hashes = [h for h, present in zip(id_hashes, maybe) if present]
+        
+        # Try Redis first
+        if self.redis_client and id_hashes:
+            pipeline = self.redis_client.pipeline()
+            for id_hash in id_hashes:
+                pipeline.sismember('content:exact:hashes', id_hash)
+            found.update(h for h, exists in zip(id_hashes, pipeline.execute()) if exists)
         
         # Fallback to SQLite
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                'SELECT 1 FROM fingerprints WHERE id_hash = ? LIMIT 1',
-                (fingerprint.id_hash,)
-            )
-            return cursor.fetchone() is not None
-    
-    async def _check_semantic_similarity(
-        self, 
-        fingerprint: ContentFingerprint, 
-        content: Dict,
-        content_type: str
-    ) -> Tuple[bool, Optional[str]]:
-        """Check semantic similarity using embeddings"""
-        
-        # Get or create embedding
-        embedding = await self._get_embedding(
-            ContentFingerprint._extract_semantic_text(content, content_type)
-        )
-        
-        if embedding is None:
-            return False, None
-        
-        # Find similar embeddings in database
-        similar_hashes = await self._find_similar_embeddings(
-            embedding, 
-            threshold=0.85  # 85% similarity threshold
-        )
+        remaining = [h for h in id_hashes if h not in found]
+        with self.db.reader() as cursor:
+            for batch in self._sql_batches(remaining):
+                cursor.execute(
+                    f'SELECT id_hash FROM fingerprints WHERE id_hash IN ({",".join("?" * len(batch))})',
+                    batch
+                )
+                found.update(row[0] for row in cursor.fetchall())
         
-        if similar_hashes:
-            # Store similarity relationship
-            await self._store_similarity(
-                fingerprint.id_hash,
-                similar_hashes[0][0],  # Most similar
-                similar_hashes[0][1]   # Similarity score
-            )
-            
-            # Calculate storage savings
-            content_size = len(json.dumps(content, sort_keys=True))
-            self.stats['storage_saved_bytes'] += content_size
+        return found
+    
+    async def _find_near_duplicates(
+        self,
+        signatures: List[np.ndarray],
+        band_keys: List[List[int]],
+        threshold: float
+    ) -> List[Optional[Tuple[str, float]]]:
+        """Best stored near-duplicate per signature: LSH bucket candidates, then signature agreement"""
+        keys = list({key for item_keys in band_keys for key in item_keys})
+        if not keys:
+            return [None] * len(signatures)
+        
+        members: Dict[int, List[str]] = {}
+        stored: Dict[str, np.ndarray] = {}
+        with self.db.reader() as cursor:
+            for batch in self._sql_batches(keys):
+                cursor.execute(
+                    f'SELECT bucket, id_hash FROM lsh_buckets WHERE bucket IN ({",".join("?" * len(batch))})',
+                    batch
+                )
+                for bucket, id_hash in cursor.fetchall():
+                    members.setdefault(bucket, []).append(id_hash)
             
-            return True, f"semantic_similarity_{similar_hashes[0][1]:.2f}"
+            candidates = list({id_hash for ids in members.values() for id_hash in ids})
+            for batch in self._sql_batches(candidates):
+                cursor.execute(
+                    f'SELECT id_hash, signature FROM minhash_signatures WHERE id_hash IN ({",".join("?" * len(batch))})',
+                    batch
+                )
+                stored.update((id_hash, np.frombuffer(blob, dtype=np.uint32)) for id_hash, blob in cursor.fetchall())
+        
+        matches = []
+        for signature, item_keys in zip(signatures, band_keys):
+            best = None
+            for id_hash in {id_hash for key in item_keys for id_hash in members.get(key, ())}:
+                if id_hash not in stored:
+                    continue
+                score = MinHasher.similarity(signature, stored[id_hash])
+                if score >= threshold and (best is None or score > best[1]):
+                    best = (id_hash, score)
+            matches.append(best)
         
-        return False, None
+        return matches
     
-    async def _get_embedding(self, text: str) -> Optional[np.ndarray]:
-        """Get or create text embedding"""
-        if not text.strip():
-            return None
+    async def _find_recent_structures(self, structural_hashes: List[str], content_type: str) -> Set[str]:
+        """Structural hashes seen for this content type within the last 7 days"""
+        found = set()
+        cutoff = (datetime.utcnow() - timedelta(days=7)).isoformat()
         
-        # Check cache
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        if text_hash in self.embedding_cache:
-            return self.embedding_cache[text_hash]
+        with self.db.reader() as cursor:
+            for batch in self._sql_batches(list(set(structural_hashes))):
+                cursor.execute(
+                    f'''
+                    SELECT DISTINCT structural_hash FROM fingerprints
+                    WHERE structural_hash IN ({",".join("?" * len(batch))})
+                    AND content_type = ?
+                    AND timestamp > ?
+                    ''',
+                    (*batch, content_type, cutoff)
+                )
+                found.update(row[0] for row in cursor.fetchall())
         
+        return found
+    
+    @staticmethod
+    def _sql_batches(values: List, size: int = 512) -> List[List]:
+        """Split IN (...) parameters under SQLite's bound-variable limit
+        
+        Batches are padded to a power of two by repeating their last value
+        (harmless inside IN), so each query only ever has a handful of
+        placeholder counts and its prepared statements stay cached.
+        """
+        batches = []
+        for i in range(0, len(values), size):
+            batch = values[i:i + size]
+            batches.append(batch + batch[-1:] * ((1 << (len(batch) - 1).bit_length()) - len(batch)))
+        return batches
+    
+    async def _get_embeddings(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Get or create text embeddings, encoding every cache miss in one call"""
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        
+        # Check cache (keyed by model as well, since the disk tier outlives the process)
+        positions: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
+            text_hash = hashlib.md5(f"{self.EMBEDDING_MODEL}\0{text}".encode()).hexdigest()
+            positions.setdefault(text_hash, []).append(i)
+        
+        cached = self.embedding_cache.get_many(list(positions))
+        missing: Dict[str, List[int]] = {}
+        for text_hash, items in positions.items():
+            if text_hash in cached:
+                for i in items:
+                    embeddings[i] = cached[text_hash]
+            else:
+                missing[text_hash] = items
+
+        if not missing:
+            return embeddings
+
         # Lazy load model
         if self.embedding_model is None:
             try:
                 self.embedding_model = SentenceTransformer(
-                    'all-MiniLM-L6-v2',  # Lightweight model
+                    self.EMBEDDING_MODEL,
                     device='cpu'
                 )
             except Exception as e:
                 print(f"Failed to load embedding model: {e}")
-                return None
+                return embeddings
         
         try:
-            # Generate embedding
-            embedding = self.embedding_model.encode(text, convert_to_numpy=True)
-            
-            # Cache
-            self.embedding_cache[text_hash] = embedding
-            
-            # Limit cache size
-            if len(self.embedding_cache) > 1000:
-                # Remove oldest entry
-                oldest_key = next(iter(self.embedding_cache))
-                del self.embedding_cache[oldest_key]
-            
-            return embedding
-            
+            # Generate embeddings
+            encoded = self.embedding_model.encode(
+                [texts[positions[0]] for positions in missing.values()],
+                convert_to_numpy=True
+            )
         except Exception as e:
-            print(f"Failed to generate embedding: {e}")
-            return None
-    
-    async def _find_similar_embeddings(
-        self, 
-        embedding: np.ndarray, 
-        threshold: float = 0.85
-    ) -> List[Tuple[str, float]]:
-        """Find similar embeddings in database"""
-        
-        similar_hashes = []
+            print(f"Failed to generate embeddings: {e}")
+            return embeddings
         
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Get all embeddings (this could be optimized with vector database)
-            cursor.execute(
-                'SELECT id_hash, embeddings FROM fingerprints WHERE embeddings IS NOT NULL'
-            )
-            
-            for row in cursor.fetchall():
-                stored_hash, embeddings_blob = row
-                
-                try:
-                    stored_embedding = pickle.loads(embeddings_blob)
-                    
-                    # Calculate cosine similarity
-                    similarity = self._cosine_similarity(embedding, stored_embedding)
-                    
-                    if similarity >= threshold:
-                        similar_hashes.append((stored_hash, similarity))
-                        
-                        # Early exit if we find a very close match
-                        if similarity > 0.95:
-                            break
-                            
-                except Exception as e:
-                    continue
+        for (text_hash, items), embedding in zip(missing.items(), encoded):
+            for i in items:
+                embeddings[i] = embedding
         
-        # Sort by similarity
-        similar_hashes.sort(key=lambda x: x[1], reverse=True)
+        # Cache
+        self.embedding_cache.put_many(dict(zip(missing, encoded)))
         
-        return similar_hashes[:5]  # Return top 5 matches
+        return embeddings
     
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """Calculate cosine similarity between vectors"""
@@ -1549,120 +3808,118 @@ class SemanticDeduplicator:
         
         return dot_product / (norm_a * norm_b)
     
-    async def _check_structural_similarity(self, fingerprint: ContentFingerprint) -> bool:
-        """Check if similar structure exists"""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Look for same structural hash
-            cursor.execute(
-                '''
-                SELECT COUNT(*) FROM fingerprints 
-                WHERE structural_hash = ? 
-                AND content_type = ?
-                AND timestamp > ?
-                LIMIT 1
-                ''',
-                (
-                    fingerprint.structural_hash,
-                    fingerprint.metadata['content_type'],
-                    (datetime.utcnow() - timedelta(days=7)).isoformat()
-                )
-            )
-            
-            count = cursor.fetchone()[0]
-            return count > 0
-    
-    async def _store_fingerprint(
-        self, 
-        fingerprint: ContentFingerprint, 
-        content: Dict,
-        content_type: str
+    async def _store_fingerprints(
+        self,
+        fingerprints: List[ContentFingerprint],
+        embeddings: List[Optional[np.ndarray]],
+        content_type: str,
+        similarities: List[Tuple[str, str, float, str]],
+        minhashes: Optional[List[Tuple[Optional[np.ndarray], List[int]]]] = None
     ):
-        """Store fingerprint in database"""
+        """Store new fingerprints, their LSH buckets and similarity relationships in one transaction"""
+        rows = [
+            (
+                fingerprint.id_hash,
+                fingerprint.semantic_hash,
+                fingerprint.structural_hash,
+                content_type,
+                fingerprint.timestamp,
+                fingerprint.metadata.get('source'),
+                fingerprint.metadata.get('size_bytes'),
+                encode_embedding(embedding, self.embedding_dtype) if embedding is not None else None
+            )
+            for fingerprint, embedding in zip(fingerprints, embeddings)
+        ]
+        hashed = [(fp.id_hash, sig, keys) for fp, (sig, keys) in zip(fingerprints, minhashes or []) if sig is not None]
+
+        # Filter bits go in before the commit: a crash in between only costs a false positive
+        self._add_to_existence_filter([fp.id_hash for fp in fingerprints], [fp.timestamp for fp in fingerprints])
+        if fingerprints and self._oldest_fingerprint is None:
+            self._oldest_fingerprint = min(
+                datetime.fromisoformat(fp.timestamp).replace(tzinfo=timezone.utc).timestamp() for fp in fingerprints
+            )
         
-        # Generate embedding for future similarity checks
-        semantic_text = ContentFingerprint._extract_semantic_text(content, content_type)
-        embedding = await self._get_embedding(semantic_text)
+        # Union-find links for the new edges, committed with them
+        links = [
+            link for link in (
+                self.clusters.union(id_hash1, id_hash2)
+                for id_hash1, id_hash2, score, _ in similarities
+                if score > self.CLUSTER_THRESHOLD
+            )
+            if link
+        ]
         
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute(
+        def store(cursor: sqlite3.Cursor):
+            cursor.executemany(
                 '''
-                INSERT OR REPLACE INTO fingerprints 
+                INSERT OR REPLACE INTO fingerprints
                 (id_hash, semantic_hash, structural_hash, content_type, timestamp, source, size_bytes, embeddings)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 ''',
-                (
-                    fingerprint.id_hash,
-                    fingerprint.semantic_hash,
-                    fingerprint.structural_hash,
-                    content_type,
-                    fingerprint.timestamp,
-                    fingerprint.metadata.get('source'),
-                    fingerprint.metadata.get('size_bytes'),
-                    pickle.dumps(embedding) if embedding is not None else None
-                )
+                rows
             )
             
-            # Update Redis if available
-            if self.redis_client:
-                # Add to Redis set for quick lookups
-                self.redis_client.sadd('content:exact:hashes', fingerprint.id_hash)
-                
-                # Add to time-windowed sets
-                hour_key = f"content:hashes:hour:{datetime.utcnow().strftime('%Y-%m-%d-%H')}"
-                self.redis_client.sadd(hour_key, fingerprint.id_hash)
-                self.redis_client.expire(hour_key, 3600 * 2)  # Expire in 2 hours
-            
-            conn.commit()
-    
-    async def _store_similarity(
-        self, 
-        hash1: str, 
-        hash2: str, 
-        similarity: float
-    ):
-        """Store similarity relationship"""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute(
+            cursor.executemany(
                 '''
-                INSERT OR REPLACE INTO similarity_index 
+                INSERT OR REPLACE INTO similarity_index
                 (id_hash1, id_hash2, similarity_score, detection_method)
                 VALUES (?, ?, ?, ?)
                 ''',
-                (
-                    hash1,
-                    hash2,
-                    similarity,
-                    'semantic'
-                )
+                similarities
+            )
+
+            cursor.executemany(
+                'INSERT OR REPLACE INTO minhash_signatures (id_hash, signature) VALUES (?, ?)',
+                [(id_hash, sig.tobytes()) for id_hash, sig, _ in hashed]
+            )
+            cursor.executemany(
+                'INSERT OR IGNORE INTO lsh_buckets (bucket, id_hash) VALUES (?, ?)',
+                [(key, id_hash) for id_hash, _, keys in hashed for key in keys]
+            )
+            cursor.executemany(
+                'INSERT OR REPLACE INTO duplicate_clusters (id_hash, parent) VALUES (?, ?)',
+                links
             )
+        
+        # Committed on the writer thread while the event loop keeps serving lookups
+        await self.db.write(store)
+        
+        if not fingerprints:
+            return
+        
+        # Update Redis if available
+        if self.redis_client:
+            id_hashes = [fingerprint.id_hash for fingerprint in fingerprints]
+            hour_key = f"content:hashes:hour:{datetime.utcnow().strftime('%Y-%m-%d-%H')}"
             
-            conn.commit()
+            pipeline = self.redis_client.pipeline()
+            pipeline.sadd('content:exact:hashes', *id_hashes)
+            pipeline.sadd(hour_key, *id_hashes)
+            pipeline.expire(hour_key, 3600 * 2)  # Expire in 2 hours
+            pipeline.execute()
+        
+        # Index only once rows are committed, so a rebuild sees the same set
+        indexed = [(fp.id_hash, e) for fp, e in zip(fingerprints, embeddings) if e is not None]
+        if indexed:
+            self.vector_index.add([id_hash for id_hash, _ in indexed], np.stack([e for _, e in indexed]))
     
-    async def cleanup_old_fingerprints(self, days_to_keep: int = 90):
+    async def cleanup_old_fingerprints(self, days_to_keep: int = RETENTION_DAYS):
         """Clean up old fingerprints to manage database size"""
         cutoff_date = (datetime.utcnow() - timedelta(days=days_to_keep)).isoformat()
-        
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            
+
+        def delete_old(cursor: sqlite3.Cursor) -> int:
             # Count records to be deleted
             cursor.execute(
                 'SELECT COUNT(*) FROM fingerprints WHERE timestamp < ?',
                 (cutoff_date,)
             )
             count_to_delete = cursor.fetchone()[0]
-            
+
             if count_to_delete > 0:
                 # Delete old fingerprints
                 cursor.execute(
                     'DELETE FROM fingerprints WHERE timestamp < ?',
-                    (cutup_date,)
+                    (cutoff_date,)
                 )
                 
                 # Delete related similarity records
@@ -1671,23 +3928,35 @@ class SemanticDeduplicator:
                     WHERE id_hash1 NOT IN (SELECT id_hash FROM fingerprints)
                     OR id_hash2 NOT IN (SELECT id_hash FROM fingerprints)
                 ''')
-                
-                conn.commit()
-                
-                print(f"Cleaned up {count_to_delete} old fingerprints")
-                
-                # Vacuum database
-                cursor.execute('VACUUM')
-                
-                return count_to_delete
+                cursor.execute('''
+                    DELETE FROM minhash_signatures
+                    WHERE id_hash NOT IN (SELECT id_hash FROM fingerprints)
+                ''')
+                cursor.execute('''
+                    DELETE FROM lsh_buckets
+                    WHERE id_hash NOT IN (SELECT id_hash FROM fingerprints)
+                ''')
+
+            return count_to_delete
         
-        return 0
+        count_to_delete = await self.db.write(delete_old)
+        if count_to_delete > 0:
+            print(f"Cleaned up {count_to_delete} old fingerprints")
+            
+            # Vacuum database (outside the delete transaction)
+            await self.db.write(lambda cursor: cursor.execute('VACUUM'))
+            
+            # Deleted embeddings and edges must leave the vector index and clusters too
+            # (the existence filter keeps the deleted hashes until their slices expire)
+            self.rebuild_vector_index()
+            self.rebuild_duplicate_clusters()
+            self._refresh_oldest_fingerprint()
+        
+        return count_to_delete
     
     def get_statistics(self) -> Dict:
         """Get deduplication statistics"""
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            
+        with self.db.reader() as cursor:
             # Get database statistics
             cursor.execute('SELECT COUNT(*) FROM fingerprints')
             total_fingerprints = cursor.fetchone()[0]
@@ -1705,6 +3974,8 @@ class SemanticDeduplicator:
             'content_types': content_types,
             'estimated_saved_mb': stats['storage_saved_bytes'] / (1024 * 1024),
             'database_size_mb': total_size / (1024 * 1024),
+            'indexed_vectors': len(self.vector_index),
+            'embedding_cache': self.embedding_cache.stats(),
             'duplication_rate': (
                 stats['duplicates_found'] / stats['total_checked'] 
                 if stats['total_checked'] > 0 else 0
@@ -1714,41 +3985,12 @@ class SemanticDeduplicator:
         return stats
     
     def find_duplicate_clusters(self, min_cluster_size: int = 3) -> List[List[str]]:
-        """Find clusters of duplicate content"""
-        clusters = []
-        
-        with self._get_db_connection() as conn:
-            cursor = conn.cursor()
-            
-            # Find similar content groups using similarity_index
-            cursor.execute('''
-                WITH RECURSIVE clusters AS (
-                    -- Start with each fingerprint
-                    SELECT id_hash1 as root_hash, id_hash1 as member_hash, 1 as depth
-                    FROM similarity_index
-                    
-                    UNION
-                    
-                    -- Recursively find all connected fingerprints
-                    SELECT c.root_hash, si.id_hash2, c.depth + 1
-                    FROM clusters c
-                    JOIN similarity_index si ON c.member_hash = si.id_hash1
-                    WHERE c.depth < 10  -- Limit recursion depth
-                    AND si.similarity_score > 0.9
-                )
-                SELECT root_hash, GROUP_CONCAT(DISTINCT member_hash) as cluster_members
-                FROM clusters
-                GROUP BY root_hash
-                HAVING COUNT(DISTINCT member_hash) >= ?
-                ORDER BY COUNT(DISTINCT member_hash) DESC
-            ''', (min_cluster_size,))
-            
-            for row in cursor.fetchall():
-                root_hash, members_str = row
-                members = members_str.split(',')
-                clusters.append(members)
-        
-        return clusters
+        """Find clusters of duplicate content, largest first"""
+        return self.clusters.clusters(min_cluster_size)
+    
+    def get_duplicate_cluster(self, id_hash: str) -> List[str]:
+        """Every fingerprint transitively similar to id_hash (including itself)"""
+        return self.clusters.cluster(id_hash)
 
 # Usage example:
 async def process_content_with_deduplication():
@@ -1810,7 +4052,8 @@ class EchoV2:
         self._setup_logging()
         
         # Initialize components
-        self.ledger = ImmutableLedger()
+        # Lazy loading keeps worker restarts independent of ledger history
+        self.ledger = ImmutableLedger(lazy=self.config.get('ledger', {}).get('lazy', True))
         self.deduplicator = SemanticDeduplicator()
         self.metrics = MetricsCollector()
         self.compressor = CompressionEngine()
@@ -1952,13 +4195,11 @@ class EchoV2:
                 deduplicated[source] = items
                 continue
             
+            # One batched check per source instead of one round trip per item
+            checks = await self.deduplicator.is_duplicate_many(items, source)
+            
             deduplicated_items = []
-            for item in items:
-                is_duplicate, reason = await self.deduplicator.is_duplicate(
-                    item, 
-                    source
-                )
-                
+            for item, (is_duplicate, reason) in zip(items, checks):
                 if not is_duplicate:
                     deduplicated_items.append(item)
                 else:
@@ -2327,6 +4568,10 @@ class EchoV2:
         import time
         time.sleep(5)
         
+        # Stop the ledger's verification workers; flush and close the deduplicator's stores
+        self.ledger.close()
+        self.deduplicator.close()
+        
         self.logger.info("graceful_shutdown_completed")
         sys.exit(0)
     
@@ -2507,6 +4752,273 @@ secrets:
 - Storage: 100GB+ (with compression)
 - Network: 100Mbps+ (for API calls)
 
+### **Ledger Verification Throughput:**
+
+`verify_chain` ships chain.dat byte ranges to a process pool sized to the core count (`backend="thread"` and `"serial"` remain available). Measure entries/sec against worker count with:
+
+```python
+# benchmarks/ledger_verify_benchmark.py
+"""Entries/sec for ImmutableLedger.verify_chain versus worker count"""
+import os
+import sys
+import tempfile
+
+from vault.immutable_ledger import ImmutableLedger
+
+def run(entries: int = 20000, chunk_size: int = 2000):
+    with tempfile.TemporaryDirectory() as ledger_path:
+        ledger = ImmutableLedger(ledger_path)
+        for n in range(entries):
+            ledger.append({'sequence': n, 'payload': 'x' * 256}, harvester_id='benchmark')
+        
+        print(f"{'backend':<8} {'workers':>7} {'entries/s':>12} {'seconds':>8}")
+        
+        # Phase 2 baseline: 4 threads over 250-entry chunks
+        runs = [('thread', 4, 250)]
+        runs += [('process', workers, chunk_size)
+                 for workers in sorted({1, 2, 4, 8, os.cpu_count() or 1})]
+        
+        for backend, workers, size in runs:
+            result = ledger.verify_chain(workers=workers, backend=backend, chunk_size=size)
+            assert result['verified'], result['errors'][:3]
+            print(f"{backend:<8} {workers:>7} {result['entries_per_sec']:>12,.0f} "
+                  f"{result['performance_ms'] / 1000:>8.2f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
+```
+
+### **Deduplication Vector Index:**
+
+Recall@k and per-query latency of the ANN index against the pre-index brute-force scan (unpickling every stored embedding from SQLite):
+
+```python
+# benchmarks/dedup_ann_benchmark.py
+"""Recall/latency of the dedup vector index versus the SQLite brute-force scan"""
+import os
+import sys
+import time
+import pickle
+import sqlite3
+import tempfile
+import numpy as np
+
+from intelligence.vector_index import FlatIndex, IVFIndex
+
+def clustered_embeddings(count: int, dim: int, rng) -> np.ndarray:
+    """Synthetic embeddings with topic structure, like reposted/reworded content"""
+    topics = rng.normal(size=(max(count // 50, 1), dim))
+    labels = rng.integers(len(topics), size=count)
+    return (topics[labels] + 0.5 * rng.normal(size=(count, dim))).astype(np.float32)
+
+def brute_force_scan(conn, query: np.ndarray, k: int):
+    """The original _find_similar_embeddings loop"""
+    scores = []
+    for stored_hash, blob in conn.execute('SELECT id_hash, embeddings FROM fingerprints'):
+        stored = pickle.loads(blob)
+        scores.append((stored_hash, float(np.dot(query, stored) / (np.linalg.norm(query) * np.linalg.norm(stored)))))
+    scores.sort(key=lambda x: x[1], reverse=True)
+    return scores[:k]
+
+def timed_search(index, queries, k):
+    latencies, results = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append({stored_hash for stored_hash, _ in index.search(query, k=k)})
+        latencies.append((time.perf_counter() - start) * 1000)
+    return results, latencies
+
+def run(count: int = 100000, dim: int = 384, queries: int = 200, k: int = 5):
+    rng = np.random.default_rng(0)
+    embeddings = clustered_embeddings(count, dim, rng)
+    ids = [f"{n:064x}" for n in range(count)]
+    probes = embeddings[rng.choice(count, queries, replace=False)] + 0.1 * rng.normal(size=(queries, dim)).astype(np.float32)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, 'deduplication.db'))
+        conn.execute('CREATE TABLE fingerprints (id_hash TEXT PRIMARY KEY, embeddings BLOB)')
+        conn.executemany('INSERT INTO fingerprints VALUES (?, ?)',
+                         ((i, pickle.dumps(e)) for i, e in zip(ids, embeddings)))
+        conn.commit()
+        
+        flat = FlatIndex(os.path.join(tmp, 'flat'))
+        flat.add(ids, embeddings)
+        truth, flat_ms = timed_search(flat, probes, k)
+        
+        # The scan is slow enough that a handful of queries gives its latency
+        scan_ms = []
+        for query in probes[:10]:
+            start = time.perf_counter()
+            brute_force_scan(conn, query, k)
+            scan_ms.append((time.perf_counter() - start) * 1000)
+        
+        print(f"{'method':<22} {'recall@' + str(k):>9} {'p50 ms':>8} {'p95 ms':>8}")
+        print(f"{'sqlite scan':<22} {1.0:>9.3f} {np.percentile(scan_ms, 50):>8.2f} {np.percentile(scan_ms, 95):>8.2f}")
+        print(f"{'flat matrix':<22} {1.0:>9.3f} {np.percentile(flat_ms, 50):>8.2f} {np.percentile(flat_ms, 95):>8.2f}")
+        
+        ivf = IVFIndex(os.path.join(tmp, 'ivf'), nlist=int(4 * np.sqrt(count)))
+        ivf.add(ids, embeddings)
+        for nprobe in (1, 4, 8, 16, 32):
+            ivf.nprobe = nprobe
+            found, ivf_ms = timed_search(ivf, probes, k)
+            recall = np.mean([len(f & t) / len(t) for f, t in zip(found, truth)])
+            print(f"{'ivf nprobe=' + str(nprobe):<22} {recall:>9.3f} "
+                  f"{np.percentile(ivf_ms, 50):>8.2f} {np.percentile(ivf_ms, 95):>8.2f}")
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
+```
+
+### **Near-Duplicate (MinHash-LSH) Stage:**
+
+Hit rate of the near-duplicate stage on a synthetic repost corpus, and the embedding model calls it saves:
+
+```python
+# benchmarks/dedup_repost_benchmark.py
+"""Near-duplicate stage hit rate and model invocations saved on reposted content"""
+import os
+import sys
+import time
+import random
+import asyncio
+import tempfile
+
+from intelligence.deduplicator import ContentFingerprint, SemanticDeduplicator
+from intelligence.minhash import MinHasher
+
+def make_post(rng: random.Random, vocab, number: int, words: int = 60) -> dict:
+    return {
+        'title': ' '.join(rng.choice(vocab) for _ in range(8)),
+        'selftext': ' '.join(rng.choice(vocab) for _ in range(words)),
+        'source': 'reddit',
+        # A distinct structure per post, so the structural stage does not swallow originals
+        f"flair_{number}": True
+    }
+
+def repost(rng: random.Random, post: dict, vocab) -> dict:
+    """Reworded repost: a few substituted words, a tag and sometimes a cut-off ending"""
+    words = post['selftext'].split()
+    for i in rng.sample(range(len(words)), 3):
+        words[i] = rng.choice(vocab)
+    if rng.random() < 0.3:
+        words = words[:int(len(words) * 0.9)]
+    return {
+        **post,
+        'title': rng.choice(['[repost] ', 'x-post: ', '']) + post['title'],
+        'selftext': ' '.join(words),
+        'reposted_by': rng.randrange(10**6)
+    }
+
+async def run(originals: int = 5000, reposts_per_post: int = 2, batch_size: int = 500):
+    rng = random.Random(0)
+    vocab = [f"word{i}" for i in range(20000)]
+    posts = [make_post(rng, vocab, number) for number in range(originals)]
+    
+    # Originals first, then their reposts shuffled into later harvest cycles
+    corpus = [(post, False) for post in posts]
+    reposts = [(repost(rng, post, vocab), True) for post in posts for _ in range(reposts_per_post)]
+    rng.shuffle(reposts)
+    corpus += reposts
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        dedup = SemanticDeduplicator(os.path.join(tmp, 'deduplication.db'))
+        
+        # Count texts that reach the embedding model
+        encoded = 0
+        get_embeddings = dedup._get_embeddings
+        async def counting_get_embeddings(texts):
+            nonlocal encoded
+            encoded += len(texts)
+            return await get_embeddings(texts)
+        dedup._get_embeddings = counting_get_embeddings
+        
+        start = time.perf_counter()
+        reasons = []
+        for i in range(0, len(corpus), batch_size):
+            batch = [content for content, _ in corpus[i:i + batch_size]]
+            reasons += [reason for _, reason in await dedup.is_duplicate_many(batch, 'reddit')]
+        elapsed = time.perf_counter() - start
+    
+    near = [bool(reason and reason.startswith('near_duplicate')) for reason in reasons]
+    repost_hits = sum(hit for hit, (_, is_repost) in zip(near, corpus) if is_repost)
+    false_hits = sum(hit for hit, (_, is_repost) in zip(near, corpus) if not is_repost)
+    
+    hasher = MinHasher()
+    text = ContentFingerprint._extract_semantic_text(corpus[0][0], 'reddit')
+    lsh_start = time.perf_counter()
+    for _ in range(1000):
+        hasher.band_keys(hasher.signature(text))
+    lsh_us = (time.perf_counter() - lsh_start) * 1000
+    
+    print(f"items checked:            {len(corpus)}")
+    print(f"repost hit rate:          {repost_hits / len(reposts):.3f}")
+    print(f"false near-dup rate:      {false_hits / originals:.4f}")
+    print(f"model calls without LSH:  {len(corpus)}")
+    print(f"model calls with LSH:     {encoded} ({1 - encoded / len(corpus):.1%} saved)")
+    print(f"signature + buckets:      {lsh_us:.1f} us/item")
+    print(f"end-to-end throughput:    {len(corpus) / elapsed:.0f} items/sec")
+
+if __name__ == "__main__":
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
+```
+
+### **Existence Filter Retention:**
+
+The rolling filter only answers exact-match lookups while every stored fingerprint is inside its window, so it has to stay in use at the default cleanup retention:
+
+```python
+# tests/test_dedup_retention.py
+"""The existence filter keeps screening exact matches at the default retention"""
+import asyncio
+from datetime import datetime, timedelta
+
+from intelligence.deduplicator import SemanticDeduplicator
+
+WINDOW_DAYS = SemanticDeduplicator.EXISTENCE_WINDOW[0] / 86400
+
+async def store_aged(dedup: SemanticDeduplicator, ages_days) -> list:
+    """Store bare fingerprints aged by ages_days and refill the filter from them"""
+    now = datetime.utcnow()
+    rows = [(f"stored{n}", 'semantic', 'structural', 'text', (now - timedelta(days=age)).isoformat())
+            for n, age in enumerate(ages_days)]
+    await dedup.db.write(lambda cursor: cursor.executemany(
+        'INSERT INTO fingerprints (id_hash, semantic_hash, structural_hash, content_type, timestamp) '
+        'VALUES (?, ?, ?, ?, ?)', rows))
+    dedup.rebuild_existence_filter()
+    return [row[0] for row in rows]
+
+async def filter_negatives(dedup: SemanticDeduplicator, count: int = 100) -> int:
+    """Lookups of unseen hashes that the filter answered without SQLite/Redis"""
+    before = dedup.stats['filter_negatives']
+    assert await dedup._find_exact_matches([f"unseen{n}" for n in range(count)]) == set()
+    return dedup.stats['filter_negatives'] - before
+
+def test_filter_used_at_default_retention(tmp_path):
+    async def scenario():
+        dedup = SemanticDeduplicator(str(tmp_path / 'deduplication.db'))
+        
+        # Oldest fingerprint just past the retention cutoff, before and after cleanup
+        await store_aged(dedup, [0, 30, SemanticDeduplicator.RETENTION_DAYS + 0.5])
+        assert await filter_negatives(dedup) == 100
+        assert await dedup.cleanup_old_fingerprints() == 1
+        assert await filter_negatives(dedup) == 100
+        dedup.close()
+    
+    asyncio.run(scenario())
+
+def test_fingerprints_aged_past_window_still_found(tmp_path):
+    async def scenario():
+        dedup = SemanticDeduplicator(str(tmp_path / 'deduplication.db'))
+        
+        # Without cleanup, data ages into the oldest slice and then out of the window
+        recent, expiring, expired = await store_aged(dedup, [0, WINDOW_DAYS - 0.5, WINDOW_DAYS + 5])
+        assert await filter_negatives(dedup) == 0
+        assert await dedup._find_exact_matches([recent, expiring, expired]) == {recent, expiring, expired}
+        dedup.close()
+    
+    asyncio.run(scenario())
+```
+
 ---
 
 ## **SECURITY IMPROVEMENTS**